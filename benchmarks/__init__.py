@@ -0,0 +1,7 @@
+"""
+********************************************************************************
+* Name: Benchmarks
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
@@ -0,0 +1,83 @@
+"""
+********************************************************************************
+* Name: Project File Benchmark
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+
+Compare the per-run overhead of the database project file with the lite
+(database-free) project file for the read, edit and write cycle that
+GSSHAFramework performs for every run.
+
+Usage::
+
+    python benchmarks/bench_project_file.py [project directory] [project file] [repeat]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lite import ProjectFile as LiteProjectFile
+from gsshapy.orm import ProjectFile
+
+here = os.path.abspath(os.path.dirname(__file__))
+
+
+def _editCards(project_manager):
+    """
+    The card edits made by the framework before each run
+    """
+    project_manager.setCard('TOT_TIME', '1440')
+    project_manager.setCard('PRECIP_FILE', 'run.gag', add_quotes=True)
+    project_manager.setCard('PROJECT_PATH', '', add_quotes=True)
+
+
+def run_orm(directory, filename, out_directory):
+    sqlalchemy_url, sql_engine = dbt.init_sqlite_memory()
+    db_session = dbt.create_session(sqlalchemy_url, sql_engine)
+
+    project_manager = ProjectFile()
+    project_manager.read(directory=directory,
+                         filename=filename,
+                         session=db_session)
+    _editCards(project_manager)
+    project_manager.deleteCard('SUMMARY', db_session)
+    project_manager.write(session=db_session,
+                          directory=out_directory,
+                          name=project_manager.name)
+    db_session.close()
+
+
+def run_lite(directory, filename, out_directory):
+    project_manager = LiteProjectFile()
+    project_manager.read(directory=directory,
+                         filename=filename)
+    _editCards(project_manager)
+    project_manager.deleteCard('SUMMARY')
+    project_manager.write(session=None,
+                          directory=out_directory,
+                          name=project_manager.name)
+
+
+def main(directory, filename, repeat):
+    out_directory = tempfile.mkdtemp()
+
+    try:
+        for label, func in (('orm', run_orm), ('lite', run_lite)):
+            timer = timeit.Timer(lambda: func(directory, filename, out_directory))
+            best = min(timer.repeat(repeat=5, number=repeat)) / repeat
+            print('{0:>5}: {1:.3f} ms per run'.format(label, best * 1000.0))
+    finally:
+        shutil.rmtree(out_directory)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    directory = args[0] if len(args) > 0 else os.path.join(here, '..', 'tests', 'standard')
+    filename = args[1] if len(args) > 1 else 'standard.prj'
+    repeat = int(args[2]) if len(args) > 2 else 20
+
+    main(directory, filename, repeat)
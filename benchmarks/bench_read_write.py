@@ -0,0 +1,150 @@
+"""
+********************************************************************************
+* Name: Read/Write Benchmarks
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+
+Benchmarks read and write of the ORM file classes on synthetic projects of
+increasing size. Requires pytest-benchmark::
+
+    py.test benchmarks/bench_read_write.py --benchmark-only
+
+Select sizes with the GSSHAPY_BENCHMARK_SIZES environment variable
+(comma separated, default "small,medium"). Compare runs with
+--benchmark-save and --benchmark-compare to track the scaling curves.
+"""
+import os
+
+import pytest
+
+from gsshapy.lib import db_tools as dbt
+from gsshapy.orm import (ChannelInputFile, ElevationGridFile, GenericFile, GridPipeFile, GridStreamFile, HmetFile,
+                         IndexMap, LinkNodeDatasetFile, MapTableFile, NwsrfsFile, OrographicGageFile,
+                         OutputLocationFile, PrecipFile, ProjectFile, ProjectionFile, RasterMapFile,
+                         ReplaceParamFile, ReplaceValFile, StormPipeNetworkFile, TimeSeriesFile, WMSDatasetFile)
+from gsshapy.orm.file_io import ProjectFileEventManager
+
+from .synthetic import generate_project
+
+SIZES = {'small': dict(num_links=10, nodes_per_link=5, num_gages=5, num_periods=24,
+                       num_time_steps=24, rows=50, columns=50, num_ids=10),
+         'medium': dict(num_links=100, nodes_per_link=10, num_gages=25, num_periods=288,
+                        num_time_steps=96, rows=200, columns=200, num_ids=100),
+         'large': dict(num_links=1000, nodes_per_link=20, num_gages=100, num_periods=2880,
+                       num_time_steps=288, rows=500, columns=500, num_ids=1000)}
+
+SELECTED_SIZES = [size.strip() for size in
+                  os.environ.get('GSSHAPY_BENCHMARK_SIZES', 'small,medium').split(',') if size.strip()]
+
+# Extension, file class, extra read arguments, extra write arguments
+FILE_CASES = [('prj', ProjectFile, {}, {}),
+              ('cif', ChannelInputFile, {}, {}),
+              ('gag', PrecipFile, {}, {}),
+              ('lnd', LinkNodeDatasetFile, {}, {}),
+              ('otl', TimeSeriesFile, {}, {}),
+              ('msk', RasterMapFile, {}, {}),
+              ('cmt', MapTableFile, {'readIndexMaps': False}, {'writeIndexMaps': False}),
+              ('gst', GridStreamFile, {}, {}),
+              ('gpi', GridPipeFile, {}, {}),
+              ('spn', StormPipeNetworkFile, {}, {}),
+              ('ele', ElevationGridFile, {}, {}),
+              ('idx', IndexMap, {}, {}),
+              ('hmt', HmetFile, {}, {}),
+              ('rep', ReplaceParamFile, {}, {}),
+              ('rpv', ReplaceValFile, {}, {}),
+              ('pro', ProjectionFile, {}, {}),
+              ('snw', NwsrfsFile, {}, {}),
+              ('oro', OrographicGageFile, {}, {}),
+              ('ohl', TimeSeriesFile, {}, {}),
+              ('ihl', OutputLocationFile, {}, {}),
+              ('yml', ProjectFileEventManager, {}, {}),
+              ('gen', GenericFile, {}, {})]
+
+
+@pytest.fixture(scope='module', params=SELECTED_SIZES)
+def project(request, tmpdir_factory):
+    size = request.param
+    directory = str(tmpdir_factory.mktemp(size))
+    filenames = generate_project(directory, **SIZES[size])
+    return size, directory, filenames
+
+
+def _session():
+    sqlalchemy_url, engine = dbt.init_sqlite_memory()
+    return dbt.create_session(sqlalchemy_url, engine)
+
+
+def _read(fileIO, directory, filename, session, **kwargs):
+    instance = fileIO()
+    instance.read(directory=directory, filename=filename, session=session, **kwargs)
+    return instance
+
+
+def _readMask(directory, filenames, session):
+    return _read(RasterMapFile, directory, filenames['msk'], session)
+
+
+@pytest.mark.parametrize('extension, fileIO, readKwargs, writeKwargs', FILE_CASES,
+                         ids=[case[0] for case in FILE_CASES])
+def test_read(benchmark, project, extension, fileIO, readKwargs, writeKwargs):
+    size, directory, filenames = project
+    benchmark.group = 'read-{0}'.format(extension)
+    benchmark.extra_info.update(SIZES[size])
+
+    benchmark.pedantic(_read,
+                       setup=lambda: ((fileIO, directory, filenames[extension], _session()), readKwargs),
+                       rounds=3)
+
+
+@pytest.mark.parametrize('extension, fileIO, readKwargs, writeKwargs', FILE_CASES,
+                         ids=[case[0] for case in FILE_CASES])
+def test_write(benchmark, project, tmpdir, extension, fileIO, readKwargs, writeKwargs):
+    size, directory, filenames = project
+    benchmark.group = 'write-{0}'.format(extension)
+    benchmark.extra_info.update(SIZES[size])
+
+    session = _session()
+    instance = _read(fileIO, directory, filenames[extension], session, **readKwargs)
+
+    benchmark(instance.write, session=session, directory=str(tmpdir), name=filenames[extension], **writeKwargs)
+
+
+def test_read_wms_dataset(benchmark, project):
+    size, directory, filenames = project
+    benchmark.group = 'read-dep'
+    benchmark.extra_info.update(SIZES[size])
+
+    def setup():
+        session = _session()
+        return (WMSDatasetFile, directory, filenames['dep'], session), \
+               {'maskMap': _readMask(directory, filenames, session)}
+
+    benchmark.pedantic(_read, setup=setup, rounds=3)
+
+
+def test_write_wms_dataset(benchmark, project, tmpdir):
+    size, directory, filenames = project
+    benchmark.group = 'write-dep'
+    benchmark.extra_info.update(SIZES[size])
+
+    session = _session()
+    maskMap = _readMask(directory, filenames, session)
+    instance = _read(WMSDatasetFile, directory, filenames['dep'], session, maskMap=maskMap)
+
+    benchmark(instance.write, session=session, directory=str(tmpdir), name=filenames['dep'], maskMap=maskMap)
+
+
+def test_read_project(benchmark, project):
+    size, directory, filenames = project
+    benchmark.group = 'read-project'
+    benchmark.extra_info.update(SIZES[size])
+
+    def readProject(session):
+        projectFile = ProjectFile()
+        projectFile.readProject(directory=directory,
+                                projectFileName=filenames['prj'],
+                                session=session,
+                                spatialReferenceID=4236)
+
+    benchmark.pedantic(readProject, setup=lambda: ((_session(),), {}), rounds=3)
@@ -0,0 +1,72 @@
+"""
+********************************************************************************
+* Name: Tokenizer Benchmark
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+
+Compare parsetools.splitLine with shlex.split on every line of the
+standard test files and on the lines of a synthetic precipitation file.
+
+Usage::
+
+    python benchmarks/bench_tokenizer.py [repeat]
+"""
+import os
+import shlex
+import shutil
+import sys
+import tempfile
+import timeit
+
+from gsshapy.lib import parsetools as pt
+
+try:
+    from benchmarks import synthetic
+except ImportError:
+    import synthetic
+
+here = os.path.abspath(os.path.dirname(__file__))
+standard = os.path.join(here, '..', 'tests', 'standard')
+
+
+def _read_lines(directory):
+    lines = []
+
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                lines.extend(f.readlines())
+
+    return lines
+
+
+def _split_all(split, lines):
+    for line in lines:
+        split(line)
+
+
+def main(repeat=5):
+    temp_directory = tempfile.mkdtemp()
+
+    try:
+        filenames = synthetic.generate_project(temp_directory, num_gages=20, num_periods=2000)
+
+        with open(os.path.join(temp_directory, filenames['gag']), 'r') as f:
+            corpora = (('standard', _read_lines(standard)),
+                       ('synthetic gag', f.readlines()))
+    finally:
+        shutil.rmtree(temp_directory)
+
+    for name, lines in corpora:
+        print('{0} ({1} lines)'.format(name, len(lines)))
+
+        for label, split in (('shlex.split', shlex.split), ('splitLine', pt.splitLine)):
+            seconds = min(timeit.repeat(lambda: _split_all(split, lines), number=1, repeat=repeat))
+            print('  {0:<12} {1:.4f} s'.format(label, seconds))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,520 @@
+"""
+********************************************************************************
+* Name: Synthetic Project Generator
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+
+Deterministic generator for GSSHA projects of configurable size. The same
+arguments and seed always produce byte-identical files.
+"""
+from datetime import datetime, timedelta
+import os
+import random
+
+__all__ = ['write_channel_input_file',
+           'write_precip_file',
+           'write_link_node_dataset_file',
+           'write_time_series_file',
+           'write_mask_map',
+           'write_index_map',
+           'write_wms_dataset_file',
+           'write_mapping_table_file',
+           'write_grid_stream_file',
+           'write_grid_pipe_file',
+           'write_storm_pipe_network_file',
+           'write_elevation_grid',
+           'write_hmet_file',
+           'write_replace_param_file',
+           'write_replace_val_file',
+           'write_projection_file',
+           'write_nwsrfs_file',
+           'write_orographic_gage_file',
+           'write_output_location_file',
+           'write_event_file',
+           'write_generic_file',
+           'generate_project']
+
+
+def _downstream_link(link_number, num_links):
+    """
+    Downstream link of a binary tree network with the outlet at the highest link number
+    """
+    reverse = num_links - link_number
+
+    if reverse == 0:
+        return 0
+
+    return num_links - (reverse - 1) // 2
+
+
+def write_channel_input_file(path, num_links, nodes_per_link=5, seed=0):
+    """
+    Channel input file (.cif) with a binary tree of trapezoidal links.
+    """
+    rng = random.Random(seed)
+    upstream = dict((link, []) for link in range(1, num_links + 1))
+
+    for link in range(1, num_links + 1):
+        downstream = _downstream_link(link, num_links)
+        if downstream:
+            upstream[downstream].append(link)
+
+    with open(path, 'w') as f:
+        f.write('GSSHA_CHAN\n')
+        f.write('ALPHA       1.000000\n')
+        f.write('BETA        1.000000\n')
+        f.write('THETA       1.000000\n')
+        f.write('LINKS       {0}\n'.format(num_links))
+        f.write('MAXNODES    {0}\n'.format(nodes_per_link))
+
+        for link in range(1, num_links + 1):
+            f.write('CONNECT{0:>5}{1:>5}{2:>5}{3}\n'.format(
+                link, _downstream_link(link, num_links), len(upstream[link]),
+                ''.join('{0:>5}'.format(up) for up in upstream[link])))
+        f.write('\n')
+
+        elevation = 100.0 + num_links * nodes_per_link * 0.1
+
+        for link in range(1, num_links + 1):
+            f.write('LINK           {0}\n'.format(link))
+            f.write('DX             {0:.6f}\n'.format(rng.uniform(50.0, 150.0)))
+            f.write('TRAPEZOID\n')
+            f.write('NODES          {0}\n'.format(nodes_per_link))
+
+            x = rng.uniform(0.0, 10000.0)
+            y = rng.uniform(0.0, 10000.0)
+
+            for node in range(1, nodes_per_link + 1):
+                elevation -= rng.uniform(0.01, 0.1)
+                f.write('NODE {0}\n'.format(node))
+                f.write('X_Y  {0:.6f} {1:.6f}\n'.format(x + node * 90.0, y - node * 60.0))
+                f.write('ELEV {0:.6f}\n'.format(elevation))
+
+                if node == 1:
+                    f.write('XSEC\n')
+                    f.write('MANNINGS_N     {0:.6f}\n'.format(rng.uniform(0.02, 0.05)))
+                    f.write('BOTTOM_WIDTH   {0:.6f}\n'.format(rng.uniform(1.0, 10.0)))
+                    f.write('BANKFULL_DEPTH {0:.6f}\n'.format(rng.uniform(1.0, 3.0)))
+                    f.write('SIDE_SLOPE     {0:.6f}\n'.format(rng.uniform(0.5, 3.0)))
+            f.write('\n')
+
+
+def write_precip_file(path, num_gages, num_periods, num_events=1, seed=0):
+    """
+    Precipitation file (.gag) with GAGES values for every gage and period.
+    """
+    rng = random.Random(seed)
+    start = datetime(2017, 1, 1)
+
+    with open(path, 'w') as f:
+        for event in range(num_events):
+            f.write('EVENT "Synthetic event {0}"\n'.format(event + 1))
+            f.write('NRGAG {0}\n'.format(num_gages))
+            f.write('NRPDS {0}\n'.format(num_periods))
+
+            for gage in range(num_gages):
+                f.write('COORD {0:.1f} {1:.1f} "gage {2}"\n'.format(rng.uniform(200000.0, 210000.0),
+                                                                   rng.uniform(4750000.0, 4760000.0),
+                                                                   gage + 1))
+
+            for period in range(num_periods):
+                time = start + timedelta(days=event, minutes=15 * period)
+                values = ''.join(' {0:.3f}'.format(rng.uniform(0.0, 25.0)) for _ in range(num_gages))
+                f.write('GAGES {0:%Y %m %d %H %M}{1}\n'.format(time, values))
+
+
+def write_link_node_dataset_file(path, num_links, nodes_per_link, num_time_steps, seed=0):
+    """
+    Link node dataset file (.lnd) with a value for every node at every time step.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        f.write('Synthetic link node dataset\n')
+        f.write('NUM_LINKS     {0}\n'.format(num_links))
+        f.write('TIME_STEP     60\n')
+        f.write('NUM_TS        {0}\n'.format(num_time_steps))
+        f.write('START_TIME    2017  1    1  0  0  0\n')
+
+        for timeStep in range(1, num_time_steps + 1):
+            f.write('TS    {0}\n'.format(timeStep))
+
+            for _ in range(num_links):
+                f.write('{0}   '.format(nodes_per_link))
+                for _ in range(nodes_per_link):
+                    f.write('0  {0:.5f}   '.format(rng.uniform(0.0, 5.0)))
+                f.write('\n')
+            f.write('\n')
+
+
+def write_time_series_file(path, num_time_steps, num_columns=1, seed=0):
+    """
+    Time series file (e.g. .otl) with one time column and num_columns value columns.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        for timeStep in range(num_time_steps):
+            values = ''.join('{0:>13.6f}'.format(rng.uniform(0.0, 100.0)) for _ in range(num_columns))
+            f.write('{0:>17.8f}{1}\n'.format(2017.0 + timeStep / 525600.0, values))
+
+
+def _write_grass_header(f, rows, columns, cell_size=90.0):
+    f.write('north: {0:.6f}\n'.format(4500000.0 + rows * cell_size))
+    f.write('south: {0:.6f}\n'.format(4500000.0))
+    f.write('east: {0:.6f}\n'.format(450000.0 + columns * cell_size))
+    f.write('west: {0:.6f}\n'.format(450000.0))
+    f.write('rows: {0}\n'.format(rows))
+    f.write('cols: {0}\n'.format(columns))
+
+
+def write_mask_map(path, rows, columns):
+    """
+    Watershed mask (.msk) in GRASS ASCII format with every cell active.
+    """
+    with open(path, 'w') as f:
+        _write_grass_header(f, rows, columns)
+        line = ' '.join(['1'] * columns)
+        for _ in range(rows):
+            f.write(line + '\n')
+
+
+def write_index_map(path, rows, columns, num_ids, seed=0):
+    """
+    Index map (.idx) in GRASS ASCII format with ids 1 through num_ids.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        _write_grass_header(f, rows, columns)
+        for _ in range(rows):
+            f.write(' '.join(str(rng.randint(1, num_ids)) for _ in range(columns)) + '\n')
+
+
+def write_wms_dataset_file(path, rows, columns, num_time_steps, seed=0):
+    """
+    Scalar WMS dataset file (e.g. .dep) on an R x C grid without status cells.
+    """
+    rng = random.Random(seed)
+    numberCells = rows * columns
+
+    with open(path, 'w') as f:
+        f.write('DATASET\r\n')
+        f.write('OBJTYPE "grid"\r\n')
+        f.write('BEGSCL\r\n')
+        f.write('OBJID 1\r\n')
+        f.write('ND {0}\r\n'.format(numberCells))
+        f.write('NC {0}\r\n'.format(numberCells))
+        f.write('NAME "synthetic"\r\n')
+
+        for timeStep in range(num_time_steps):
+            f.write('TS 0 {0:.8f}\r\n'.format(timeStep * 60.0))
+            for _ in range(numberCells):
+                f.write('{0:.5f}\r\n'.format(rng.uniform(0.0, 2.0)))
+
+        f.write('ENDDS\r\n')
+
+
+def write_mapping_table_file(path, index_map_filename, num_ids, seed=0):
+    """
+    Mapping table file (.cmt) with ROUGHNESS and GREEN_AMPT_INFILTRATION tables of num_ids rows each.
+    """
+    rng = random.Random(seed)
+    GREEN_AMPT_VARIABLES = ('CAPIL_HEAD', 'FIELD_CAPACITY', 'HYDR_COND', 'PORE_INDEX',
+                            'POROSITY', 'RESID_SAT', 'WILTING_PT')
+
+    with open(path, 'w') as f:
+        f.write('GSSHA_INDEX_MAP_TABLES\n')
+        f.write('INDEX_MAP                "{0}" "synthetic"\n'.format(index_map_filename))
+
+        f.write('ROUGHNESS "synthetic"\n')
+        f.write('NUM_IDS {0}\n'.format(num_ids))
+        f.write('{0:<6}{1:<40}{2:<40}ROUGH  \n'.format('ID', 'DESCRIPTION1', 'DESCRIPTION2'))
+        for index in range(1, num_ids + 1):
+            f.write('{0:<6}{1:<40}{2:<40}{3:.6f}   \n'.format(index, 'Land use {0}'.format(index), '',
+                                                             rng.uniform(0.01, 0.2)))
+
+        f.write('GREEN_AMPT_INFILTRATION "synthetic"\n')
+        f.write('NUM_IDS {0}\n'.format(num_ids))
+        f.write('{0:<6}{1:<40}{2:<40}{3}  \n'.format('ID', 'DESCRIPTION1', 'DESCRIPTION2',
+                                                      '  '.join(GREEN_AMPT_VARIABLES)))
+        for index in range(1, num_ids + 1):
+            values = '   '.join('{0:.6f}'.format(rng.uniform(0.0, 1.0)) for _ in GREEN_AMPT_VARIABLES)
+            f.write('{0:<6}{1:<40}{2:<40}{3}   \n'.format(index, 'Soil {0}'.format(index), '', values))
+
+
+def write_grid_stream_file(path, num_links, nodes_per_link, columns=100):
+    """
+    Grid stream file (.gst) with one cell per stream node.
+    """
+    with open(path, 'w') as f:
+        f.write('GRIDSTREAMFILE\n')
+        f.write('STREAMCELLS {0}\n'.format(num_links * nodes_per_link))
+
+        cell = 0
+        for link in range(1, num_links + 1):
+            for node in range(1, nodes_per_link + 1):
+                f.write('CELLIJ    {0}  {1}\n'.format(cell // columns + 1, cell % columns + 1))
+                f.write('NUMNODES  1\n')
+                f.write('LINKNODE  {0}  {1}  1.000000\n'.format(link, node))
+                cell += 1
+
+
+def write_grid_pipe_file(path, num_links, nodes_per_link, columns=100):
+    """
+    Grid pipe file (.gpi) with one cell per pipe node.
+    """
+    with open(path, 'w') as f:
+        f.write('GRIDPIPEFILE\n')
+        f.write('PIPECELLS {0}\n'.format(num_links * nodes_per_link))
+
+        cell = 0
+        for link in range(1, num_links + 1):
+            for node in range(1, nodes_per_link + 1):
+                f.write('CELLIJ    {0}  {1}\n'.format(cell // columns + 1, cell % columns + 1))
+                f.write('NUMPIPES  1\n')
+                f.write('SPIPE     {0}  {1}  1.000000\n'.format(link, node))
+                cell += 1
+
+
+def _write_storm_node(f, card, number, elevation, rng, columns, cell):
+    f.write('{0}  {1}  {2:.2f}  {3:.2f}  1.000000  6  {4}  {5}  0.100000  0.100000\n'.format(
+        card, number, elevation + rng.uniform(5.0, 10.0), elevation, cell // columns + 1, cell % columns + 1))
+
+
+def write_storm_pipe_network_file(path, num_links, nodes_per_link, columns=100, seed=0):
+    """
+    Storm pipe network file (.spn) with a binary tree of super links joined by super junctions.
+    """
+    rng = random.Random(seed)
+    elevation = 100.0 + num_links * nodes_per_link * 0.1
+
+    with open(path, 'w') as f:
+        # super link n drains super junction n into the super junction of its downstream link
+        for link in range(1, num_links + 1):
+            downstream = _downstream_link(link, num_links) or num_links + 1
+            f.write('CONNECT  {0}  {1}  {2}\n'.format(link, link, downstream))
+
+        for junction in range(1, num_links + 2):
+            _write_storm_node(f, 'SJUNC', junction, elevation - junction * 0.1, rng, columns, junction)
+
+        cell = 0
+        for link in range(1, num_links + 1):
+            f.write('SLINK   {0}      {1}\n'.format(link, nodes_per_link - 1))
+            for node in range(1, nodes_per_link + 1):
+                elevation -= rng.uniform(0.01, 0.1)
+                _write_storm_node(f, 'NODE', node, elevation, rng, columns, cell)
+                cell += 1
+            for pipe in range(1, nodes_per_link):
+                f.write('PIPE  {0}  1  0.500000  0.000000  {1:.6f}  0.000200  {2:.2f}  0.000000  0.000000\n'.format(
+                    pipe, rng.uniform(0.001, 0.02), rng.uniform(20.0, 100.0)))
+
+
+def write_elevation_grid(path, rows, columns, seed=0):
+    """
+    Elevation grid (.ele) in GRASS ASCII format.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        _write_grass_header(f, rows, columns)
+        for row in range(rows):
+            f.write(' '.join('{0:.6f}'.format(200.0 - row * 0.1 + rng.uniform(0.0, 5.0))
+                             for _ in range(columns)) + '\n')
+
+
+def write_hmet_file(path, num_time_steps, seed=0):
+    """
+    Hourly HMET file in WES format (.hmt).
+    """
+    rng = random.Random(seed)
+    start = datetime(2017, 1, 1)
+
+    with open(path, 'w') as f:
+        for hour in range(num_time_steps):
+            time = start + timedelta(hours=hour)
+            f.write('{0.year}\t{0.month}\t{0.day}\t{0.hour}\t{1:.3f}\t{2}\t{3}\t{4}\t{5}\t{6:.2f}\t{7:.2f}\n'.format(
+                time, rng.uniform(29.0, 31.0), rng.randint(10, 100), rng.randint(0, 100), rng.randint(0, 20),
+                rng.randint(20, 90), rng.uniform(0.0, 300.0), rng.uniform(0.0, 600.0)))
+
+
+def write_replace_param_file(path, num_params):
+    """
+    Replacement parameter file with num_params target parameters.
+    """
+    with open(path, 'w') as f:
+        f.write('{0}\n'.format(num_params))
+        for param in range(num_params):
+            f.write('[param_{0}] "%6.2lf"\n'.format(param))
+
+
+def write_replace_val_file(path, num_params, num_runs, seed=0):
+    """
+    Replacement value file with num_params values for each of num_runs runs.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        for _ in range(num_runs):
+            f.write(' '.join('{0:.2f}'.format(rng.uniform(0.0, 100.0)) for _ in range(num_params)) + '\n')
+
+
+def write_projection_file(path):
+    """
+    Projection file (_prj.pro) with the WKT of UTM zone 16 north.
+    """
+    with open(path, 'w') as f:
+        f.write('PROJCS["UTM_Zone_16_Northern_Hemisphere",GEOGCS["GCS_Geographic Coordinate System",'
+                'DATUM["D_NORTH_AMERICAN_1983",SPHEROID["GRS_1980",6378137,298.257222101]],PRIMEM["Greenwich",0],'
+                'UNIT["Degree",0.017453292519943295]],PROJECTION["Transverse_Mercator"],'
+                'PARAMETER["latitude_of_origin",0],PARAMETER["central_meridian",-87],PARAMETER["scale_factor",0.9996],'
+                'PARAMETER["false_easting",500000],PARAMETER["false_northing",0],UNIT["Meter",1]]')
+
+
+def write_nwsrfs_file(path, num_bands, seed=0):
+    """
+    NWSRFS snow elevation band file with num_bands bands.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        f.write('Number_Bands:    {0}\n'.format(num_bands))
+        f.write('Lower_Elevation  Upper_Elevation  MF_Min  MF_Max  SCF  FR_USE  TIPM  NMF  FUA  PCWHC\n')
+        for band in range(num_bands):
+            f.write('{0:<17}{1:<17}{2}\n'.format(1000 + band * 100, 1100 + band * 100,
+                                                 '  '.join('{0:.1f}'.format(rng.uniform(0.0, 2.0))
+                                                           for _ in range(8))))
+
+
+def write_orographic_gage_file(path, num_time_steps, seed=0):
+    """
+    Orographic gage file with hourly temperatures.
+    """
+    rng = random.Random(seed)
+    start = datetime(2017, 1, 1)
+
+    with open(path, 'w') as f:
+        f.write('Num_Sites:    2\n')
+        f.write('Elev_Base     3368.04\n')
+        f.write('Elev_2        3756.66\n')
+        f.write('Year    Month   Day     Hour    Temp_2\n')
+        for hour in range(num_time_steps):
+            time = start + timedelta(hours=hour)
+            f.write('{0.year}    {0.month}      {0.day}       {0.hour}       {1:.3f}\n'.format(
+                time, rng.uniform(-5.0, 10.0)))
+
+
+def write_output_location_file(path, num_links, nodes_per_link):
+    """
+    Output location file (e.g. .ihl) with every link and node.
+    """
+    with open(path, 'w') as f:
+        f.write('{0}\n'.format(num_links * nodes_per_link))
+        for link in range(1, num_links + 1):
+            for node in range(1, nodes_per_link + 1):
+                f.write('{0} {1}\n'.format(link, node))
+
+
+def write_event_file(path, num_events):
+    """
+    Project file event YAML file with num_events events and their subfolders.
+    """
+    directory = os.path.dirname(path)
+
+    with open(path, 'w') as f:
+        for event in range(1, num_events + 1):
+            subfolder = 'event_{0}'.format(event)
+            if not os.path.isdir(os.path.join(directory, subfolder)):
+                os.makedirs(os.path.join(directory, subfolder))
+            f.write('- !ProjectFileEvent {{name: event{0}, subfolder: {1}}}\n'.format(event, subfolder))
+
+
+def write_generic_file(path, num_lines, seed=0):
+    """
+    Text file that is only supported as a GenericFile.
+    """
+    rng = random.Random(seed)
+
+    with open(path, 'w') as f:
+        for line in range(num_lines):
+            f.write('LINE {0} {1:.6f}\n'.format(line, rng.uniform(0.0, 1.0)))
+
+
+def generate_project(directory, name='synthetic', num_links=10, nodes_per_link=5, num_gages=5,
+                     num_periods=24, num_time_steps=24, rows=50, columns=50, num_ids=10, seed=0):
+    """
+    Write a complete synthetic project and return a dictionary of the generated filenames by extension.
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    filenames = {'prj': '{0}.prj'.format(name),
+                 'cif': '{0}.cif'.format(name),
+                 'gag': '{0}.gag'.format(name),
+                 'lnd': '{0}.lnd'.format(name),
+                 'otl': '{0}.otl'.format(name),
+                 'msk': '{0}.msk'.format(name),
+                 'idx': 'synthetic.idx',
+                 'dep': '{0}.dep'.format(name),
+                 'cmt': '{0}.cmt'.format(name),
+                 'gst': '{0}.gst'.format(name),
+                 'gpi': '{0}.gpi'.format(name),
+                 'spn': '{0}.spn'.format(name),
+                 'ele': '{0}.ele'.format(name),
+                 'hmt': '{0}.hmt'.format(name),
+                 'rep': 'replace_param.txt',
+                 'rpv': 'replace_val.txt',
+                 'pro': '{0}_prj.pro'.format(name),
+                 'snw': 'nwsrfs_elev.txt',
+                 'oro': 'oro_gages.txt',
+                 'ohl': '{0}.ohl'.format(name),
+                 'ihl': '{0}.ihl'.format(name),
+                 'yml': '{0}.yml'.format(name),
+                 'gen': '{0}.dat'.format(name)}
+
+    def path(extension):
+        return os.path.join(directory, filenames[extension])
+
+    write_channel_input_file(path('cif'), num_links, nodes_per_link, seed)
+    write_precip_file(path('gag'), num_gages, num_periods, seed=seed)
+    write_link_node_dataset_file(path('lnd'), num_links, nodes_per_link, num_time_steps, seed)
+    write_time_series_file(path('otl'), num_time_steps, seed=seed)
+    write_mask_map(path('msk'), rows, columns)
+    write_index_map(path('idx'), rows, columns, num_ids, seed)
+    write_wms_dataset_file(path('dep'), rows, columns, num_time_steps, seed)
+    write_mapping_table_file(path('cmt'), filenames['idx'], num_ids, seed)
+    write_grid_stream_file(path('gst'), num_links, nodes_per_link, columns)
+    write_grid_pipe_file(path('gpi'), num_links, nodes_per_link, columns)
+    write_storm_pipe_network_file(path('spn'), num_links, nodes_per_link, columns, seed)
+    write_elevation_grid(path('ele'), rows, columns, seed)
+    write_hmet_file(path('hmt'), num_time_steps, seed)
+    write_replace_param_file(path('rep'), num_ids)
+    write_replace_val_file(path('rpv'), num_ids, num_time_steps, seed)
+    write_projection_file(path('pro'))
+    write_nwsrfs_file(path('snw'), num_ids, seed)
+    write_orographic_gage_file(path('oro'), num_time_steps, seed)
+    write_time_series_file(path('ohl'), num_time_steps, num_columns=3, seed=seed)
+    write_output_location_file(path('ihl'), num_links, nodes_per_link)
+    write_event_file(path('yml'), num_ids)
+    write_generic_file(path('gen'), num_time_steps, seed)
+
+    with open(path('prj'), 'w') as f:
+        f.write('GSSHAPROJECT\n')
+        f.write('WATERSHED_MASK           "{0}"\n'.format(filenames['msk']))
+        f.write('PROJECT_PATH             ""\n')
+        f.write('GRIDSIZE                 90.000000\n')
+        f.write('ROWS                     {0}\n'.format(rows))
+        f.write('COLS                     {0}\n'.format(columns))
+        f.write('TOT_TIME                 {0}\n'.format(num_time_steps * 60))
+        f.write('TIMESTEP                 10\n')
+        f.write('MAP_TYPE                 1\n')
+        f.write('CHANNEL_INPUT            "{0}"\n'.format(filenames['cif']))
+        f.write('STREAM_CELL              "{0}"\n'.format(filenames['gst']))
+        f.write('MAPPING_TABLE            "{0}"\n'.format(filenames['cmt']))
+        f.write('PRECIP_FILE              "{0}"\n'.format(filenames['gag']))
+        f.write('OUTLET_HYDRO             "{0}"\n'.format(filenames['otl']))
+        f.write('CHAN_DEPTH               "{0}"\n'.format(filenames['lnd']))
+        f.write('DEPTH                    "{0}"\n'.format(filenames['dep']))
+
+    return filenames
@@ -12,10 +12,13 @@ import os
 
 from sqlalchemy.exc import IntegrityError
 
+from ..util.instrumentation import QueryCounter, instrument
+
 __all__ = ['GsshaPyFileObjectBase']
 
 log = logging.getLogger(__name__)
 
+
 class GsshaPyFileObjectBase:
     """
     Abstract base class for all file objects in the GsshaPy ORM.
@@ -61,15 +64,20 @@ class GsshaPyFileObjectBase:
             extension = filename_split[-1]
 
         if os.path.isfile(path):
-            # Add self to session
-            session.add(self)
+            with instrument('read', self, filename, session) as record:
+                # Add self to session
+                session.add(self)
+
+                # Read
+                self._read(directory, filename, session, path, name, extension,
+                           spatial, spatialReferenceID, replaceParamFile, **kwargs)
 
-            # Read
-            self._read(directory, filename, session, path, name, extension,
-                       spatial, spatialReferenceID, replaceParamFile, **kwargs)
+                if record is not None:
+                    record['bytes'] = os.path.getsize(path)
+                    record['rows'] = len(session.new)
 
-            # Commit to database
-            self._commit(session, self.COMMIT_ERROR_MESSAGE)
+                # Commit to database
+                self._commit(session, self.COMMIT_ERROR_MESSAGE)
         else:
             # Rollback the session if the file doesn't exist
             session.rollback()
@@ -112,19 +120,26 @@ class GsshaPyFileObjectBase:
 
         filePath = os.path.join(directory, filename)
 
-        with open(filePath, 'w') as openFile:
-            # Write Lines
-            self._write(session=session,
-                        openFile=openFile,
-                        replaceParamFile=replaceParamFile,
-                        **kwargs)
+        with instrument('write', self, filename, session) as record:
+            with open(filePath, 'w') as openFile, QueryCounter(session) as queryCounter:
+                # Write Lines
+                self._write(session=session,
+                            openFile=openFile,
+                            replaceParamFile=replaceParamFile,
+                            **kwargs)
+
+            if record is not None:
+                record['bytes'] = os.path.getsize(filePath)
+
+        log.debug('Wrote {0} using {1} queries'.format(filename, queryCounter.count))
 
     def _commit(self, session, errorMessage):
         """
         Custom commit function for file objects
         """
         try:
-            session.commit()
+            with instrument('commit', self, session=session):
+                session.commit()
         except IntegrityError:
             # Raise special error if the commit fails due to empty files
             log.error('Commit to database failed. %s' % errorMessage)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+#  arc_ascii.py
+#  GSSHApy
+#
+#  License BSD 3-Clause
+
+from io import open as io_open
+import logging
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+__all__ = ['ArcAsciiWriter',
+           'arc_ascii_header',
+           'format_arc_ascii_body',
+           'write_arc_ascii_files']
+
+
+def arc_ascii_header(geotransform, y_size, x_size):
+    """Header of an Arc ASCII grid
+
+    Args:
+        geotransform(list): GDAL geotransform of the grid. It must be north up.
+        y_size(int): Number of rows.
+        x_size(int): Number of columns.
+
+    Returns:
+        :obj:`str`: The header lines.
+    """
+    if geotransform[2] != 0 or geotransform[4] != 0 or geotransform[5] >= 0:
+        raise ValueError("Only north up grids without rotation can be written "
+                         "as Arc ASCII: {0}".format(geotransform))
+
+    header = u"ncols {0}\nnrows {1}\nxllcorner {2:.12}\nyllcorner {3:.12}\n" \
+        .format(x_size, y_size, float(geotransform[0]),
+                float(geotransform[3] + y_size * geotransform[5]))
+    if np.isclose(geotransform[1], -geotransform[5], rtol=1e-9, atol=0):
+        header += u"cellsize {0:.12}\n".format(float(geotransform[1]))
+    else:
+        header += u"dx {0:.12}\ndy {1:.12}\n".format(float(geotransform[1]),
+                                                     float(-geotransform[5]))
+    return header
+
+
+def format_arc_ascii_body(array, precision=6):
+    """Rows of an Arc ASCII grid formatted with one format operation
+
+    Args:
+        array(:obj:`numpy.ndarray`): 2D array of the grid values (north up).
+        precision(Optional[:obj:`int`]): Number of significant digits. Default is 6.
+
+    Returns:
+        :obj:`str`: The grid rows.
+    """
+    y_size, x_size = array.shape
+    row_format = u" ".join([u"%.{0}g".format(precision)] * x_size) + u"\n"
+    return (row_format * y_size) % tuple(np.asarray(array, dtype=np.float64).ravel().tolist())
+
+
+def write_arc_ascii_files(grids, header, precision=6):
+    """Write Arc ASCII grids with the same header
+
+    Args:
+        grids(list): Pairs of the file path and 2D array of each grid.
+        header(:obj:`str`): Header from :func:`arc_ascii_header`.
+        precision(Optional[:obj:`int`]): Number of significant digits. Default is 6.
+    """
+    for file_path, array in grids:
+        with io_open(file_path, 'w') as ascii_file:
+            ascii_file.write(header)
+            ascii_file.write(format_arc_ascii_body(array, precision))
+
+
+class ArcAsciiWriter(object):
+    """Writes Arc ASCII grids from a pool of threads or processes.
+
+    Each task writes one or more grids, e.g. all of the HMET variables
+    of a time step. The number of pending tasks is limited so the arrays
+    waiting to be written stay bounded in memory. Errors in the workers
+    are raised when the writer is closed.
+
+    Attributes:
+        num_workers(:obj:`int`): Number of workers. If 1 or less, the grids
+            are written in the calling thread.
+        pool_type(:obj:`str`): 'thread' or 'process'.
+        precision(:obj:`int`): Number of significant digits of the values.
+
+    Example::
+
+        from gsshapy.grid.arc_ascii import ArcAsciiWriter, arc_ascii_header
+
+        header = arc_ascii_header(geotransform, *array.shape)
+        with ArcAsciiWriter(num_workers=4) as writer:
+            writer.write([('2016082316_Temp.asc', array)], header)
+    """
+    def __init__(self, num_workers=1, pool_type='thread', precision=6):
+        if pool_type not in ('thread', 'process'):
+            raise ValueError("Invalid pool type: {0}. Valid types include: "
+                             "thread, process".format(pool_type))
+        self.num_workers = num_workers
+        self.pool_type = pool_type
+        self.precision = precision
+        self._pending = []
+        self._pool = None
+        if num_workers > 1:
+            pool_class = ThreadPool if pool_type == 'thread' else Pool
+            self._pool = pool_class(num_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def write(self, grids, header):
+        """Write grids with the same header
+
+        Args:
+            grids(list): Pairs of the file path and 2D array of each grid.
+            header(:obj:`str`): Header from :func:`arc_ascii_header`.
+        """
+        if self._pool is None:
+            write_arc_ascii_files(grids, header, self.precision)
+            return
+
+        while len(self._pending) >= 2 * self.num_workers:
+            self._pending.pop(0).get()
+        self._pending.append(self._pool.apply_async(write_arc_ascii_files,
+                                                    (grids, header, self.precision)))
+
+    def close(self):
+        """Wait for all grids to be written"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            pending, self._pending = self._pending, []
+            self._pool = None
+            for result in pending:
+                result.get()
+
+    def terminate(self):
+        """Stop the workers without waiting for the pending grids"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._pending = []
@@ -301,6 +301,13 @@ class ERAtoGSSHA(GRIDtoGSSHA):
         lsm_lon_dim(Optional[:obj:`str`]): Name of the longitude dimension in the LSM netCDF files. Defaults to 'lon'.
         lsm_time_dim(Optional[:obj:`str`]): Name of the time dimension in the LSM netCDF files. Defaults to 'time'.
         output_timezone(Optional[:obj:`tzinfo`]): This is the timezone to output the dates for the data. Default is he GSSHA model timezone. This option does NOT currently work for NetCDF output.
+        lsm_cache_max_bytes(Optional[:obj:`int`]): Memory budget in bytes of the cache of subset LSM variables shared between GSSHA variables. Set to 0 to disable the cache. Defaults to 512 MB.
+        regrid_method(Optional[:obj:`str`]): If set, the LSM data is mapped to the GSSHA grid with precomputed 'nearest', 'bilinear', or 'area' weights instead of being reprojected with GDAL for every variable and time step. Precipitation gages stay at the LSM pixel centers. Default is None.
+        regrid_weights_file(Optional[:obj:`str`]): Path to a .npz file to save the regridding weights to and load them from, so they are only computed once for all forecast cycles on the same grids. Default is None.
+        chunks(Optional[:obj:`int` or :obj:`dict`]): If set, the LSM data stays lazy (dask) through the conversion and is computed one block at a time. An integer is the number of time steps per block and a dictionary maps the LSM dimension names to block sizes. Default is None.
+        max_memory(Optional[:obj:`int`]): If set and chunks is not, the number of time steps per block is chosen so a block of one variable on the larger of the LSM subset and the GSSHA grid uses at most this many bytes. Default is None.
+        subset_cache_dir(Optional[:obj:`str`]): If set, the subset of each LSM variable from each LSM file is stored in this directory as compressed NetCDF, so repeated conversions over overlapping time windows only read the new LSM files. It is not used when chunks or max_memory is set. Default is None.
+        subset_cache_max_bytes(Optional[:obj:`int`]): Disk budget in bytes of the subset cache. The least recently used data is removed to stay in the budget. Defaults to 10 GB.
         download_start_datetime(Optional[:obj:`datetime.datetime`]): Datetime to start download.
         download_end_datetime(Optional[:obj:`datetime.datetime`]): Datetime to end download.
         era_download_data(Optional[:obj:`str`]): You can choose 'era5' or 'interim'. Defaults to 'era5'.
@@ -352,6 +359,13 @@ class ERAtoGSSHA(GRIDtoGSSHA):
                  download_start_datetime=None,
                  download_end_datetime=None,
                  era_download_data='era5',
+                 lsm_cache_max_bytes=512*1024**2,
+                 regrid_method=None,
+                 regrid_weights_file=None,
+                 chunks=None,
+                 max_memory=None,
+                 subset_cache_dir=None,
+                 subset_cache_max_bytes=10*1024**3,
                  ):
         """
         Initializer function for the HRRRtoGSSHA class
@@ -373,7 +387,14 @@ class ERAtoGSSHA(GRIDtoGSSHA):
                                          lsm_lat_dim,
                                          lsm_lon_dim,
                                          lsm_time_dim,
-                                         output_timezone)
+                                         output_timezone,
+                                         lsm_cache_max_bytes,
+                                         regrid_method,
+                                         regrid_weights_file,
+                                         chunks,
+                                         max_memory,
+                                         subset_cache_dir,
+                                         subset_cache_max_bytes)
 
     def _download(self):
         """download ERA5 data for GSSHA domain"""
@@ -7,7 +7,10 @@
 #  License BSD 3-Clause
 
 from builtins import range
+import dask
+import dask.array as da
 from datetime import datetime
+from glob import glob
 from io import open as io_open
 import logging
 import numpy as np
@@ -22,9 +25,18 @@ import xarray.ufuncs as xu
 from gazar.grid import ArrayGrid, gdal_reproject
 from ..lib import db_tools as dbt
 from ..orm import ProjectFile
+from .arc_ascii import ArcAsciiWriter, arc_ascii_header
+from .lsm_cache import LSMDataCache
+from .lsm_disk_cache import LSMSubsetDiskCache, file_fingerprint
+from .precip_gage import format_gage_rows, select_gages
+from .regrid import (LSMRegridder, grid_cell_coords, grid_signature,
+                     transform_coords)
 
 log = logging.getLogger(__name__)
 
+# options of the pangaea lsm accessor set by the LSM specific classes
+LSM_ACCESSOR_OPTIONS = ('coords_projected', 'lon_to_180')
+
 
 # ------------------------------------------------------------------------------
 # HELPER FUNCTIONS
@@ -96,6 +108,13 @@ class GRIDtoGSSHA(object):
         lsm_lon_dim(Optional[:obj:`str`]): Name of the longitude dimension in the LSM netCDF files. Defaults to 'lon'.
         lsm_time_dim(Optional[:obj:`str`]): Name of the time dimension in the LSM netCDF files. Defaults to 'time'.
         output_timezone(Optional[:obj:`tzinfo`]): This is the timezone to output the dates for the data. Default is the timezone of your GSSHA model. This option does NOT currently work for NetCDF output.
+        lsm_cache_max_bytes(Optional[:obj:`int`]): Memory budget in bytes of the cache of subset LSM variables shared between GSSHA variables. Set to 0 to disable the cache. Defaults to 512 MB.
+        regrid_method(Optional[:obj:`str`]): If set, the LSM data is mapped to the GSSHA grid with precomputed 'nearest', 'bilinear', or 'area' weights instead of being reprojected with GDAL for every variable and time step. Precipitation gages stay at the LSM pixel centers. Default is None.
+        regrid_weights_file(Optional[:obj:`str`]): Path to a .npz file to save the regridding weights to and load them from, so they are only computed once for all forecast cycles on the same grids. Default is None.
+        chunks(Optional[:obj:`int` or :obj:`dict`]): If set, the LSM data stays lazy (dask) through the conversion and is computed one block at a time. An integer is the number of time steps per block and a dictionary maps the LSM dimension names to block sizes. Default is None.
+        max_memory(Optional[:obj:`int`]): If set and chunks is not, the number of time steps per block is chosen so a block of one variable on the larger of the LSM subset and the GSSHA grid uses at most this many bytes. Default is None.
+        subset_cache_dir(Optional[:obj:`str`]): If set, the subset of each LSM variable from each LSM file is stored in this directory as compressed NetCDF, so repeated conversions over overlapping time windows only read the new LSM files. It is not used when chunks or max_memory is set. Default is None.
+        subset_cache_max_bytes(Optional[:obj:`int`]): Disk budget in bytes of the subset cache. The least recently used data is removed to stay in the budget. Defaults to 10 GB.
 
     Example::
 
@@ -492,6 +511,13 @@ class GRIDtoGSSHA(object):
                  lsm_lon_dim='lon',
                  lsm_time_dim='time',
                  output_timezone=None,
+                 lsm_cache_max_bytes=512*1024**2,
+                 regrid_method=None,
+                 regrid_weights_file=None,
+                 chunks=None,
+                 max_memory=None,
+                 subset_cache_dir=None,
+                 subset_cache_max_bytes=10*1024**3,
                  ):
         """
         Initializer function for the GRIDtoGSSHA class
@@ -508,6 +534,16 @@ class GRIDtoGSSHA(object):
         self.lsm_time_dim = lsm_time_dim
         self.output_timezone = output_timezone
         self._xd = None
+        self._lsm_cache = LSMDataCache(lsm_cache_max_bytes)
+        self.regrid_method = regrid_method
+        self.regrid_weights_file = regrid_weights_file
+        self._regridder = None
+        self.chunks = chunks
+        self.max_memory = max_memory
+        self._subset_cache = None
+        if subset_cache_dir is not None:
+            self._subset_cache = LSMSubsetDiskCache(subset_cache_dir,
+                                                    subset_cache_max_bytes)
         # load in GSSHA model files
         chdir(self.gssha_project_folder)
         sqlalchemy_url, sql_engine = dbt.init_sqlite_memory()
@@ -567,6 +603,10 @@ class GRIDtoGSSHA(object):
         self.yslice = slice(np.amin(lsm_y_indices),
                             np.amax(lsm_y_indices)+1)
 
+        # cached data and weights belong to the previous subset
+        self._lsm_cache.clear()
+        self._regridder = None
+
     def _load_modeling_extent(self):
         """
         # Get extent from GSSHA Grid in LSM coordinates
@@ -605,17 +645,119 @@ class GRIDtoGSSHA(object):
                        calc_4d_dim=None):
         """
         This extracts the LSM data from a folder of netcdf files
+
+        The subset data is cached before the conversion factor is
+        applied so each LSM variable is only read once when it is
+        used for several GSSHA variables.
+
+        If chunks or max_memory is set, the data is not loaded or
+        cached and stays lazy so it is read one block at a time.
         """
-        data = self.xd.lsm.getvar(data_var,
-                                  yslice=self.yslice,
-                                  xslice=self.xslice,
-                                  calc_4d_method=calc_4d_method,
-                                  calc_4d_dim=calc_4d_dim,
-                                  )
-        data = data.fillna(0)
-        data.values *= conversion_factor
+        if self.chunks or self.max_memory:
+            data = self.xd.lsm.getvar(data_var,
+                                      yslice=self.yslice,
+                                      xslice=self.xslice,
+                                      calc_4d_method=calc_4d_method,
+                                      calc_4d_dim=calc_4d_dim,
+                                      )
+            data = data.chunk(self._get_lsm_chunks(data)).fillna(0)
+        else:
+            cache_key = (data_var, calc_4d_method, calc_4d_dim)
+            data = self._lsm_cache.get(cache_key)
+            if data is None and self._subset_cache is not None:
+                data = self._load_lsm_data_subset_cache(data_var,
+                                                        calc_4d_method,
+                                                        calc_4d_dim)
+                if data is not None:
+                    self._lsm_cache.put(cache_key, data)
+            if data is None:
+                data = self.xd.lsm.getvar(data_var,
+                                          yslice=self.yslice,
+                                          xslice=self.xslice,
+                                          calc_4d_method=calc_4d_method,
+                                          calc_4d_dim=calc_4d_dim,
+                                          )
+                data = data.fillna(0).load()
+                self._lsm_cache.put(cache_key, data)
+
+        data *= conversion_factor
         return data
 
+    def _load_lsm_data_subset_cache(self, data_var,
+                                    calc_4d_method=None,
+                                    calc_4d_dim=None):
+        """
+        This extracts the LSM data with the subset of each LSM file
+        read from the disk cache when possible
+
+        The files are opened as one dataset with one block per file
+        along the time dimension, so the blocks give the time steps of
+        each file. Only the time steps of the files missing from the
+        cache are read from the LSM files. Returns None if the time
+        steps of the files cannot be determined.
+        """
+        lsm_var = self.xd[data_var]
+        lsm_files = sorted(glob(path.join(self.lsm_input_folder_path,
+                                          self.lsm_search_card)))
+        if lsm_var.chunks is None or self.lsm_time_dim not in lsm_var.dims:
+            log.warning("Unable to find the time steps of each LSM file. "
+                        "Skipping the subset cache.")
+            return None
+        file_time_steps = lsm_var.chunks[lsm_var.get_axis_num(self.lsm_time_dim)]
+        if len(file_time_steps) != len(lsm_files):
+            log.warning("Unable to find the time steps of each LSM file. "
+                        "Skipping the subset cache.")
+            return None
+
+        subset = (self.yslice.start, self.yslice.stop,
+                  self.xslice.start, self.xslice.stop)
+        file_data = []
+        missing = []
+        time_start = 0
+        for lsm_file, num_time_steps in zip(lsm_files, file_time_steps):
+            cache_key = (file_fingerprint(lsm_file), subset,
+                         data_var, calc_4d_method, calc_4d_dim)
+            file_data.append(self._subset_cache.get(cache_key))
+            if file_data[-1] is None:
+                missing.append((len(file_data) - 1, cache_key,
+                                slice(time_start, time_start + num_time_steps)))
+            time_start += num_time_steps
+
+        if missing:
+            log.info("Reading {0} of {1} LSM files for {2} ..."
+                     .format(len(missing), len(lsm_files), data_var))
+            data = self.xd.lsm.getvar(data_var,
+                                      yslice=self.yslice,
+                                      xslice=self.xslice,
+                                      calc_4d_method=calc_4d_method,
+                                      calc_4d_dim=calc_4d_dim,
+                                      )
+            for file_index, cache_key, time_slice in missing:
+                new_data = data[{self.lsm_time_dim: time_slice}].fillna(0).load()
+                self._subset_cache.put(cache_key, new_data)
+                file_data[file_index] = new_data
+        self._subset_cache.flush()
+
+        if len(file_data) == 1:
+            return file_data[0]
+        return xr.concat(file_data, dim=self.lsm_time_dim)
+
+    def _get_lsm_chunks(self, data):
+        """
+        This function gets the blocks to read the LSM data in
+        """
+        if isinstance(self.chunks, dict):
+            return dict((dim, size) for dim, size in self.chunks.items()
+                        if dim in data.dims)
+        if self.chunks:
+            return {self.lsm_time_dim: self.chunks}
+
+        num_time_steps = dict(zip(data.dims, data.shape))[self.lsm_time_dim]
+        num_cells = max(data.size // max(num_time_steps, 1),
+                        self.gssha_grid.x_size * self.gssha_grid.y_size)
+        time_step_bytes = num_cells * np.dtype(np.float64).itemsize
+        return {self.lsm_time_dim: max(1, int(self.max_memory // time_step_bytes))}
+
     def _load_converted_gssha_data_from_lsm(self, gssha_var, lsm_var, load_type):
         """
         This function loads data from LSM and converts to GSSHA format
@@ -700,27 +842,25 @@ class GRIDtoGSSHA(object):
                                             )
             conversion_function = self.netcdf_attributes[gssha_var].get('conversion_function')
             if conversion_function:
-                self.data.values = self.netcdf_attributes[gssha_var]['conversion_function'][load_type](self.data.values)
+                self.data.data = self.netcdf_attributes[gssha_var]['conversion_function'][load_type](self.data.data)
 
         if load_type == 'ascii' or load_type == 'netcdf':
             # CONVERT TO INCREMENTAL
             if gssha_var == 'precipitation_acc':
-                self.data.values = np.lib.pad(self.data.diff(self.lsm_time_dim).values,
-                                              ((1,0),(0,0),(0,0)),
-                                              'constant',
-                                              constant_values=0)
+                # the first time step is zero
+                self.data -= self.data.shift(**{self.lsm_time_dim: 1}).fillna(self.data)
 
             # CONVERT PRECIP TO RADAR (mm/hr) IN FILE
             if gssha_var == 'precipitation_inc' or gssha_var == 'precipitation_acc':
                 # convert from mm to mm/hr
                 time_step_hours = np.diff(self.xd[self.lsm_time_var].values)[0]/np.timedelta64(1, 'h')
-                self.data.values /= time_step_hours
+                self.data /= time_step_hours
 
         if 'precipitation' in gssha_var and not isinstance(lsm_var, str):
             if 'units' in self.data.attrs:
                 if self.data.attrs['units'] == 'm':
                     # convert from m to mm
-                    self.data.values *= 1000
+                    self.data *= 1000
 
         # convert to dataset
         gssha_data_var_name = self.netcdf_attributes[gssha_var]['gssha_name']
@@ -772,6 +912,159 @@ class GRIDtoGSSHA(object):
         """
         self.data = self.data.lsm.resample(gssha_var, self.gssha_grid)
 
+    @property
+    def regridder(self):
+        """get regridder from the LSM subset to the GSSHA grid"""
+        if self._regridder is None:
+            y_coords, x_coords = self.xd.lsm.coords
+            src_y = y_coords[self.yslice, self.xslice]
+            src_x = x_coords[self.yslice, self.xslice]
+            geotransform = self.gssha_grid.geotransform
+            dst_shape = (self.gssha_grid.y_size, self.gssha_grid.x_size)
+            signature = grid_signature(src_y, src_x, geotransform, dst_shape)
+
+            if self.regrid_weights_file and path.exists(self.regrid_weights_file):
+                regridder = LSMRegridder.load(self.regrid_weights_file)
+                if regridder.matches(signature, self.regrid_method):
+                    log.info("Using regridding weights from {0}".format(self.regrid_weights_file))
+                    self._regridder = regridder
+                    return self._regridder
+                log.info("Regridding weights in {0} do not match the grids. "
+                         "Recomputing ...".format(self.regrid_weights_file))
+
+            # GSSHA cell centers and corners in the LSM projection
+            dst_y, dst_x = grid_cell_coords(geotransform, *dst_shape[::-1])
+            dst_x, dst_y = transform_coords(dst_x, dst_y,
+                                            self.gssha_grid.projection,
+                                            self.xd.lsm.projection)
+            dst_y_corners = dst_x_corners = None
+            if self.regrid_method == 'area':
+                dst_y_corners, dst_x_corners = grid_cell_coords(geotransform, *dst_shape[::-1],
+                                                                corners=True)
+                dst_x_corners, dst_y_corners = transform_coords(dst_x_corners, dst_y_corners,
+                                                                self.gssha_grid.projection,
+                                                                self.xd.lsm.projection)
+
+            self._regridder = LSMRegridder.from_coords(src_y, src_x, dst_y, dst_x,
+                                                       method=self.regrid_method,
+                                                       dst_y_corners=dst_y_corners,
+                                                       dst_x_corners=dst_x_corners,
+                                                       signature=signature)
+            if self.regrid_weights_file:
+                self._regridder.save(self.regrid_weights_file)
+
+        return self._regridder
+
+    def _regrid_data(self, gssha_vars):
+        """
+        This function maps the data of all variables and time steps
+        to the GSSHA grid with one product of the regridding weights
+        """
+        if isinstance(gssha_vars, basestring):
+            gssha_vars = [gssha_vars]
+
+        regridder = self.regridder
+        arrays = [self.data[gssha_var].data for gssha_var in gssha_vars]
+        if isinstance(arrays[0], da.Array):
+            # regrid lazily one time block at a time
+            stacked = da.stack(arrays).rechunk({2: -1, 3: -1})
+            regridded = stacked.map_blocks(regridder.apply,
+                                           chunks=stacked.chunks[:2] + tuple((size,) for size in regridder.dst_shape),
+                                           dtype=np.result_type(stacked.dtype, regridder.weights))
+        else:
+            regridded = regridder.apply(np.stack(arrays))
+        lat, lon = self.gssha_grid.latlon
+        self.data = xr.Dataset(
+            dict((gssha_var, (('time', 'y', 'x'), regridded[var_idx], self.data[gssha_var].attrs))
+                 for var_idx, gssha_var in enumerate(gssha_vars)),
+            coords={'time': self.data['time'],
+                    'lat': (('y', 'x'), lat),
+                    'lon': (('y', 'x'), lon),
+                    },
+            attrs={'proj4': self.gssha_grid.projection.ExportToProj4(),
+                   'geotransform': self.gssha_grid.geotransform,
+                   },
+        )
+
+    def _project_data(self, gssha_var, regrid=True):
+        """
+        This function converts the data to the GSSHA projection
+        and regrids it to the GSSHA grid if regrid_method is set
+        and regrid is True
+        """
+        if regrid and self.regrid_method:
+            self._regrid_data(gssha_var)
+        elif self.data[gssha_var].chunks:
+            self._to_projection_lazy(gssha_var)
+        else:
+            self.data = self.data.lsm.to_projection(gssha_var,
+                                                    projection=self.gssha_grid.projection)
+
+    def _to_projection_lazy(self, gssha_var):
+        """
+        This function converts lazy data to the GSSHA projection
+        one time block at a time
+        """
+        data = self.data
+        # the blocks get new accessors without the options set by the subclasses
+        accessor_options = dict((option, getattr(data.lsm, option))
+                                for option in LSM_ACCESSOR_OPTIONS
+                                if hasattr(data.lsm, option))
+
+        def project_block(time_slice):
+            block = data.isel(time=time_slice)
+            for option, value in accessor_options.items():
+                setattr(block.lsm, option, value)
+            return block.lsm.to_projection(gssha_var,
+                                           projection=self.gssha_grid.projection)
+
+        def project_block_values(time_slice):
+            return project_block(time_slice)[gssha_var].values
+
+        # the first time step defines the projected grid
+        projected = project_block(slice(0, 1))
+        projected_var = projected[gssha_var]
+
+        blocks = []
+        start = 0
+        for size in data[gssha_var].chunks[0]:
+            blocks.append(da.from_delayed(dask.delayed(project_block_values)(slice(start, start + size)),
+                                          shape=(size,) + projected_var.shape[1:],
+                                          dtype=projected_var.dtype))
+            start += size
+
+        coords = dict((name, coord) for name, coord in projected.coords.items()
+                      if 'time' not in coord.dims)
+        coords['time'] = data['time']
+        self.data = xr.Dataset({gssha_var: (projected_var.dims,
+                                            da.concatenate(blocks, axis=0),
+                                            projected_var.attrs)},
+                               coords=coords,
+                               attrs=projected.attrs)
+
+    def _iter_time_blocks(self, gssha_vars):
+        """
+        This function yields the first time index and the values of
+        the variables in each time block, computing lazy data one
+        time block at a time
+        """
+        data = self.data[gssha_vars[0]]
+        time_chunks = data.chunks[0] if data.chunks else (data.shape[0],)
+        start = 0
+        for size in time_chunks:
+            block = self.data[gssha_vars].isel(time=slice(start, start + size)).load()
+            yield start, [block[gssha_var].values for gssha_var in gssha_vars]
+            start += size
+
+    def _iter_time_steps(self, gssha_var):
+        """
+        This function yields the index and values of each time step,
+        computing lazy data one time block at a time
+        """
+        for start, (block,) in self._iter_time_blocks([gssha_var]):
+            for block_idx in range(block.shape[0]):
+                yield start + block_idx, block[block_idx]
+
     @staticmethod
     def _get_calc_function(gssha_data_var):
         """
@@ -800,40 +1093,25 @@ class GRIDtoGSSHA(object):
                                                 how=calc_function,
                                                 keep_attrs=True)
         elif time_step_hours > 1:
-            resampled_data = self.data.resample('1H', dim='time',
-                                                keep_attrs=True)
-
-            for time_idx in range(self.data.dims['time']):
-                if time_idx+1 < self.data.dims['time']:
-                    # interpolate between time steps
-                    start_time = self.data.time[time_idx].values
-                    end_time = self.data.time[time_idx+1].values
-                    slope_timeslice = slice(str(start_time), str(end_time))
-                    slice_size = resampled_data.sel(time=slope_timeslice).dims['time'] - 1
-                    first_timestep = resampled_data.sel(time=str(start_time))[gssha_data_var]
-                    slope = (resampled_data.sel(time=str(end_time))[gssha_data_var]
-                             - first_timestep)/float(slice_size)
-
-                    data_timeslice = slice(str(start_time+np.timedelta64(1, 'm')),
-                                            str(end_time-np.timedelta64(1, 'm')))
-                    data_subset = resampled_data.sel(time=data_timeslice)
-                    for xidx in range(data_subset.dims['time']):
-                        data_subset[gssha_data_var][xidx] = first_timestep + slope * (xidx+1)
-                else:
-                    # just continue to repeat the timestep
-                    start_time = self.data.time[time_idx].values
-                    end_time = resampled_data.time[-1].values
-                    if end_time > start_time:
-                        first_timestep = resampled_data.sel(time=str(start_time))[gssha_data_var]
-
-                        data_timeslice = slice(str(start_time), str(end_time))
-                        data_subset = resampled_data.sel(time=data_timeslice)
-                        slice_size = 1
-                        if calc_function == "mean":
-                            slice_size = data_subset.dims['time']
-
-                        for xidx in range(data_subset.dims['time']):
-                            data_subset[gssha_data_var][xidx] = first_timestep/float(slice_size)
+            # linear interpolation between the time steps
+            times = self.data.time.values
+            hour = np.timedelta64(1, 'h')
+            hourly_times = np.arange(times[0].astype('datetime64[h]'),
+                                     times[-1].astype('datetime64[h]') + hour,
+                                     hour).astype(times.dtype)
+            lower_idx = np.clip(np.searchsorted(times, hourly_times, side='right') - 1,
+                                0, len(times) - 2)
+            weight = xr.DataArray((hourly_times - times[lower_idx]) /
+                                  (times[lower_idx + 1] - times[lower_idx]),
+                                  coords=[('time', hourly_times)])
+
+            data = self.data[gssha_data_var]
+            lower_data = data.isel(time=lower_idx).assign_coords(time=hourly_times)
+            upper_data = data.isel(time=lower_idx + 1).assign_coords(time=hourly_times)
+            interp_data = (lower_data + (upper_data - lower_data) * weight).astype(data.dtype)
+            interp_data.attrs = data.attrs
+            resampled_data = interp_data.to_dataset(name=gssha_data_var)
+            resampled_data.attrs = self.data.attrs
 
         if resampled_data is not None:
             # make sure coordinates copied
@@ -843,7 +1121,8 @@ class GRIDtoGSSHA(object):
                 resampled_data.coords[self.data.lsm.y_var] = self.data.coords[self.data.lsm.y_var]
             self.data = resampled_data
 
-    def lsm_precip_to_gssha_precip_gage(self, out_gage_file, lsm_data_var, precip_type="RADAR"):
+    def lsm_precip_to_gssha_precip_gage(self, out_gage_file, lsm_data_var, precip_type="RADAR",
+                                        gage_selection=None, search_radius=None, precision=None):
         """This function takes array data and writes out a GSSHA precip gage file.
         See: http://www.gsshawiki.com/Precipitation:Spatially_and_Temporally_Varied_Precipitation
 
@@ -860,6 +1139,13 @@ class GRIDtoGSSHA(object):
                                           RAINC and the second is for RAINNC
                                           (see: http://www.meteo.unican.es/wiki/cordexwrf/OutputVariables).
             precip_type(Optional[str]): This tells if the data is the ACCUM, RADAR, or GAGES data type. Default is 'RADAR'.
+            gage_selection(Optional[str]): If set, only the pixels that influence the WATERSHED_MASK are written as gages.
+                                           Use 'thiessen' with RAIN_THIESSEN to keep the pixels that are the nearest gage
+                                           of a watershed cell or 'inverse_distance' with RAIN_INV_DISTANCE to also keep
+                                           the pixels within search_radius of a watershed cell. Default is None (all pixels).
+            search_radius(Optional[float]): Distance in the GSSHA projection for the 'inverse_distance' selection.
+                                            Defaults to the diagonal of an LSM pixel.
+            precision(Optional[int]): If set, the values are written with this number of decimals. Default is None (full precision).
 
         GRIDtoGSSHA Example:
 
@@ -914,8 +1200,8 @@ class GRIDtoGSSHA(object):
 
         self._load_converted_gssha_data_from_lsm(gssha_precip_type, lsm_data_var, 'gage')
         gssha_data_var_name = self.netcdf_attributes[gssha_precip_type]['gssha_name']
-        self.data = self.data.lsm.to_projection(gssha_data_var_name,
-                                                projection=self.gssha_grid.projection)
+        # the gages stay at the pixel centers of the LSM grid
+        self._project_data(gssha_data_var_name, regrid=False)
 
         #LOOP THROUGH TIME
         with io_open(out_gage_file, 'w') as gage_file:
@@ -925,18 +1211,44 @@ class GRIDtoGSSHA(object):
             else:
                 gage_file.write(u"EVENT \"Event of {0}\"\n".format(self._time_to_string(self.data.lsm.datetime[0])))
             gage_file.write(u"NRPDS {0}\n".format(self.data.dims['time']))
-            gage_file.write(u"NRGAG {0}\n".format(self.data.dims['x']*self.data.dims['y']))
             y_coords, x_coords = self.data.lsm.coords
-            for y_idx in range(self.data.dims['y']):
-                for x_idx in range(self.data.dims['x']):
-                    coord_idx = y_idx*self.data.dims['x'] + x_idx
-                    gage_file.write(u"COORD {0} {1} \"center of pixel #{2}\"\n".format(x_coords[y_idx, x_idx],
-                                                                                       y_coords[y_idx, x_idx],
-                                                                                       coord_idx))
-            for time_idx in range(self.data.dims['time']):
-                date_str = self._time_to_string(self.data.lsm.datetime[time_idx])
-                data_str = " ".join(self.data[gssha_data_var_name][time_idx].values.ravel().astype(str))
-                gage_file.write(u"{0} {1} {2}\n".format(precip_type, date_str, data_str))
+            gage_indices = np.arange(y_coords.size)
+            if gage_selection:
+                gage_indices = self._select_precip_gages(y_coords, x_coords,
+                                                         gage_selection, search_radius)
+            gage_file.write(u"NRGAG {0}\n".format(len(gage_indices)))
+            for coord_idx, x_coord, y_coord in zip(gage_indices,
+                                                   x_coords.ravel()[gage_indices],
+                                                   y_coords.ravel()[gage_indices]):
+                gage_file.write(u"COORD {0} {1} \"center of pixel #{2}\"\n".format(x_coord,
+                                                                                   y_coord,
+                                                                                   coord_idx))
+            # stream the rows one time block at a time
+            for start, (block,) in self._iter_time_blocks([gssha_data_var_name]):
+                block = block.reshape(block.shape[0], -1)[:, gage_indices]
+                date_strs = [self._time_to_string(self.data.lsm.datetime[start + block_idx])
+                             for block_idx in range(block.shape[0])]
+                gage_file.write(format_gage_rows(precip_type, date_strs, block, precision))
+
+    def _select_precip_gages(self, y_coords, x_coords, gage_selection, search_radius=None):
+        """
+        This function gets the indices of the pixels that influence
+        the cells inside of the watershed mask
+        """
+        mask = self.gssha_grid.np_array()
+        cell_y, cell_x = grid_cell_coords(self.gssha_grid.geotransform,
+                                          self.gssha_grid.x_size,
+                                          self.gssha_grid.y_size)
+        if search_radius is None and y_coords.shape[0] > 1 and y_coords.shape[1] > 1:
+            search_radius = np.hypot(x_coords[1, 1] - x_coords[0, 0],
+                                     y_coords[1, 1] - y_coords[0, 0])
+
+        gage_indices = select_gages(x_coords, y_coords,
+                                    cell_x[mask != 0], cell_y[mask != 0],
+                                    method=gage_selection,
+                                    search_radius=search_radius)
+        log.info("Writing {0} of {1} pixels as gages".format(len(gage_indices), y_coords.size))
+        return gage_indices
 
     def _write_hmet_card_file(self, hmet_card_file_path, main_output_folder):
         """
@@ -950,7 +1262,11 @@ class GRIDtoGSSHA(object):
 
 
     def lsm_data_to_arc_ascii(self, data_var_map_array,
-                                    main_output_folder=""):
+                                    main_output_folder="",
+                                    fast_writer=False,
+                                    num_workers=1,
+                                    pool_type='thread',
+                                    single_pass=False):
         """Writes extracted data to Arc ASCII file format into folder
         to be read in by GSSHA. Also generates the HMET_ASCII card file
         for GSSHA in the folder named 'hmet_file_list.txt'.
@@ -968,6 +1284,12 @@ class GRIDtoGSSHA(object):
             main_output_folder(Optional[str]): This is the path to place the generated ASCII files.
                                         If not included, it defaults to
                                         os.path.join(self.gssha_project_folder, "hmet_ascii_data").
+            fast_writer(Optional[bool]): If True, the header is formatted once per variable and the grids are
+                                         formatted with NumPy instead of being written with GDAL. Default is False.
+            num_workers(Optional[int]): Number of workers writing the files with the fast writer. Default is 1.
+            pool_type(Optional[str]): Type of the pool of workers, 'thread' or 'process'. Default is 'thread'.
+            single_pass(Optional[bool]): If True, all of the variables are converted first and the files of
+                                         each time step are written together with the fast writer. Default is False.
 
         GRIDtoGSSHA Example:
 
@@ -1047,6 +1369,21 @@ class GRIDtoGSSHA(object):
         log.info("Outputting HMET data to {0}".format(main_output_folder))
 
         #PART 2: DATA
+        if fast_writer or single_pass:
+            self._write_arc_ascii_fast(data_var_map_array, main_output_folder,
+                                       num_workers, pool_type, single_pass)
+        else:
+            self._write_arc_ascii_gdal(data_var_map_array, main_output_folder)
+
+        #PART 3: HMET_ASCII card input file with ASCII file list
+        hmet_card_file_path = path.join(main_output_folder, 'hmet_file_list.txt')
+        self._write_hmet_card_file(hmet_card_file_path, main_output_folder)
+
+    def _write_arc_ascii_gdal(self, data_var_map_array, main_output_folder):
+        """
+        This function writes the Arc ASCII files of each variable
+        and time step with GDAL
+        """
         for data_var_map in data_var_map_array:
             gssha_data_var, lsm_data_var = data_var_map
             gssha_data_hmet_name = self.netcdf_attributes[gssha_data_var]['hmet_name']
@@ -1054,11 +1391,10 @@ class GRIDtoGSSHA(object):
 
             self._load_converted_gssha_data_from_lsm(gssha_data_var, lsm_data_var, 'ascii')
             self._convert_data_to_hourly(gssha_data_var_name)
-            self.data = self.data.lsm.to_projection(gssha_data_var_name,
-                                                    projection=self.gssha_grid.projection)
+            self._project_data(gssha_data_var_name)
 
-            for time_idx in range(self.data.dims['time']):
-                arr_grid = ArrayGrid(in_array=self.data[gssha_data_var_name][time_idx].values,
+            for time_idx, time_values in self._iter_time_steps(gssha_data_var_name):
+                arr_grid = ArrayGrid(in_array=time_values,
                                      wkt_projection=self.data.lsm.projection.ExportToWkt(),
                                      geotransform=self.data.lsm.geotransform,
                                      )
@@ -1066,9 +1402,48 @@ class GRIDtoGSSHA(object):
                 ascii_file_path = path.join(main_output_folder,"{0}_{1}.asc".format(date_str, gssha_data_hmet_name))
                 arr_grid.to_arc_ascii(ascii_file_path)
 
-        #PART 3: HMET_ASCII card input file with ASCII file list
-        hmet_card_file_path = path.join(main_output_folder, 'hmet_file_list.txt')
-        self._write_hmet_card_file(hmet_card_file_path, main_output_folder)
+    def _write_arc_ascii_fast(self, data_var_map_array, main_output_folder,
+                              num_workers, pool_type, single_pass):
+        """
+        This function formats the Arc ASCII files with NumPy
+        and writes them from a pool of workers
+        """
+        def convert(gssha_data_var, lsm_data_var):
+            gssha_data_var_name = self.netcdf_attributes[gssha_data_var]['gssha_name']
+            self._load_converted_gssha_data_from_lsm(gssha_data_var, lsm_data_var, 'ascii')
+            self._convert_data_to_hourly(gssha_data_var_name)
+            self._project_data(gssha_data_var_name)
+            return gssha_data_var_name
+
+        def write_blocks(writer, gssha_data_var_names, hmet_names):
+            header = arc_ascii_header(self.data.lsm.geotransform,
+                                      self.data.dims['y'],
+                                      self.data.dims['x'])
+            for start, blocks in self._iter_time_blocks(gssha_data_var_names):
+                for block_idx in range(blocks[0].shape[0]):
+                    date_str = self._time_to_string(self.data.lsm.datetime[start + block_idx], "%Y%m%d%H")
+                    writer.write([(path.join(main_output_folder, "{0}_{1}.asc".format(date_str, hmet_name)),
+                                   block[block_idx])
+                                  for hmet_name, block in zip(hmet_names, blocks)],
+                                 header)
+
+        with ArcAsciiWriter(num_workers, pool_type) as writer:
+            if single_pass:
+                datasets = []
+                gssha_data_var_names = []
+                hmet_names = []
+                for gssha_data_var, lsm_data_var in data_var_map_array:
+                    gssha_data_var_names.append(convert(gssha_data_var, lsm_data_var))
+                    hmet_names.append(self.netcdf_attributes[gssha_data_var]['hmet_name'])
+                    datasets.append(self.data)
+                self.data = xr.merge(datasets)
+                self.data.attrs = datasets[-1].attrs
+                write_blocks(writer, gssha_data_var_names, hmet_names)
+            else:
+                for gssha_data_var, lsm_data_var in data_var_map_array:
+                    write_blocks(writer,
+                                 [convert(gssha_data_var, lsm_data_var)],
+                                 [self.netcdf_attributes[gssha_data_var]['hmet_name']])
 
     def lsm_data_to_subset_netcdf(self, netcdf_file_path,
                                         data_var_map_array,
@@ -1169,13 +1544,19 @@ class GRIDtoGSSHA(object):
                 self._convert_data_to_hourly(gssha_data_var_name)
                 if resample_method:
                     self._resample_data(gssha_data_var_name)
-                else:
-                    self.data = self.data.lsm.to_projection(gssha_data_var_name,
-                                                            projection=self.gssha_grid.projection)
+                elif not self.regrid_method:
+                    self._project_data(gssha_data_var_name)
 
                 output_datasets.append(self.data)
             else:
                 raise ValueError("Invalid GSSHA variable name: {0} ...".format(gssha_var))
+
+        if self.regrid_method and not resample_method:
+            # map all variables and time steps to the GSSHA grid at once
+            self.data = xr.merge(output_datasets)
+            self._regrid_data([self.netcdf_attributes[gssha_var]['gssha_name']
+                               for gssha_var, _ in data_var_map_array])
+            output_datasets = [self.data]
         output_dataset = xr.merge(output_datasets)
         #add global attributes
         output_dataset.attrs['Convention'] = 'CF-1.6'
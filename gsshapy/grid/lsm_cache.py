@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+#  lsm_cache.py
+#  GSSHApy
+#
+#  License BSD 3-Clause
+
+from collections import OrderedDict
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class LSMDataCache(object):
+    """Least recently used cache of subset LSM variables with a memory budget.
+
+    The cache stores the arrays loaded from the LSM files so variables shared
+    by several GSSHA variables (e.g. SWDOWN for direct and diffusive radiation
+    or PSFC and T2 for pressure, temperature and relative humidity) are only
+    read from disk once. A copy is returned on every hit so the callers can
+    modify the data in place.
+
+    Attributes:
+        max_bytes(:obj:`int`): Memory budget of the cache in bytes.
+            Arrays larger than the budget are not cached. If 0, nothing
+            is cached.
+        hits(:obj:`int`): Number of requests served from the cache.
+        misses(:obj:`int`): Number of requests not found in the cache.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @property
+    def nbytes(self):
+        """Memory used by the cached arrays in bytes"""
+        return self._nbytes
+
+    def get(self, key):
+        """Return a copy of the cached data or None if it is not cached"""
+        try:
+            data = self._items.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+
+        # move to most recently used position
+        self._items[key] = data
+        self.hits += 1
+        return data.copy()
+
+    def put(self, key, data):
+        """Store data in the cache and evict the least recently used data
+        until the cache fits in the memory budget"""
+        nbytes = data.nbytes
+        if nbytes > self.max_bytes:
+            log.debug("LSM data {0} ({1} bytes) is larger than the cache "
+                      "budget ({2} bytes). Not cached.".format(key, nbytes, self.max_bytes))
+            return
+
+        if key in self._items:
+            self._nbytes -= self._items.pop(key).nbytes
+
+        while self._items and self._nbytes + nbytes > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+        self._items[key] = data.copy()
+        self._nbytes += nbytes
+
+    def clear(self):
+        """Remove all data from the cache"""
+        self._items.clear()
+        self._nbytes = 0
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+#  lsm_disk_cache.py
+#  GSSHApy
+#
+#  License BSD 3-Clause
+
+from hashlib import sha1
+from io import open as io_open
+import json
+import logging
+from os import makedirs, path, remove, rename
+import time
+
+import numpy as np
+from past.builtins import basestring
+import xarray as xr
+
+log = logging.getLogger(__name__)
+
+__all__ = ['LSMSubsetDiskCache',
+           'file_fingerprint']
+
+# name of the cached variable in the NetCDF files
+DATA_VAR = 'lsm_subset_data'
+INDEX_FILE = 'index.json'
+
+
+def file_fingerprint(file_path):
+    """Values identifying the version of a source file without reading it
+
+    Args:
+        file_path(:obj:`str`): Path to the file.
+
+    Returns:
+        tuple: Absolute path, size in bytes and modification time.
+    """
+    file_stat = path.getsize(file_path), path.getmtime(file_path)
+    return path.abspath(file_path), int(file_stat[0]), repr(file_stat[1])
+
+
+def _serializable_attrs(attrs):
+    """Attributes that can be written to a NetCDF file"""
+    return dict((name, value) for name, value in attrs.items()
+                if isinstance(value, (basestring, bytes, int, float,
+                                      np.number, np.ndarray)))
+
+
+class LSMSubsetDiskCache(object):
+    """Least recently used cache on disk of subset LSM variables.
+
+    Each entry is the subset of one variable from one source file stored
+    as a compressed NetCDF file, so repeated conversions over overlapping
+    time windows of the same archive only read the new files from the
+    source. The keys include the fingerprint of the source file, so
+    modified files are read again.
+
+    The access times updated by :meth:`get` are only saved to the index
+    by :meth:`flush` or the next :meth:`put`.
+
+    Attributes:
+        cache_dir(:obj:`str`): Directory of the cache.
+        max_bytes(:obj:`int`): Size budget of the cache files in bytes. The
+            least recently used entries are removed to stay in the budget.
+        hits(:obj:`int`): Number of requests served from the cache.
+        misses(:obj:`int`): Number of requests not found in the cache.
+    """
+    def __init__(self, cache_dir, max_bytes=10*1024**3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        try:
+            makedirs(cache_dir)
+        except OSError:
+            pass
+        self._index = self._read_index()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return self._key_hash(key) in self._index
+
+    @property
+    def nbytes(self):
+        """Size of the cache files in bytes"""
+        return sum(entry['nbytes'] for entry in self._index.values())
+
+    @staticmethod
+    def _key_hash(key):
+        return sha1(repr(key).encode('utf-8')).hexdigest()
+
+    def _read_index(self):
+        index_path = path.join(self.cache_dir, INDEX_FILE)
+        try:
+            with io_open(index_path, 'r') as index_file:
+                index = json.load(index_file)
+        except (IOError, ValueError):
+            return {}
+        # drop entries with missing files
+        return dict((key_hash, entry) for key_hash, entry in index.items()
+                    if path.exists(path.join(self.cache_dir, entry['file'])))
+
+    def _write_index(self):
+        index_path = path.join(self.cache_dir, INDEX_FILE)
+        index_path_temp = "{0}_tmp".format(index_path)
+        with io_open(index_path_temp, 'wb') as index_file:
+            index_file.write(json.dumps(self._index).encode('utf-8'))
+        try:
+            remove(index_path)
+        except OSError:
+            pass
+        rename(index_path_temp, index_path)
+        self._dirty = False
+
+    def flush(self):
+        """Save the access times updated since the index was last written"""
+        if self._dirty:
+            self._write_index()
+
+    def get(self, key):
+        """Return the cached data loaded in memory or None if it is not cached"""
+        key_hash = self._key_hash(key)
+        entry = self._index.get(key_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            with xr.open_dataset(path.join(self.cache_dir, entry['file'])) as cached:
+                data = cached[DATA_VAR].load()
+        except (IOError, OSError, RuntimeError, KeyError):
+            log.warning("Unable to read cached LSM data {0}. "
+                        "Removing it from the cache.".format(entry['file']))
+            self._remove(key_hash)
+            self._dirty = True
+            self.misses += 1
+            return None
+
+        data.name = entry.get('name')
+        entry['last_access'] = time.time()
+        self._dirty = True
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store data in the cache and remove the least recently used data
+        until the cache fits in the size budget"""
+        key_hash = self._key_hash(key)
+        file_name = "{0}.nc".format(key_hash)
+        file_path = path.join(self.cache_dir, file_name)
+
+        cached = data.copy()
+        cached.attrs = _serializable_attrs(data.attrs)
+        for coord_name in cached.coords:
+            cached[coord_name].attrs = _serializable_attrs(cached[coord_name].attrs)
+        cached.to_dataset(name=DATA_VAR).to_netcdf(
+            file_path, encoding={DATA_VAR: {'zlib': True, 'complevel': 4}})
+
+        nbytes = path.getsize(file_path)
+        if nbytes > self.max_bytes:
+            log.debug("LSM data {0} ({1} bytes) is larger than the cache "
+                      "budget ({2} bytes). Not cached.".format(key, nbytes, self.max_bytes))
+            remove(file_path)
+            return
+
+        self._index[key_hash] = {'file': file_name,
+                                 'nbytes': nbytes,
+                                 'last_access': time.time(),
+                                 'name': data.name,
+                                 'key': repr(key)}
+
+        total = self.nbytes
+        for evict_hash in sorted(self._index, key=lambda idx: self._index[idx]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if evict_hash != key_hash:
+                total -= self._index[evict_hash]['nbytes']
+                self._remove(evict_hash)
+        self._write_index()
+
+    def _remove(self, key_hash):
+        entry = self._index.pop(key_hash)
+        try:
+            remove(path.join(self.cache_dir, entry['file']))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all data from the cache"""
+        for key_hash in list(self._index):
+            self._remove(key_hash)
+        self._write_index()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+#  precip_gage.py
+#  GSSHApy
+#
+#  License BSD 3-Clause
+
+import logging
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+__all__ = ['select_gages',
+           'format_gage_rows']
+
+GAGE_SELECTION_METHODS = ('thiessen', 'inverse_distance')
+
+# number of cell to gage distances computed per block
+_BLOCK_DISTANCES = 2**22
+
+
+def select_gages(gage_x, gage_y, cell_x, cell_y,
+                 method='thiessen', search_radius=None):
+    """Select the gages that influence the active cells of the watershed
+
+    Args:
+        gage_x(array-like): X coordinates of the gages.
+        gage_y(array-like): Y coordinates of the gages.
+        cell_x(array-like): X coordinates of the centers of the active
+            (non-zero WATERSHED_MASK) cells in the same projection.
+        cell_y(array-like): Y coordinates of the active cell centers.
+        method(Optional[:obj:`str`]): 'thiessen' keeps the gages that are the
+            nearest gage of at least one active cell (RAIN_THIESSEN).
+            'inverse_distance' also keeps the gages within search_radius of
+            an active cell (RAIN_INV_DISTANCE). Default is 'thiessen'.
+        search_radius(Optional[float]): Distance from the active cells within
+            which gages are kept with the inverse_distance method.
+
+    Returns:
+        :obj:`numpy.ndarray`: Indices of the selected gages in ascending order.
+    """
+    if method not in GAGE_SELECTION_METHODS:
+        raise ValueError("Invalid gage selection method: {0}. Valid methods include: {1}"
+                         .format(method, GAGE_SELECTION_METHODS))
+    if method == 'inverse_distance' and search_radius is None:
+        raise ValueError("A search radius is required for the inverse_distance method.")
+
+    gage_x = np.ravel(gage_x).astype(np.float64)
+    gage_y = np.ravel(gage_y).astype(np.float64)
+    cell_x = np.ravel(cell_x).astype(np.float64)
+    cell_y = np.ravel(cell_y).astype(np.float64)
+
+    selected = np.zeros(len(gage_x), dtype=bool)
+    min_distance = np.full(len(gage_x), np.inf)
+    block = max(1, _BLOCK_DISTANCES // max(len(gage_x), 1))
+    for start in range(0, len(cell_x), block):
+        # squared distances with shape (cells, gages)
+        distance = (cell_x[start:start + block, np.newaxis] - gage_x) ** 2 + \
+            (cell_y[start:start + block, np.newaxis] - gage_y) ** 2
+        selected[np.argmin(distance, axis=1)] = True
+        np.minimum(min_distance, distance.min(axis=0), out=min_distance)
+
+    if method == 'inverse_distance':
+        selected |= min_distance <= search_radius ** 2
+
+    return np.flatnonzero(selected)
+
+
+def format_gage_rows(precip_type, date_strings, values, precision=None):
+    """Format the data rows of a precipitation gage file
+
+    Args:
+        precip_type(:obj:`str`): ACCUM, RADAR, or GAGES.
+        date_strings(list): Date of each row.
+        values(:obj:`numpy.ndarray`): Values with shape (rows, gages).
+        precision(Optional[int]): Number of decimals of the values. If None,
+            the values are written with full precision. Default is None.
+
+    Returns:
+        :obj:`str`: The rows.
+    """
+    values = np.asarray(values)
+    if precision is None:
+        return u"".join(u"{0} {1} {2}\n".format(precip_type, date_str, " ".join(row.astype(str)))
+                        for date_str, row in zip(date_strings, values))
+
+    value_format = u" ".join([u"%.{0}f".format(precision)] * values.shape[1])
+    rows_format = u"".join(u"{0} {1} {2}\n".format(precip_type, date_str, value_format)
+                           for date_str in date_strings)
+    return rows_format % tuple(values.astype(np.float64).ravel().tolist())
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+#
+#  regrid.py
+#  GSSHApy
+#
+#  License BSD 3-Clause
+
+import logging
+import numpy as np
+from osgeo import osr
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+log = logging.getLogger(__name__)
+
+__all__ = ['LSMRegridder',
+           'grid_cell_coords',
+           'grid_signature',
+           'transform_coords']
+
+REGRID_METHODS = ('nearest', 'bilinear', 'area')
+
+# number of values combined per block by the numpy fallback of apply
+_BLOCK_VALUES = 2**24
+
+
+def grid_cell_coords(geotransform, x_size, y_size, corners=False):
+    """Coordinates of the cell centers (or cell corners) of a GDAL grid
+
+    Args:
+        geotransform(list): GDAL geotransform of the grid.
+        x_size(int): Number of columns.
+        y_size(int): Number of rows.
+        corners(Optional[bool]): If True, returns the (y_size+1, x_size+1)
+            cell corners instead of the cell centers. Default is False.
+
+    Returns:
+        tuple: 2D arrays of the y and x coordinates.
+    """
+    offset = 0 if corners else 0.5
+    cols = np.arange(x_size + (1 if corners else 0)) + offset
+    rows = np.arange(y_size + (1 if corners else 0)) + offset
+    cols, rows = np.meshgrid(cols, rows)
+    x_coords = geotransform[0] + cols * geotransform[1] + rows * geotransform[2]
+    y_coords = geotransform[3] + cols * geotransform[4] + rows * geotransform[5]
+    return y_coords, x_coords
+
+
+def transform_coords(x_coords, y_coords, src_srs, dst_srs):
+    """Transform coordinate arrays between projections
+
+    Args:
+        x_coords(:obj:`numpy.ndarray`): X coordinates in the source projection.
+        y_coords(:obj:`numpy.ndarray`): Y coordinates in the source projection.
+        src_srs(:obj:`osr.SpatialReference`): Source projection.
+        dst_srs(:obj:`osr.SpatialReference`): Destination projection.
+
+    Returns:
+        tuple: Arrays of the x and y coordinates in the destination projection
+        with the same shape as the input.
+    """
+    src_srs = src_srs.Clone()
+    dst_srs = dst_srs.Clone()
+    # keep x/y (lon/lat) order with GDAL 3
+    if hasattr(osr, 'OAMS_TRADITIONAL_GIS_ORDER'):
+        src_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        dst_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+    transform = osr.CoordinateTransformation(src_srs, dst_srs)
+    points = np.array(transform.TransformPoints(
+        np.column_stack((np.ravel(x_coords), np.ravel(y_coords))).tolist()))
+    return (points[:, 0].reshape(np.shape(x_coords)),
+            points[:, 1].reshape(np.shape(y_coords)))
+
+
+def grid_signature(src_y, src_x, dst_geotransform, dst_shape):
+    """Values identifying the source and destination grids of a regridder
+    so saved weights are only reused for the same grids
+
+    Args:
+        src_y(:obj:`numpy.ndarray`): 2D y coordinates of the LSM subset.
+        src_x(:obj:`numpy.ndarray`): 2D x coordinates of the LSM subset.
+        dst_geotransform(list): GDAL geotransform of the GSSHA grid.
+        dst_shape(tuple): Shape (rows, columns) of the GSSHA grid.
+
+    Returns:
+        :obj:`numpy.ndarray`: The signature.
+    """
+    src_y = np.asarray(src_y, dtype=np.float64)
+    src_x = np.asarray(src_x, dtype=np.float64)
+    return np.concatenate((src_y.shape,
+                           (src_y[0, 0], src_y[-1, -1], src_x[0, 0], src_x[-1, -1]),
+                           dst_geotransform,
+                           dst_shape)).astype(np.float64)
+
+
+def _fractional_indices(src_y, src_x, y_coords, x_coords):
+    """Position of coordinates in the index space of the regular LSM grid
+    (cell k covers k-0.5 to k+0.5)"""
+    src_y = np.asarray(src_y, dtype=np.float64)
+    src_x = np.asarray(src_x, dtype=np.float64)
+    ny, nx = src_y.shape
+    col = np.zeros(np.shape(x_coords))
+    row = np.zeros(np.shape(y_coords))
+    if nx > 1:
+        col = (x_coords - src_x[0, 0]) / (src_x[0, 1] - src_x[0, 0])
+    if ny > 1:
+        row = (y_coords - src_y[0, 0]) / (src_y[1, 0] - src_y[0, 0])
+    return row, col
+
+
+def _nearest_weights(row, col, src_shape):
+    ny, nx = src_shape
+    rows = np.clip(np.rint(row), 0, ny - 1).astype(np.int64)
+    cols = np.clip(np.rint(col), 0, nx - 1).astype(np.int64)
+    return (rows * nx + cols)[:, np.newaxis], np.ones((len(rows), 1))
+
+
+def _bilinear_weights(row, col, src_shape):
+    ny, nx = src_shape
+    row0 = np.clip(np.floor(row), 0, max(ny - 2, 0)).astype(np.int64)
+    col0 = np.clip(np.floor(col), 0, max(nx - 2, 0)).astype(np.int64)
+    row1 = np.minimum(row0 + 1, ny - 1)
+    col1 = np.minimum(col0 + 1, nx - 1)
+    trow = np.clip(row - row0, 0, 1) * (row1 > row0)
+    tcol = np.clip(col - col0, 0, 1) * (col1 > col0)
+
+    indices = np.column_stack((row0 * nx + col0, row0 * nx + col1,
+                               row1 * nx + col0, row1 * nx + col1))
+    weights = np.column_stack(((1 - trow) * (1 - tcol), (1 - trow) * tcol,
+                               trow * (1 - tcol), trow * tcol))
+    return indices, weights
+
+
+def _overlap_1d(lower, upper, size):
+    """Overlap length of [lower, upper] with each cell in index space"""
+    lower = np.clip(lower, -0.5, size - 0.5)
+    upper = np.clip(upper, -0.5, size - 0.5)
+    start = np.floor(lower + 0.5).astype(np.int64)
+    span = int(np.max(np.ceil(upper + 0.5) - start)) if len(start) else 1
+    cells = start[:, np.newaxis] + np.arange(max(span, 1))
+    overlap = np.minimum(upper[:, np.newaxis], cells + 0.5) - \
+        np.maximum(lower[:, np.newaxis], cells - 0.5)
+    overlap = np.where(cells < size, np.clip(overlap, 0, None), 0)
+    return np.minimum(cells, size - 1), overlap
+
+
+def _area_weights(row_corners, col_corners, src_shape):
+    ny, nx = src_shape
+    # bounding box of each destination cell from its four corners
+    quad_rows = np.stack((row_corners[:-1, :-1], row_corners[:-1, 1:],
+                          row_corners[1:, :-1], row_corners[1:, 1:]))
+    quad_cols = np.stack((col_corners[:-1, :-1], col_corners[:-1, 1:],
+                          col_corners[1:, :-1], col_corners[1:, 1:]))
+    rows, row_overlap = _overlap_1d(quad_rows.min(axis=0).ravel(),
+                                    quad_rows.max(axis=0).ravel(), ny)
+    cols, col_overlap = _overlap_1d(quad_cols.min(axis=0).ravel(),
+                                    quad_cols.max(axis=0).ravel(), nx)
+
+    indices = (rows[:, :, np.newaxis] * nx + cols[:, np.newaxis, :])
+    weights = row_overlap[:, :, np.newaxis] * col_overlap[:, np.newaxis, :]
+    indices = indices.reshape(len(indices), -1)
+    weights = weights.reshape(len(weights), -1)
+
+    total = weights.sum(axis=1)
+    outside = total <= 0
+    if outside.any():
+        # cells that do not overlap the LSM grid use the nearest LSM cell
+        center_row = 0.25 * quad_rows.sum(axis=0).ravel()[outside]
+        center_col = 0.25 * quad_cols.sum(axis=0).ravel()[outside]
+        nearest, _ = _nearest_weights(center_row, center_col, src_shape)
+        indices[outside] = nearest
+        weights[outside] = 0
+        weights[outside, 0] = 1
+        total[outside] = 1
+    return indices, weights / total[:, np.newaxis]
+
+
+class LSMRegridder(object):
+    """Precomputed mapping weights from the LSM subset to the GSSHA grid.
+
+    The weights are stored as a sparse matrix with one row per GSSHA cell
+    and one column per LSM cell, so any number of variables and time steps
+    are mapped with a single sparse matrix-dense product. The weights are
+    computed once per grid pair and can be saved to reuse them for every
+    forecast cycle on the same grids.
+
+    Attributes:
+        rows(:obj:`numpy.ndarray`): Linear GSSHA cell index of each weight, ascending.
+        cols(:obj:`numpy.ndarray`): Linear LSM cell index of each weight.
+        weights(:obj:`numpy.ndarray`): Weights. The weights of each GSSHA cell sum to 1.
+        src_shape(tuple): Shape (rows, columns) of the LSM subset.
+        dst_shape(tuple): Shape (rows, columns) of the GSSHA grid.
+        method(:obj:`str`): Regridding method (nearest, bilinear or area).
+        signature(:obj:`numpy.ndarray`): Values identifying the grids (see :func:`grid_signature`).
+    """
+    def __init__(self, rows, cols, weights, src_shape, dst_shape,
+                 method, signature=None):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.src_shape = tuple(int(size) for size in src_shape)
+        self.dst_shape = tuple(int(size) for size in dst_shape)
+        self.method = str(method)
+        self.signature = None if signature is None \
+            else np.asarray(signature, dtype=np.float64)
+        self._matrix = None
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __repr__(self):
+        return "<LSMRegridder: method={0}, {1} -> {2}, weights={3}>" \
+            .format(self.method, self.src_shape, self.dst_shape, len(self))
+
+    @classmethod
+    def from_coords(cls, src_y, src_x, dst_y, dst_x, method='bilinear',
+                    dst_y_corners=None, dst_x_corners=None, signature=None):
+        """Compute the weights from the LSM subset coordinates and the GSSHA
+        grid coordinates in the LSM projection
+
+        The LSM subset must be a regular grid in the LSM projection.
+
+        Args:
+            src_y(:obj:`numpy.ndarray`): 2D y coordinates of the LSM cell centers.
+            src_x(:obj:`numpy.ndarray`): 2D x coordinates of the LSM cell centers.
+            dst_y(:obj:`numpy.ndarray`): 2D y coordinates of the GSSHA cell centers.
+            dst_x(:obj:`numpy.ndarray`): 2D x coordinates of the GSSHA cell centers.
+            method(Optional[:obj:`str`]): nearest, bilinear or area. Default is bilinear.
+            dst_y_corners(Optional[:obj:`numpy.ndarray`]): Y coordinates of the GSSHA
+                cell corners with one more row and column. Required for area.
+            dst_x_corners(Optional[:obj:`numpy.ndarray`]): X coordinates of the GSSHA
+                cell corners. Required for area.
+            signature(Optional[:obj:`numpy.ndarray`]): Values identifying the grids.
+
+        Returns:
+            :obj:`LSMRegridder`: The regridder.
+        """
+        if method not in REGRID_METHODS:
+            raise ValueError("Invalid regrid method: {0}. Valid methods include: {1}"
+                             .format(method, REGRID_METHODS))
+
+        src_shape = np.shape(src_y)
+        dst_shape = np.shape(dst_y)
+        if method == 'area':
+            if dst_y_corners is None or dst_x_corners is None:
+                raise ValueError("The GSSHA cell corners are required for the area method.")
+            row, col = _fractional_indices(src_y, src_x,
+                                           np.asarray(dst_y_corners, dtype=np.float64),
+                                           np.asarray(dst_x_corners, dtype=np.float64))
+            indices, weights = _area_weights(row, col, src_shape)
+        else:
+            row, col = _fractional_indices(src_y, src_x,
+                                           np.ravel(dst_y).astype(np.float64),
+                                           np.ravel(dst_x).astype(np.float64))
+            if method == 'nearest':
+                indices, weights = _nearest_weights(row, col, src_shape)
+            else:
+                indices, weights = _bilinear_weights(row, col, src_shape)
+
+        rows = np.repeat(np.arange(len(indices)), indices.shape[1])
+        keep = weights.ravel() > 0
+        return cls(rows[keep], indices.ravel()[keep], weights.ravel()[keep],
+                   src_shape, dst_shape, method, signature)
+
+    def matches(self, signature, method=None):
+        """Check if the weights were computed for the grids of a signature"""
+        if method is not None and method != self.method:
+            return False
+        if self.signature is None:
+            return False
+        signature = np.asarray(signature, dtype=np.float64)
+        return signature.shape == self.signature.shape and \
+            np.allclose(signature, self.signature, rtol=1e-9, atol=1e-6)
+
+    def to_sparse(self):
+        """Weights as a sparse matrix. Requires scipy.
+
+        Returns:
+            :obj:`scipy.sparse.csr_matrix`: Matrix with one row per GSSHA cell
+            and one column per LSM cell.
+        """
+        if sparse is None:
+            raise ImportError("scipy is required to build a sparse matrix of the weights.")
+        if self._matrix is None:
+            self._matrix = sparse.csr_matrix(
+                (self.weights, (self.rows, self.cols)),
+                shape=(int(np.prod(self.dst_shape)), int(np.prod(self.src_shape))))
+        return self._matrix
+
+    def apply(self, data):
+        """Map data from the LSM subset to the GSSHA grid
+
+        Args:
+            data(:obj:`numpy.ndarray`): Array with the LSM subset in the last
+                two dimensions, e.g. (time, y, x) or (variable, time, y, x).
+
+        Returns:
+            :obj:`numpy.ndarray`: Array with the GSSHA grid in the last two dimensions.
+        """
+        data = np.asarray(data)
+        if data.shape[-2:] != self.src_shape:
+            raise ValueError("Data shape {0} does not match the LSM subset shape {1}."
+                             .format(data.shape[-2:], self.src_shape))
+
+        lead_shape = data.shape[:-2]
+        values = data.reshape(-1, int(np.prod(self.src_shape))).T
+        if sparse is not None:
+            result = self.to_sparse().dot(values)
+        else:
+            result = self._apply_numpy(values)
+
+        return np.asarray(result).T.reshape(lead_shape + self.dst_shape)
+
+    def _apply_numpy(self, values):
+        """Sparse product of the weights with (LSM cells, n) values without scipy"""
+        num_cells = int(np.prod(self.dst_shape))
+        counts = np.bincount(self.rows, minlength=num_cells)
+        has_weights = counts > 0
+        starts = (np.cumsum(counts) - counts)[has_weights]
+        result = np.zeros((num_cells, values.shape[1]),
+                          dtype=np.result_type(values, self.weights))
+
+        block = max(1, _BLOCK_VALUES // max(len(self.weights), 1))
+        for start in range(0, values.shape[1], block):
+            stop = start + block
+            contributions = self.weights[:, np.newaxis] * values[self.cols, start:stop]
+            result[has_weights, start:stop] = np.add.reduceat(contributions, starts, axis=0)
+        return result
+
+    def save(self, weights_file):
+        """Save the weights to a NumPy .npz file to reuse them
+
+        Args:
+            weights_file(:obj:`str`): Path to the file.
+        """
+        with open(weights_file, 'wb') as out_file:
+            np.savez(out_file,
+                     rows=self.rows,
+                     cols=self.cols,
+                     weights=self.weights,
+                     src_shape=np.array(self.src_shape),
+                     dst_shape=np.array(self.dst_shape),
+                     method=np.array(self.method),
+                     signature=np.array([]) if self.signature is None else self.signature)
+
+    @classmethod
+    def load(cls, weights_file):
+        """Load weights saved with :meth:`save`
+
+        Args:
+            weights_file(:obj:`str`): Path to the file.
+
+        Returns:
+            :obj:`LSMRegridder`: The regridder.
+        """
+        with np.load(weights_file, allow_pickle=False) as saved:
+            signature = saved['signature']
+            return cls(saved['rows'],
+                       saved['cols'],
+                       saved['weights'],
+                       saved['src_shape'],
+                       saved['dst_shape'],
+                       str(saved['method']),
+                       signature if signature.size else None)
@@ -9,7 +9,6 @@
 """
 
 import logging
-import shlex
 #local
 from . import parsetools as pt
 
@@ -40,8 +39,9 @@ def mapTableChunk(key, chunk):
     valueList = []
 
     # Extract MapTable Name and Index Map Name
-    mtName = shlex.split(chunk[0])[0]
-    idxName = shlex.split(chunk[0])[1]
+    sline = pt.splitLine(chunk[0])
+    mtName = sline[0]
+    idxName = sline[1]
 
     # Check if the mapping table is valid via the
     # index map name. If now index map name, stop
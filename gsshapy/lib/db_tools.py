@@ -12,7 +12,7 @@ import logging
 import os
 import time
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 
@@ -223,6 +223,49 @@ def init_mysql_db(username, host, database, port='', password='', initTime=False
     
     return sqlalchemy_url
 
+def create_indexes(sqlalchemy_url, engine=None):
+    '''
+    Create the gsshapy lookup indexes on an existing database
+
+    Databases initialized with an older version of gsshapy do not have the
+    composite indexes declared on the models. This adds any that are missing
+    without touching the tables or the data.
+
+    Args:
+        sqlalchemy_url(str): URL of the database to update.
+        engine(Optional[sqlalchemy.engine.Engine]): Engine to use instead of
+            creating one from the url (e.g.: from init_sqlite_memory).
+
+    Returns:
+        list: Names of the indexes that were created.
+
+    Example::
+
+        from gsshapy.lib.db_tools import create_indexes
+
+        create_indexes('sqlite:////home/username/my_sqlite.db')
+    '''
+    if engine is None:
+        engine = create_engine(sqlalchemy_url)
+
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+
+    created = []
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_indexes = [index['name'] for index in inspector.get_indexes(table.name)]
+
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=engine)
+                created.append(index.name)
+
+    log.info('Created {0} indexes.'.format(len(created)))
+    return created
+
 def create_session(sqlalchemy_url, engine=None):
     '''
     Create session with database to work in
@@ -0,0 +1,280 @@
+"""
+********************************************************************************
+* Name: Grid Cell Lookup
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import numpy as np
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+__all__ = ['GridCellLookup',
+           'projectGridColumns',
+           'readGridColumns',
+           'readGridCellLookup']
+
+# Cards of the grid stream (.gst) and grid pipe (.gpi) files
+CELL_CARD = 'CELLIJ'
+NODE_CARDS = ('LINKNODE', 'SPIPE')
+
+
+class GridCellLookup(object):
+    """
+    Sparse two-way mapping between grid cells and the stream or pipe nodes of a grid stream or grid pipe file.
+
+    The entries are stored twice in compressed sparse row format: once ordered by linear cell index and once ordered by
+    link number. Finding the nodes in a cell or the cells of a link only slices the arrays, no matter how many cells the
+    file has. The linear index of cell (i, j) is ``(i - 1) * numColumns + (j - 1)``.
+
+    Use :func:`readGridCellLookup` to build the lookup from a file or
+    :meth:`gsshapy.orm.GridStreamFile.getCellLookup` to build it from the database.
+
+    Args:
+        cellI (iterable): I index of the cell of each entry.
+        cellJ (iterable): J index of the cell of each entry.
+        linkNumbers (iterable): Link number of each entry.
+        nodeNumbers (iterable): Node number of each entry.
+        fractions (iterable): Fraction of the node (stream files) or pipe length (pipe files) in the cell.
+        numColumns (int, optional): Number of columns of the model grid. Defaults to the largest J index, which is only
+            safe for cell queries. Pass the columns of the project grid (see :func:`projectGridColumns` and
+            :func:`readGridColumns`) so the linear cell indices match the grid.
+
+    Attributes:
+        cellIndices (numpy.ndarray): Linear cell index of each entry, in cell order.
+        linkNumbers (numpy.ndarray): Link number of each entry, in cell order.
+        nodeNumbers (numpy.ndarray): Node number of each entry, in cell order.
+        fractions (numpy.ndarray): Fraction of each entry, in cell order.
+        cellPointers (numpy.ndarray): Row pointers of the entries by linear cell index.
+        linkPointers (numpy.ndarray): Row pointers of ``linkOrder`` by link number.
+        linkOrder (numpy.ndarray): Entry positions ordered by link number.
+    """
+    def __init__(self, cellI, cellJ, linkNumbers, nodeNumbers, fractions, numColumns=None):
+        cellI = np.asarray(cellI, dtype=np.int64)
+        cellJ = np.asarray(cellJ, dtype=np.int64)
+
+        if numColumns is None:
+            numColumns = int(cellJ.max()) if len(cellJ) else 1
+
+        if len(cellJ) and int(cellJ.max()) > numColumns:
+            raise ValueError('Cell J index {0} is larger than the number of columns ({1}).'.format(int(cellJ.max()),
+                                                                                                   numColumns))
+
+        self.numColumns = numColumns
+        cellIndices = (cellI - 1) * numColumns + (cellJ - 1)
+
+        # Entries in cell order (stable, so the file order is kept within each cell)
+        order = np.argsort(cellIndices, kind='mergesort')
+        self.cellIndices = cellIndices[order]
+        self.linkNumbers = np.asarray(linkNumbers, dtype=np.int64)[order]
+        self.nodeNumbers = np.asarray(nodeNumbers, dtype=np.int64)[order]
+        self.fractions = np.asarray(fractions, dtype=np.float64)[order]
+
+        numCells = int(self.cellIndices.max()) + 1 if len(self.cellIndices) else 0
+        self.cellPointers = np.zeros(numCells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.cellIndices, minlength=numCells), out=self.cellPointers[1:])
+
+        # Entry positions in link order
+        numLinks = int(self.linkNumbers.max()) + 1 if len(self.linkNumbers) else 0
+        self.linkOrder = np.argsort(self.linkNumbers, kind='mergesort')
+        self.linkPointers = np.zeros(numLinks + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.linkNumbers, minlength=numLinks), out=self.linkPointers[1:])
+
+    def __len__(self):
+        return len(self.cellIndices)
+
+    def __repr__(self):
+        return '<GridCellLookup: Entries=%s, Cells=%s>' % (len(self), len(np.unique(self.cellIndices)))
+
+    def cellIndex(self, i, j):
+        """
+        Linear index of a cell.
+
+        Args:
+            i (int): I index of the cell.
+            j (int): J index of the cell.
+
+        Returns:
+            int: Linear cell index.
+        """
+        return (i - 1) * self.numColumns + (j - 1)
+
+    def cellIJ(self, cellIndices):
+        """
+        I and J indices of linear cell indices.
+
+        Args:
+            cellIndices (array-like): Linear cell indices.
+
+        Returns:
+            tuple: Arrays of I and J indices.
+        """
+        cellIndices = np.asarray(cellIndices, dtype=np.int64)
+        return cellIndices // self.numColumns + 1, cellIndices % self.numColumns + 1
+
+    def nodesInCell(self, i, j):
+        """
+        Nodes in a cell.
+
+        Args:
+            i (int): I index of the cell.
+            j (int): J index of the cell.
+
+        Returns:
+            tuple: Arrays of the link numbers, node numbers and fractions of the nodes in the cell (empty if the cell
+            has no nodes or is outside of the grid).
+        """
+        cellIndex = self.cellIndex(i, j)
+
+        if i < 1 or not 1 <= j <= self.numColumns or cellIndex >= len(self.cellPointers) - 1:
+            start = stop = 0
+        else:
+            start, stop = self.cellPointers[cellIndex], self.cellPointers[cellIndex + 1]
+
+        return self.linkNumbers[start:stop], self.nodeNumbers[start:stop], self.fractions[start:stop]
+
+    def linksInCell(self, i, j):
+        """
+        Link numbers of the links that touch a cell.
+
+        Args:
+            i (int): I index of the cell.
+            j (int): J index of the cell.
+
+        Returns:
+            numpy.ndarray: Link numbers in ascending order.
+        """
+        return np.unique(self.nodesInCell(i, j)[0])
+
+    def cellsOfLink(self, link, node=None):
+        """
+        Cells touched by a link or by one node of a link.
+
+        Args:
+            link (int): Link number.
+            node (int, optional): Node number. Defaults to all nodes of the link.
+
+        Returns:
+            tuple: Arrays of the I and J indices of the cells in ascending linear index order.
+        """
+        if not 0 <= link < len(self.linkPointers) - 1:
+            entries = self.linkOrder[0:0]
+        else:
+            entries = self.linkOrder[self.linkPointers[link]:self.linkPointers[link + 1]]
+
+        if node is not None:
+            entries = entries[self.nodeNumbers[entries] == node]
+
+        return self.cellIJ(np.unique(self.cellIndices[entries]))
+
+    def toSparse(self, numCells=None):
+        """
+        Cell by link matrix of the fractions (fractions of the same link in a cell are summed). Requires scipy.
+
+        Args:
+            numCells (int, optional): Number of rows. Defaults to the largest linear cell index plus one.
+
+        Returns:
+            scipy.sparse.csr_matrix: Matrix with one row per linear cell index and one column per link number.
+        """
+        if sparse is None:
+            raise ImportError('scipy is required to build a sparse matrix of the grid cell lookup.')
+
+        numCells = len(self.cellPointers) - 1 if numCells is None else numCells
+
+        return sparse.csr_matrix((self.fractions, (self.cellIndices, self.linkNumbers)),
+                                 shape=(numCells, len(self.linkPointers) - 1))
+
+
+def projectGridColumns(projectFile):
+    """
+    Number of columns of the model grid of a project from the COLS card or the watershed mask.
+
+    Args:
+        projectFile (:class:`gsshapy.orm.ProjectFile`): Project file or None.
+
+    Returns:
+        int or None: Number of columns or None if the project does not define it.
+    """
+    if projectFile is None:
+        return None
+
+    colsCard = projectFile.getCard('COLS')
+
+    if colsCard is not None:
+        return int(colsCard.value)
+
+    for rasterMap in projectFile.maps:
+        if rasterMap.fileExtension == 'msk' and rasterMap.columns:
+            return rasterMap.columns
+
+    return None
+
+
+def readGridColumns(path):
+    """
+    Number of columns from the header of a GRASS ASCII grid such as the watershed mask or elevation grid.
+
+    Args:
+        path (str): Path to the grid file.
+
+    Returns:
+        int: Number of columns.
+    """
+    with open(path, 'r') as f:
+        for _, line in zip(range(6), f):
+            sline = line.split()
+
+            if sline and sline[0].lower().startswith('cols'):
+                return int(sline[1])
+
+    raise ValueError('No cols in the header of the grid {0}.'.format(path))
+
+
+def readGridCellLookup(path, numColumns=None, gridPath=None):
+    """
+    Build a :class:`GridCellLookup` directly from a grid stream (.gst) or grid pipe (.gpi) file without creating any
+    ORM objects.
+
+    Args:
+        path (str): Path to the grid stream or grid pipe file.
+        numColumns (int, optional): Number of columns of the model grid.
+        gridPath (str, optional): Path to the watershed mask or elevation grid of the project. Used for the number of
+            columns if numColumns is not given. Defaults to the largest J index if neither is given.
+
+    Returns:
+        :class:`GridCellLookup`: The lookup.
+    """
+    if numColumns is None and gridPath is not None:
+        numColumns = readGridColumns(gridPath)
+
+    cellI = []
+    cellJ = []
+    linkNumbers = []
+    nodeNumbers = []
+    fractions = []
+    i = j = None
+
+    with open(path, 'r') as f:
+        for line in f:
+            sline = line.split()
+
+            if not sline:
+                continue
+
+            card = sline[0]
+
+            if card == CELL_CARD:
+                i, j = int(sline[1]), int(sline[2])
+
+            elif card in NODE_CARDS:
+                cellI.append(i)
+                cellJ.append(j)
+                linkNumbers.append(int(sline[1]))
+                nodeNumbers.append(int(sline[2]))
+                fractions.append(float(sline[3]))
+
+    return GridCellLookup(cellI, cellJ, linkNumbers, nodeNumbers, fractions, numColumns=numColumns)
@@ -0,0 +1,178 @@
+"""
+********************************************************************************
+* Name: Cross Section Hydraulics
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import numpy as np
+
+__all__ = ['HydraulicTables',
+           'trapezoidProperties',
+           'breakpointProperties',
+           'breakpointBankfullDepths']
+
+
+def trapezoidProperties(depths, bottomWidths, sideSlopes):
+    """
+    Flow area, wetted perimeter and top width of trapezoidal cross sections.
+
+    Args:
+        depths (array-like): Flow depths with one row per cross section, shape (sections, depths).
+        bottomWidths (array-like): Bottom width of each cross section.
+        sideSlopes (array-like): Side slope (horizontal:vertical) of each cross section.
+
+    Returns:
+        tuple: Area, wetted perimeter and top width arrays with the same shape as depths.
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    bottomWidths = np.asarray(bottomWidths, dtype=np.float64)[:, np.newaxis]
+    sideSlopes = np.asarray(sideSlopes, dtype=np.float64)[:, np.newaxis]
+
+    area = (bottomWidths + sideSlopes * depths) * depths
+    wettedPerimeter = bottomWidths + 2.0 * depths * np.sqrt(1.0 + sideSlopes * sideSlopes)
+    topWidth = bottomWidths + 2.0 * sideSlopes * depths
+
+    return area, wettedPerimeter, topWidth
+
+
+def breakpointProperties(depths, stations, elevations):
+    """
+    Flow area, wetted perimeter and top width of breakpoint (natural) cross sections.
+
+    Each segment between consecutive breakpoints contributes the part of it that is below the water surface. Depths
+    are measured from the lowest breakpoint of each cross section.
+
+    Args:
+        depths (array-like): Flow depths with one row per cross section, shape (sections, depths).
+        stations (array-like): Horizontal coordinate of the breakpoints, shape (sections, points). Cross sections with
+            fewer points are padded with NaN.
+        elevations (array-like): Vertical coordinate of the breakpoints, same shape and padding as stations.
+
+    Returns:
+        tuple: Area, wetted perimeter and top width arrays with the same shape as depths.
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    stations = np.asarray(stations, dtype=np.float64)
+    elevations = np.asarray(elevations, dtype=np.float64)
+
+    # Segment arrays have shape (sections, 1, segments), stages have shape (sections, depths, 1)
+    dx = np.diff(stations, axis=1)[:, np.newaxis, :]
+    dy = np.diff(elevations, axis=1)[:, np.newaxis, :]
+    valid = np.isfinite(dx) & np.isfinite(dy)
+    dx = np.where(valid, dx, 0.0)
+    dy = np.where(valid, dy, 0.0)
+
+    stage = (np.nanmin(elevations, axis=1)[:, np.newaxis] + depths)[:, :, np.newaxis]
+    h0 = stage - np.nan_to_num(elevations[:, np.newaxis, :-1])
+    h1 = stage - np.nan_to_num(elevations[:, np.newaxis, 1:])
+
+    # Fraction of each segment at or below the water surface (partially wet segments are never horizontal)
+    bothWet = (h0 >= 0.0) & (h1 >= 0.0) & valid
+    h0 = np.clip(h0, 0.0, None) * valid
+    h1 = np.clip(h1, 0.0, None) * valid
+    absDy = np.abs(dy)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        partial = np.where(absDy > 0.0, (h0 + h1) / absDy, 0.0)
+
+    wetFraction = np.where(bothWet, 1.0, np.minimum(partial, 1.0))
+    width = wetFraction * np.abs(dx)
+
+    area = (0.5 * (h0 + h1) * width).sum(axis=2)
+    wettedPerimeter = (wetFraction * np.hypot(dx, dy)).sum(axis=2)
+    topWidth = width.sum(axis=2)
+
+    return area, wettedPerimeter, topWidth
+
+
+def breakpointBankfullDepths(elevations):
+    """
+    Depth at which each breakpoint cross section overtops the lower of its two ends.
+
+    Args:
+        elevations (array-like): Vertical coordinate of the breakpoints, shape (sections, points), padded with NaN.
+
+    Returns:
+        numpy.ndarray: Bankfull depth of each cross section.
+    """
+    elevations = np.asarray(elevations, dtype=np.float64)
+    counts = np.isfinite(elevations).sum(axis=1)
+    rows = np.arange(len(elevations))
+    lastElevations = elevations[rows, np.maximum(counts - 1, 0)]
+    banks = np.minimum(elevations[:, 0], lastElevations)
+
+    return np.nan_to_num(banks - np.nanmin(elevations, axis=1))
+
+
+class HydraulicTables(object):
+    """
+    Stage-property tables of the cross sections of a stream network.
+
+    All tables have one row per link and one column per depth. The flow capacity is computed with Manning's equation
+    in SI units: ``Q = A * R^(2/3) * S^(1/2) / n``.
+
+    Use :meth:`gsshapy.orm.ChannelInputFile.getHydraulicTables` to build the tables from the database.
+
+    Args:
+        linkNumbers (array-like): Link number of each row.
+        depth (array-like): Flow depths, shape (links, depths).
+        area (array-like): Flow area at each depth.
+        wettedPerimeter (array-like): Wetted perimeter at each depth.
+        topWidth (array-like): Top width at each depth.
+        manningsN (array-like): Manning's roughness of each link.
+        slopes (array-like): Bed slope of each link.
+
+    Attributes:
+        linkNumbers (numpy.ndarray): Link number of each row.
+        depth (numpy.ndarray): Flow depths.
+        area (numpy.ndarray): Flow area.
+        wettedPerimeter (numpy.ndarray): Wetted perimeter.
+        topWidth (numpy.ndarray): Top width.
+        hydraulicRadius (numpy.ndarray): Flow area divided by wetted perimeter (0 where the channel is dry).
+        conveyance (numpy.ndarray): Manning conveyance, ``A * R^(2/3) / n``.
+        capacity (numpy.ndarray): Manning flow capacity.
+        manningsN (numpy.ndarray): Manning's roughness of each link.
+        slopes (numpy.ndarray): Bed slope of each link.
+    """
+    PROPERTIES = ('depth', 'area', 'wettedPerimeter', 'topWidth', 'hydraulicRadius', 'conveyance', 'capacity')
+
+    def __init__(self, linkNumbers, depth, area, wettedPerimeter, topWidth, manningsN, slopes):
+        self.linkNumbers = np.asarray(linkNumbers, dtype=np.int64)
+        self.depth = np.asarray(depth, dtype=np.float64)
+        self.area = np.asarray(area, dtype=np.float64)
+        self.wettedPerimeter = np.asarray(wettedPerimeter, dtype=np.float64)
+        self.topWidth = np.asarray(topWidth, dtype=np.float64)
+        self.manningsN = np.asarray(manningsN, dtype=np.float64)
+        self.slopes = np.asarray(slopes, dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.hydraulicRadius = np.where(self.wettedPerimeter > 0.0, self.area / self.wettedPerimeter, 0.0)
+            self.conveyance = self.area * self.hydraulicRadius ** (2.0 / 3.0) / self.manningsN[:, np.newaxis]
+
+        self.capacity = self.conveyance * np.sqrt(self.slopes)[:, np.newaxis]
+        self._rows = dict((linkNumber, row) for row, linkNumber in enumerate(self.linkNumbers.tolist()))
+
+    def __len__(self):
+        return len(self.linkNumbers)
+
+    def __repr__(self):
+        return '<HydraulicTables: Links=%s, Depths=%s>' % (len(self), self.depth.shape[1] if self.depth.ndim > 1 else 0)
+
+    def table(self, link):
+        """
+        Stage-property table of a single link.
+
+        Args:
+            link (int): Link number.
+
+        Returns:
+            dict: Array of each property (depth, area, wettedPerimeter, topWidth, hydraulicRadius, conveyance and
+            capacity) versus depth.
+        """
+        try:
+            row = self._rows[link]
+        except KeyError:
+            raise IndexError('Link {0} does not have a cross section.'.format(link))
+
+        return dict((name, getattr(self, name)[row]) for name in self.PROPERTIES)
@@ -0,0 +1,100 @@
+"""
+********************************************************************************
+* Name: KML Stream Writer
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import io
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from zipfile import ZipFile, ZIP_DEFLATED
+
+KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+
+
+class KmlStreamWriter(object):
+    """
+    Write a KML document one element at a time.
+
+    Elements are serialized and written to the file as soon as they are passed to :meth:`write`, so only one
+    placemark is held in memory at a time. If the path ends with ``.kmz`` (or ``kmz`` is True) the KML is written
+    to a temporary file and then stored in a KMZ archive with zlib (deflate) compression.
+
+    Args:
+        path (str): Path to the KML or KMZ file.
+        documentName (str, optional): Name of the KML document.
+        kmz (bool, optional): Write a KMZ archive. Defaults to True if the path ends with ``.kmz``.
+
+    Example::
+
+        with KmlStreamWriter('network.kmz', documentName='Stream Network') as writer:
+            for link in links:
+                writer.write(makePlacemark(link))
+    """
+    def __init__(self, path, documentName=None, kmz=None):
+        self.path = path
+        self.documentName = documentName
+        self.kmz = path.lower().endswith('.kmz') if kmz is None else kmz
+        self._file = None
+        self._kmlPath = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def open(self):
+        """
+        Open the file and write the start of the document
+        """
+        if self.kmz:
+            fd, self._kmlPath = tempfile.mkstemp(suffix='.kml')
+            self._file = io.open(fd, 'wb')
+        else:
+            self._file = io.open(self.path, 'wb')
+
+        self._file.write('<kml xmlns="{0}"><Document>'.format(KML_NAMESPACE).encode('ascii'))
+
+        if self.documentName is not None:
+            docName = ET.Element('name')
+            docName.text = self.documentName
+            self.write(docName)
+
+    def write(self, element):
+        """
+        Serialize an element of the KML document (e.g.: a Placemark or Style) and write it to the file.
+
+        Args:
+            element (:class:`xml.etree.ElementTree.Element`): Element that will be added to the Document element.
+        """
+        self._file.write(ET.tostring(element))
+
+    def close(self):
+        """
+        Write the end of the document and close the file. KMZ archives are created at this point.
+        """
+        self._file.write(b'</Document></kml>')
+        self._file.close()
+
+        if self.kmz:
+            try:
+                with ZipFile(self.path, 'w', ZIP_DEFLATED) as kmz:
+                    kmz.write(self._kmlPath, 'doc.kml')
+            finally:
+                os.remove(self._kmlPath)
+
+    def _discard(self):
+        """
+        Close the file without completing the document
+        """
+        self._file.close()
+
+        if self.kmz:
+            os.remove(self._kmlPath)
@@ -18,12 +18,36 @@ log = logging.getLogger(__name__)
 # CONSTANTS
 REPLACE_NO_VALUE = -999999
 
+# Tokens are runs of unquoted characters and quoted strings
+TOKEN_PATTERN = re.compile(r'''(?:"[^"]*"|'[^']*'|[^\s"'])+''')
+TOKEN_PART_PATTERN = re.compile(r'''"([^"]*)"|'([^']*)'|([^"']+)''')
+# Lines where every quote is closed
+BALANCED_QUOTES_PATTERN = re.compile(r'''(?:"[^"]*"|'[^']*'|[^"'])*\Z''')
+
+
 def splitLine(line):
     """
     Split lines read from files and preserve
     paths and strings.
+
+    Produces the same tokens as shlex.split. Lines without quotes
+    or backslashes are split with str.split and lines with balanced
+    quotes with a compiled regular expression. Lines with backslash
+    escapes or unbalanced quotes are handed to shlex.
     """
-    splitLine = shlex.split(line)
+    if '"' not in line and "'" not in line and '\\' not in line:
+        return line.split()
+
+    if '\\' in line or not BALANCED_QUOTES_PATTERN.match(line):
+        return shlex.split(line)
+
+    splitLine = []
+
+    for token in TOKEN_PATTERN.findall(line):
+        if '"' in token or "'" in token:
+            token = ''.join(''.join(part) for part in TOKEN_PART_PATTERN.findall(token))
+        splitLine.append(token)
+
     return splitLine
 
 
@@ -69,6 +93,34 @@ def chunk(keywords, lines):
     return chunks
 
 
+def iter_chunks(keywords, fileobj):
+    """
+    Generator version of chunk(). Yields (keyword, lines) tuples one chunk at a time in file
+    order, so only the current chunk is held in memory. Lines before the first keyword are
+    skipped, as in chunk().
+
+    Args:
+        keywords (iterable): Key words that start a new chunk.
+        fileobj (iterable): Open file object or other iterable of lines.
+    """
+    keyword = None
+    chunk = []
+
+    for line in fileobj:
+        if line.strip():
+            token = line.split()[0]
+            if token in keywords:
+                if keyword is not None:
+                    yield keyword, chunk
+                keyword = token
+                chunk = [line]
+            elif keyword is not None:
+                chunk.append(line)
+
+    if keyword is not None:
+        yield keyword, chunk
+
+
 def valueReadPreprocessor(valueString, replaceParamsFile=None):
     """
     Apply global pre-processing to values during reading throughout the project.
@@ -95,10 +147,10 @@ def valueReadPreprocessor(valueString, replaceParamsFile=None):
             processedValue = '{0}'.format(REPLACE_NO_VALUE)
 
             # Find the matching parameter and return the negative of the id
-            for targetParam in replaceParamsFile.targetParameters:
-                if targetParam.targetVariable == valueString:
-                    processedValue = '{0}'.format(-1 * targetParam.id)
-                    break
+            parameterID = replaceParamsFile.getTargetParameterID(valueString)
+
+            if parameterID is not None:
+                processedValue = '{0}'.format(-1 * parameterID)
 
     return processedValue
 
@@ -134,10 +186,10 @@ def valueWritePreprocessor(valueString, replaceParamsFile=None):
                     parameterID = number * -1
 
                     # Find the matching parameter
-                    for targetParam in replaceParamsFile.targetParameters:
-                        if targetParam.id == parameterID:
-                            variableString = targetParam.targetVariable
-                            break
+                    targetVariable = replaceParamsFile.getTargetVariable(parameterID)
+
+                    if targetVariable is not None:
+                        variableString = targetVariable
             except:
                 pass
 
@@ -0,0 +1,223 @@
+'''
+********************************************************************************
+* Name: Project File Chunk
+* Author: Nathan Swain
+* Created On: Mar 18, 2013
+* Copyright: (c) Brigham Young University 2013
+* License: BSD 2-Clause
+********************************************************************************
+'''
+import os
+import re
+
+from . import parsetools as pt
+
+# Headers to ignore
+HEADERS = ('GSSHAPROJECT',)
+
+# WMS Cards to include (don't discount as comments)
+WMS_CARDS = ('#INDEXGRID_GUID', '#PROJECTION_FILE', '#LandSoil',
+             '#CHANNEL_POINT_INPUT_WMS')
+
+GSSHAPY_CARDS = ('#GSSHAPY_EVENT_YML', )
+
+# Cards that must be written in certain order
+PRIORITY_CARDS = ('WMS', 'MASK_WATERSHED', 'REPLACE_LINE',
+                  'REPLACE_PARAMS', 'REPLACE_VALS', 'REPLACE_FOLDER')
+
+
+def projectChunk(lines, force_relative=True):
+    '''
+    Parse the lines of a project file into a list of card dictionaries
+    '''
+    cards = []
+
+    for line in lines:
+        if not line.strip():
+            # Skip empty lines
+            continue
+
+        elif '#' in line.split()[0] and line.split()[0] \
+                not in WMS_CARDS + GSSHAPY_CARDS:
+            # Skip comments designated by the hash symbol
+            # (with the exception of WMS_CARDS and GSSHAPY_CARDS)
+            continue
+
+        try:
+            card = cardChunk(line, force_relative)
+
+        except:
+            card = directoryCardChunk(line, force_relative)
+
+        if card['name'] not in HEADERS:
+            cards.append(card)
+
+    return cards
+
+
+def cardChunk(projectLine, force_relative=True):
+    '''
+    Parse a single project file card line
+    '''
+    DIRECTORY_PATHS = ('REPLACE_FOLDER',)
+
+    splitLine = pt.splitLine(projectLine)
+    cardName = splitLine[0]
+
+    # pathSplit will fail on boolean cards (no value
+    # = no second parameter in list (currLine[1])
+    try:
+        # Split the path by / or \\ and retrieve last
+        # item to store relative paths as Card Value
+        pathSplit = re.split('/|\\\\', splitLine[1])
+
+        try:
+            # If the value is able to be converted to a
+            # float (any number) then store value only.
+            # Store all values if there are multiple.
+            float(pathSplit[-1])
+            cardValue = ' '.join(splitLine[1:])
+        except:
+            # A string will throw an exception with an attempt to
+            # convert to float. In this case wrap the string
+            # in double quotes.
+            if cardName == 'WMS' or not force_relative:
+                cardValue = ' '.join(splitLine[1:])
+            elif '.' in pathSplit[-1]:
+                if cardName == '#INDEXGRID_GUID':
+                    try:
+                        # Get WMS ID for Index Map as part of value
+                        cardValue = '"%s" "%s"' % (pathSplit[-1], splitLine[2])
+                    except:
+                        # Like normal if the ID isn't there
+                        cardValue = '"%s"' % pathSplit[-1]
+                else:
+                    # If the string contains a '.' it is a path: wrap in double quotes
+                    cardValue = '"%s"' % pathSplit[-1]
+            elif pathSplit[-1] == '':
+                # For directory cards with unix run through
+                # directoryCardChunk() to extract relative
+                # path to the directory.
+                cardValue = directoryCardChunk(projectLine)['value']
+
+            elif cardName in DIRECTORY_PATHS:
+                cardValue = '"%s"' % pathSplit[-1]
+            else:
+                # Else it is a card name/option don't wrap in quotes
+                cardValue = pathSplit[-1]
+
+    # For boolean cards store None
+    except:
+        cardValue = None
+
+    return {'name': cardName, 'value': cardValue}
+
+
+def directoryCardChunk(projectLine, force_relative=True):
+    '''
+    Parse a single project file directory card line
+    '''
+    PROJECT_PATH = ('PROJECT_PATH')
+
+    # Handle special case with directory cards in windows.
+    # shlex.split fails because windows directory cards end
+    # with an escape character. (e.g.: "this\path\ends\with\escape\")
+    currLine = projectLine.strip().split()
+
+    # Extract Card Name from the first item in the list
+    cardName = currLine[0]
+    preValue = currLine[1].strip('"').strip("'")
+
+    if not force_relative:
+        cardValue = preValue
+    else:
+        if cardName in PROJECT_PATH:
+            # Project as relative is the current directory (empty string)
+            cardValue = '""'
+        else:
+            # Pull only the last directory to make it relative
+            if preValue.endswith('/'):
+                splath = preValue.split('/')
+                dirname = splath[-2]
+
+            elif preValue.endswith('\\\\'):
+                splath = preValue.split('\\\\')
+                dirname = splath[-2]
+
+            elif preValue.endswith('\\'):
+                splath = preValue.split('\\')
+                dirname = splath[-2]
+
+            else:
+                dirname = os.path.basename(preValue)
+
+            # Eliminate slashes to make it OS agnostic
+            basename = dirname.replace('\\', '')
+            cardValue = '"%s"' % basename.replace('/', '')
+
+    return {'name': cardName, 'value': cardValue}
+
+
+def cardLine(name, value, originalPrefix, newPrefix=None):
+    '''
+    Format a project card as it would be written to the project file
+    '''
+    # Determine number of spaces between card and value for nice alignment
+    numSpaces = 25 - len(name)
+
+    # Handle special case of booleans
+    if value is None:
+        line = '%s\n' % name
+    else:
+        if name == 'WMS':
+            line = '%s %s\n' % (name, value)
+        elif newPrefix is None:
+            line = '%s%s%s\n' % (name, ' ' * numSpaces, value)
+        elif originalPrefix in value:
+            line = '%s%s%s\n' % (name, ' ' * numSpaces, value.replace(originalPrefix, newPrefix))
+        else:
+            line = '%s%s%s\n' % (name, ' ' * numSpaces, value)
+    return line
+
+
+def newFilename(filename, originalProjectName, name):
+    '''
+    Determine the filename of a project file when the project is written with a new name
+    '''
+    # Variables
+    pro = False
+    originalFilename = filename
+    originalPrefix = originalFilename.split('.')[0]
+    extension = originalFilename.split('.')[1]
+
+    # Special case with projection file
+    if '_prj' in originalPrefix:
+        originalPrefix = originalPrefix.split('_')[0]
+        pro = True
+
+    # Handle new name
+    if name is None:
+        # The project name is not changed and file names
+        # stay the same
+        filename = originalFilename
+
+    elif originalPrefix == originalProjectName and pro:
+        # Handle renaming of projection file
+        filename = '%s_prj.%s' % (name, extension)
+
+    elif originalPrefix == originalProjectName:
+        # This check is necessary because not all filenames are
+        # prefixed with the project name. Thus the file prefix
+        # is only changed for files that are prefixed with the
+        # project name
+        filename = '%s.%s' % (name, extension)
+
+    elif originalProjectName in originalPrefix:
+        filename = '%s%s.%s' % (name, originalPrefix.replace(originalProjectName, ''), extension)
+
+    else:
+        # Filename doesn't change for files that don't share the
+        # project prefix. e.g.: hmet.hmt
+        filename = originalFilename
+
+    return filename
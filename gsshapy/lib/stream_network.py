@@ -0,0 +1,237 @@
+"""
+********************************************************************************
+* Name: Stream Network Graph
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import numpy as np
+
+__all__ = ['StreamNetworkGraph']
+
+# Link type keywords of fluvial links (see ChannelInputFile.getFluvialLinks)
+FLUVIAL_TYPE_KEYWORDS = ('TRAPEZOID', 'TRAP', 'BREAKPOINT', 'ERODE', 'SUBSURFACE')
+STRUCTURE_TYPES = ('STRUCTURE',)
+RESERVOIR_TYPES = ('RESERVOIR', 'LAKE')
+
+
+class StreamNetworkGraph(object):
+    """
+    Compact array view of the connectivity of a stream network.
+
+    All arrays are indexed by link number. Index 0 does not belong to a link: a downstream link number of 0 marks an
+    outlet. The upstream links of link ``l`` are ``upstreamIndices[upstreamPointers[l]:upstreamPointers[l + 1]]``
+    (compressed sparse row adjacency).
+
+    Use :meth:`gsshapy.orm.ChannelInputFile.getStreamNetworkGraph` to build the graph from the database.
+
+    Args:
+        linkNumbers (iterable): Link number of each link.
+        downstreamLinks (iterable): Downstream link number of each link (0 for outlets).
+        linkTypes (iterable, optional): Link type of each link (e.g.: 'TRAPEZOID', 'STRUCTURE', 'RESERVOIR').
+        lengths (iterable, optional): Length of each link.
+
+    Attributes:
+        linkNumbers (numpy.ndarray): Link numbers of the links in the network in ascending order.
+        downstream (numpy.ndarray): Downstream link number of each link.
+        upstreamPointers (numpy.ndarray): Row pointers of the upstream adjacency.
+        upstreamIndices (numpy.ndarray): Upstream link numbers ordered by downstream link.
+        exists (numpy.ndarray): True for link numbers that belong to the network.
+        fluvial (numpy.ndarray): True for fluvial (cross section) links.
+        structure (numpy.ndarray): True for structure links.
+        reservoir (numpy.ndarray): True for reservoir and lake links.
+        types (list): Link type of each link.
+        lengths (numpy.ndarray): Length of each link.
+    """
+    def __init__(self, linkNumbers, downstreamLinks, linkTypes=None, lengths=None):
+        linkNumbers = np.asarray(linkNumbers, dtype=np.int64)
+        downstreamLinks = np.asarray(downstreamLinks, dtype=np.int64)
+        size = int(linkNumbers.max()) + 1 if len(linkNumbers) else 1
+
+        self.exists = np.zeros(size, dtype=bool)
+        self.exists[linkNumbers] = True
+        self.linkNumbers = np.flatnonzero(self.exists)
+
+        # Links that drain to a link outside of the network are outlets
+        self.downstream = np.zeros(size, dtype=np.int64)
+        inNetwork = (downstreamLinks > 0) & (downstreamLinks < size)
+        inNetwork[inNetwork] = self.exists[downstreamLinks[inNetwork]]
+        self.downstream[linkNumbers] = np.where(inNetwork, downstreamLinks, 0)
+
+        # Upstream adjacency in compressed sparse row format
+        links = self.linkNumbers[self.downstream[self.linkNumbers] > 0]
+        order = np.argsort(self.downstream[links], kind='mergesort')
+        self.upstreamIndices = links[order]
+        self.upstreamPointers = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.downstream[links], minlength=size), out=self.upstreamPointers[1:])
+
+        # Link type masks
+        self.fluvial = np.zeros(size, dtype=bool)
+        self.structure = np.zeros(size, dtype=bool)
+        self.reservoir = np.zeros(size, dtype=bool)
+        self.types = [None] * size
+
+        if linkTypes is not None:
+            for linkNumber, linkType in zip(linkNumbers.tolist(), linkTypes):
+                self.types[linkNumber] = linkType
+                linkType = linkType or ''
+                self.fluvial[linkNumber] = any(keyword in linkType for keyword in FLUVIAL_TYPE_KEYWORDS)
+                self.structure[linkNumber] = linkType in STRUCTURE_TYPES
+                self.reservoir[linkNumber] = linkType in RESERVOIR_TYPES
+
+        self.lengths = np.zeros(size, dtype=np.float64)
+
+        if lengths is not None:
+            self.lengths[linkNumbers] = np.asarray(lengths, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.linkNumbers)
+
+    def __repr__(self):
+        return '<StreamNetworkGraph: Links=%s, Outlets=%s>' % (len(self), len(self.outlets()))
+
+    def upstream(self, link):
+        """
+        Link numbers of the links that flow directly into a link.
+
+        Args:
+            link (int): Link number.
+
+        Returns:
+            numpy.ndarray: Upstream link numbers.
+        """
+        self._validateLink(link)
+        return self.upstreamIndices[self.upstreamPointers[link]:self.upstreamPointers[link + 1]]
+
+    def outlets(self):
+        """
+        Link numbers of the links that do not flow into another link of the network.
+
+        Returns:
+            numpy.ndarray: Outlet link numbers.
+        """
+        return self.linkNumbers[self.downstream[self.linkNumbers] == 0]
+
+    def topologicalOrder(self):
+        """
+        Order the links so that every link comes after all of the links upstream of it.
+
+        Returns:
+            numpy.ndarray: Link numbers from the headwaters to the outlets.
+        """
+        pending = np.diff(self.upstreamPointers)
+        downstream = self.downstream.tolist()
+        order = self.linkNumbers[pending[self.linkNumbers] == 0].tolist()
+        pending = pending.tolist()
+
+        # Each link is appended once all of its upstream links have been appended
+        i = 0
+        while i < len(order):
+            downstreamLink = downstream[order[i]]
+
+            if downstreamLink:
+                pending[downstreamLink] -= 1
+
+                if pending[downstreamLink] == 0:
+                    order.append(downstreamLink)
+
+            i += 1
+
+        if len(order) != len(self.linkNumbers):
+            raise ValueError('The stream network contains a cycle.')
+
+        return np.array(order, dtype=np.int64)
+
+    def accumulate(self, values):
+        """
+        Sum a value of each link over the link and all of the links upstream of it.
+
+        Args:
+            values (array-like): Value of each link, indexed by link number.
+
+        Returns:
+            numpy.ndarray: Accumulated value of each link, indexed by link number.
+        """
+        accumulated = np.array(values, dtype=np.float64)
+
+        if accumulated.shape != self.exists.shape:
+            raise ValueError('Expected {0} values indexed by link number, got {1}.'.format(len(self.exists),
+                                                                                          len(accumulated)))
+
+        accumulated[~self.exists] = 0.0
+        downstream = self.downstream.tolist()
+        accumulated = accumulated.tolist()
+
+        for link in self.topologicalOrder().tolist():
+            if downstream[link]:
+                accumulated[downstream[link]] += accumulated[link]
+
+        return np.array(accumulated, dtype=np.float64)
+
+    def upstreamArea(self, areas):
+        """
+        Area draining to the downstream end of each link.
+
+        Args:
+            areas (array-like): Area draining directly to each link, indexed by link number.
+
+        Returns:
+            numpy.ndarray: Upstream area of each link, indexed by link number.
+        """
+        return self.accumulate(areas)
+
+    def accumulatedLength(self):
+        """
+        Total channel length of each link and all of the links upstream of it.
+
+        Returns:
+            numpy.ndarray: Accumulated length of each link, indexed by link number.
+        """
+        return self.accumulate(self.lengths)
+
+    def upstreamLinks(self, outlet):
+        """
+        Link numbers of a link and all of the links upstream of it.
+
+        Args:
+            outlet (int): Link number.
+
+        Returns:
+            numpy.ndarray: Link numbers in ascending order.
+        """
+        self._validateLink(outlet)
+        pointers = self.upstreamPointers
+        indices = self.upstreamIndices
+        links = [outlet]
+        stack = [outlet]
+
+        while stack:
+            link = stack.pop()
+            upstreamLinks = indices[pointers[link]:pointers[link + 1]].tolist()
+            links.extend(upstreamLinks)
+            stack.extend(upstreamLinks)
+
+        return np.sort(np.array(links, dtype=np.int64))
+
+    def subnetwork(self, outlet):
+        """
+        Extract the part of the network that drains to a link.
+
+        Args:
+            outlet (int): Link number of the outlet of the subnetwork.
+
+        Returns:
+            :class:`.StreamNetworkGraph`: Graph of the outlet and all of the links upstream of it. The outlet has no
+            downstream link.
+        """
+        links = self.upstreamLinks(outlet)
+        downstreamLinks = self.downstream[links].copy()
+        downstreamLinks[links == outlet] = 0
+
+        return StreamNetworkGraph(links, downstreamLinks,
+                                  linkTypes=[self.types[link] for link in links.tolist()],
+                                  lengths=self.lengths[links])
+
+    def _validateLink(self, link):
+        if not 0 < link < len(self.exists) or not self.exists[link]:
+            raise IndexError('Link {0} is not part of the stream network.'.format(link))
@@ -0,0 +1,190 @@
+"""
+********************************************************************************
+* Name: Project Validation
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+from collections import namedtuple
+
+import numpy as np
+
+__all__ = ['Diagnostic',
+           'ValidationReport',
+           'rasterTextToArray',
+           'findMissingLinkNodes',
+           'findCellsOutsideMask',
+           'findUncoveredIndices']
+
+ERROR = 'error'
+WARNING = 'warning'
+
+#: A single finding of a validation check. ``items`` holds the offending values (e.g.: (link, node) pairs or (i, j)
+#: cells) so they can be used programmatically.
+Diagnostic = namedtuple('Diagnostic', ['check', 'severity', 'fileExtension', 'message', 'items'])
+
+
+class ValidationReport(object):
+    """
+    Result of :meth:`gsshapy.orm.ProjectFile.validate`.
+
+    Attributes:
+        diagnostics (list): :class:`Diagnostic` of each failed check.
+        checked (list): Names of the checks that were run.
+        skipped (dict): Names of the checks that could not be run and the reason.
+    """
+    def __init__(self):
+        self.diagnostics = []
+        self.checked = []
+        self.skipped = {}
+
+    def __iter__(self):
+        return iter(self.diagnostics)
+
+    def __len__(self):
+        return len(self.diagnostics)
+
+    def __repr__(self):
+        return '<ValidationReport: Checked=%s, Skipped=%s, Errors=%s, Warnings=%s>' % (
+            len(self.checked), len(self.skipped), len(self.errors), len(self.warnings))
+
+    @property
+    def ok(self):
+        """
+        bool: True if no errors were found.
+        """
+        return len(self.errors) == 0
+
+    @property
+    def errors(self):
+        """
+        list: Diagnostics with error severity.
+        """
+        return [diagnostic for diagnostic in self.diagnostics if diagnostic.severity == ERROR]
+
+    @property
+    def warnings(self):
+        """
+        list: Diagnostics with warning severity.
+        """
+        return [diagnostic for diagnostic in self.diagnostics if diagnostic.severity == WARNING]
+
+    def add(self, check, severity, fileExtension, message, items):
+        """
+        Record a failed check.
+        """
+        self.diagnostics.append(Diagnostic(check, severity, fileExtension, message, items))
+
+    def skip(self, check, reason):
+        """
+        Record a check that could not be run.
+        """
+        self.skipped[check] = reason
+
+    def asDict(self):
+        """
+        Summary of the report that can be serialized as JSON.
+
+        Returns:
+            dict: The report.
+        """
+        return {'ok': self.ok,
+                'checked': list(self.checked),
+                'skipped': dict(self.skipped),
+                'diagnostics': [dict(diagnostic._asdict()) for diagnostic in self.diagnostics]}
+
+
+def rasterTextToArray(rasterText):
+    """
+    Convert the text of a GRASS ASCII raster (e.g.: a mask or index map) into an array.
+
+    Args:
+        rasterText (str): Contents of the raster file.
+
+    Returns:
+        numpy.ndarray: Values of the raster with shape (rows, cols).
+    """
+    lines = rasterText.split('\n')
+    header = {}
+    start = 0
+
+    for start, line in enumerate(lines):
+        if ':' not in line:
+            break
+
+        key, value = line.split(':', 1)
+        header[key.strip().lower()] = value.strip()
+
+    values = np.array(' '.join(lines[start:]).split(), dtype=np.float64)
+
+    return values.reshape(int(header['rows']), int(header['cols']))
+
+
+def findMissingLinkNodes(linkNumbers, nodeNumbers, validLinkNumbers, validNodeNumbers):
+    """
+    Find the (link, node) references that do not exist in a set of valid (link, node) pairs.
+
+    Args:
+        linkNumbers (array-like): Link number of each reference.
+        nodeNumbers (array-like): Node number of each reference.
+        validLinkNumbers (array-like): Link number of each valid pair.
+        validNodeNumbers (array-like): Node number of each valid pair.
+
+    Returns:
+        list: Unique (link, node) tuples that were not found, in ascending order.
+    """
+    linkNumbers = np.asarray(linkNumbers, dtype=np.int64)
+    nodeNumbers = np.asarray(nodeNumbers, dtype=np.int64)
+    validLinkNumbers = np.asarray(validLinkNumbers, dtype=np.int64)
+    validNodeNumbers = np.asarray(validNodeNumbers, dtype=np.int64)
+
+    # Combine each pair into one key so the join is a single hashed membership test
+    scale = int(max(nodeNumbers.max() if len(nodeNumbers) else 0,
+                    validNodeNumbers.max() if len(validNodeNumbers) else 0)) + 1
+    keys = linkNumbers * scale + nodeNumbers
+    validKeys = validLinkNumbers * scale + validNodeNumbers
+    missing = np.unique(keys[~np.isin(keys, validKeys)])
+
+    return [(int(key // scale), int(key % scale)) for key in missing]
+
+
+def findCellsOutsideMask(mask, cellI, cellJ):
+    """
+    Find the cells that are outside of the grid or on a cell with a mask value of 0.
+
+    Args:
+        mask (numpy.ndarray): Watershed mask with shape (rows, cols).
+        cellI (array-like): I index (row from the top, starting at 1) of each cell.
+        cellJ (array-like): J index (column from the left, starting at 1) of each cell.
+
+    Returns:
+        list: Unique (i, j) tuples of the cells outside of the mask, in ascending order.
+    """
+    cellI = np.asarray(cellI, dtype=np.int64)
+    cellJ = np.asarray(cellJ, dtype=np.int64)
+    rows, cols = mask.shape
+
+    inGrid = (cellI >= 1) & (cellI <= rows) & (cellJ >= 1) & (cellJ <= cols)
+    inside = np.zeros(len(cellI), dtype=bool)
+    inside[inGrid] = mask[cellI[inGrid] - 1, cellJ[inGrid] - 1] != 0
+
+    return sorted(set(zip(cellI[~inside].tolist(), cellJ[~inside].tolist())))
+
+
+def findUncoveredIndices(indexGrid, indexIDs, mask=None):
+    """
+    Find the values of an index map that are not defined in a mapping table.
+
+    Args:
+        indexGrid (numpy.ndarray): Values of the index map.
+        indexIDs (array-like): Index IDs defined in the mapping table.
+        mask (numpy.ndarray, optional): Watershed mask with the same shape. Only cells with a non-zero mask value are
+            checked. Defaults to all cells.
+
+    Returns:
+        list: Index values that are not defined, in ascending order.
+    """
+    values = indexGrid if mask is None else indexGrid[mask != 0]
+    values = np.unique(values)
+
+    return [int(value) for value in np.setdiff1d(values, np.asarray(indexIDs, dtype=np.float64))]
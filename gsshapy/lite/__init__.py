@@ -0,0 +1,9 @@
+"""
+********************************************************************************
+* Name: Lite Object Model
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+from .file_base import *
+from .prj import *
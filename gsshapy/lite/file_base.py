@@ -0,0 +1,141 @@
+"""
+********************************************************************************
+* Name: Lite File Object Base
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import logging
+import os
+
+__all__ = ['LiteFileObjectBase',
+           'TextFile']
+
+log = logging.getLogger(__name__)
+
+
+class LiteFileObjectBase(object):
+    """
+    Abstract base class for the database-free file objects.
+
+    Lite file objects are plain Python objects with the same ``read()`` and ``write()`` API as
+    :class:`gsshapy.base.GsshaPyFileObjectBase`. The ``session`` arguments are accepted for compatibility and ignored.
+    Use them when a file is read, edited and written again without ever being queried.
+    """
+    __slots__ = ('fileExtension',)
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.fileExtension = ''
+
+    def read(self, directory, filename, session=None, spatial=False,
+             spatialReferenceID=4236, replaceParamFile=None, **kwargs):
+        """
+        Generic read file method.
+
+        Args:
+            directory (str): Directory containing the file to be read.
+            filename (str): Name of the file which will be read (e.g.: 'example.prj').
+            session (optional): Ignored. Accepted for compatibility with the database file objects.
+            spatial (bool, optional): Ignored.
+            spatialReferenceID (int, optional): Integer id of spatial reference system for the model.
+            replaceParamFile (optional): Ignored.
+        """
+        # Read parameter derivatives
+        path = os.path.join(directory, filename)
+        filename_split = filename.split('.')
+        name = filename_split[0]
+
+        # Default file extension
+        extension = ''
+
+        if len(filename_split) >= 2:
+            extension = filename_split[-1]
+
+        if os.path.isfile(path):
+            self._read(directory, filename, session, path, name, extension,
+                       spatial, spatialReferenceID, replaceParamFile, **kwargs)
+        else:
+            # Print warning
+            log.warn('Could not find file named {0}. File not read.'.format(filename))
+
+    def write(self, session, directory, name, replaceParamFile=None, **kwargs):
+        """
+        Write file method.
+
+        Args:
+            session (optional): Ignored. Accepted for compatibility with the database file objects.
+            directory (str): Directory where the file will be written.
+            name (str): The name of the file that will be created (including the file extension is optional).
+            replaceParamFile (optional): Ignored.
+        """
+        # Assemble Path to file
+        name_split = name.split('.')
+        name = name_split[0]
+
+        # Default extension
+        extension = ''
+
+        if len(name_split) >= 2:
+            extension = name_split[-1]
+
+        if extension == '':
+            filename = '{0}.{1}'.format(name, self.fileExtension)
+        else:
+            filename = '{0}.{1}'.format(name, extension)
+
+        filePath = os.path.join(directory, filename)
+
+        with open(filePath, 'w') as openFile:
+            # Write Lines
+            self._write(session=session,
+                        openFile=openFile,
+                        replaceParamFile=replaceParamFile,
+                        **kwargs)
+
+    def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
+        """
+        Private file object read method. Classes that inherit from this base class must implement this method.
+        """
+
+    def _write(self, session, openFile, replaceParamFile):
+        """
+        Private file object write method. Classes that inherit from this base class must implement this method.
+        """
+
+
+class TextFile(LiteFileObjectBase):
+    """
+    Lite file object that carries the contents of any project file through unchanged.
+    """
+    __slots__ = ('name', 'text')
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        LiteFileObjectBase.__init__(self)
+        self.name = None
+        self.text = ''
+
+    def __repr__(self):
+        return '<TextFile: Name=%s, Extension=%s>' % (self.name, self.fileExtension)
+
+    def _read(self, directory, filename, session, path, name, extension,
+              spatial, spatialReferenceID, replaceParamFile, **kwargs):
+        """
+        Text File Read from File Method
+        """
+        with open(path, 'r') as f:
+            self.text = f.read()
+
+        self.name = name
+        self.fileExtension = extension
+
+    def _write(self, session, openFile, replaceParamFile, **kwargs):
+        """
+        Text File Write to File Method
+        """
+        openFile.write(self.text)
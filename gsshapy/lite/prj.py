@@ -0,0 +1,261 @@
+"""
+********************************************************************************
+* Name: Lite Project File
+* Created On: October 18, 2026
+* License: BSD 2-Clause
+********************************************************************************
+"""
+import logging
+import os
+
+from .file_base import LiteFileObjectBase, TextFile
+from ..lib import parsetools as pt
+from ..lib import prj_chunk as prc
+
+__all__ = ['ProjectFile',
+           'ProjectCard']
+
+log = logging.getLogger(__name__)
+
+
+class ProjectFile(LiteFileObjectBase):
+    """
+    Database-free object interface for the Project File.
+
+    Mirrors the card API of :class:`gsshapy.orm.ProjectFile` (``read()``, ``write()``, ``getCard()``, ``setCard()``
+    and ``deleteCard()``) without a database session. The files referenced by the project cards are carried through
+    as :class:`.TextFile` objects, so a project can be read, edited and written under a new name. Use the database
+    version for anything that needs to query the contents of the model files.
+    """
+    __slots__ = ('name', 'mapType', 'srid', 'projectCards', 'files')
+
+    def __init__(self, name=None, map_type=None):
+        LiteFileObjectBase.__init__(self)
+        self.fileExtension = 'prj'
+        self.name = name
+        self.mapType = None
+        self.srid = None
+        self.projectCards = []
+        self.files = {}
+
+        if map_type is not None:
+            self.mapType = map_type
+            self.setCard(name='MAP_TYPE', value=str(map_type))
+
+    def __repr__(self):
+        return '<ProjectFile: Name=%s, Cards=%s>' % (self.name, len(self.projectCards))
+
+    def _read(self, directory, filename, session, path, name, extension,
+              spatial, spatialReferenceID, replaceParamFile,
+              force_relative=True):
+        """
+        Project File Read from File Method
+        """
+        with open(path, 'r') as f:
+            cards = prc.projectChunk(f, force_relative)
+
+        self.projectCards = [ProjectCard(name=card['name'], value=card['value']) for card in cards]
+
+        for card in self.projectCards:
+            # Extract MAP_TYPE card value for convenience working
+            # with output maps
+            if card.name == 'MAP_TYPE':
+                self.mapType = int(card.value)
+
+        # Assign properties
+        self.srid = spatialReferenceID
+        self.name = name
+        self.fileExtension = extension
+
+    def _write(self, session, openFile, replaceParamFile):
+        """
+        Project File Write to File Method
+        """
+        filename = os.path.split(openFile.name)[1]
+        name = filename.split('.')[0]
+
+        # Write lines
+        openFile.write('GSSHAPROJECT\n')
+
+        # Write priority lines
+        for card_key in prc.PRIORITY_CARDS:
+            card = self.getCard(card_key)
+
+            # Write the card
+            if card is not None:
+                openFile.write(card.write(originalPrefix=self.name, newPrefix=name))
+
+        # Initiate write on each ProjectCard that belongs to this ProjectFile
+        for card in self.projectCards:
+            if card.name not in prc.PRIORITY_CARDS:
+                openFile.write(card.write(originalPrefix=self.name, newPrefix=name))
+
+    def readProject(self, directory, projectFileName, session=None, spatial=False, spatialReferenceID=None):
+        """
+        Read the project file and every file it references that exists in the directory.
+
+        Args:
+            directory (str): Directory containing all GSSHA model files.
+            projectFileName (str): Name of the project file for the GSSHA model (e.g.: 'example.prj').
+            session (optional): Ignored. Accepted for compatibility with :class:`gsshapy.orm.ProjectFile`.
+            spatial (bool, optional): Ignored.
+            spatialReferenceID (int, optional): Integer id of spatial reference system for the model.
+        """
+        self.read(directory=directory, filename=projectFileName, session=session,
+                  spatialReferenceID=spatialReferenceID)
+
+        for card in self.projectCards:
+            filename = self._cardFilename(card)
+
+            if filename and os.path.isfile(os.path.join(directory, filename)):
+                self._readTextFile(directory, filename)
+
+    def readInputFile(self, card_name, directory, session=None, **kwargs):
+        """
+        Read the file referenced by a project card.
+
+        Args:
+            card_name(str): Name of GSSHA project card.
+            directory (str): Directory containing all GSSHA model files.
+            session (optional): Ignored. Accepted for compatibility with :class:`gsshapy.orm.ProjectFile`.
+
+        Returns:
+            :class:`.TextFile` or None: The file object. Will return None if the card does not reference a file.
+        """
+        card = self.getCard(card_name)
+
+        if card is None:
+            return None
+
+        filename = self._cardFilename(card)
+
+        if not filename:
+            return None
+
+        return self._readTextFile(directory, filename)
+
+    def writeProject(self, session, directory, name):
+        """
+        Write the project file and all files that were read with it.
+
+        Args:
+            session (optional): Ignored. Accepted for compatibility with :class:`gsshapy.orm.ProjectFile`.
+            directory (str): Directory where the files will be written.
+            name (str): Name that will be given to project when written (e.g.: 'example'). Files that follow the project
+                naming convention will be renamed, other files will retain their original file names.
+        """
+        # Write Project File
+        self.write(session=session, directory=directory, name=name)
+
+        # Write the files that are still referenced by a card
+        for card in self.projectCards:
+            filename = self._cardFilename(card)
+
+            if filename in self.files:
+                textFile = self.files[filename]
+                textFile.write(session=session, directory=directory,
+                               name=prc.newFilename(filename, self.name, name))
+
+    def getCard(self, name):
+        """
+        Retrieve card object for given card name.
+
+        Args:
+            name (str): Name of card to be retrieved.
+
+        Returns:
+            :class:`.ProjectCard` or None: Project card object. Will return None if the card is not available.
+        """
+        for card in self.projectCards:
+            if card.name.upper() == name.upper():
+                return card
+
+        return None
+
+    def setCard(self, name, value, add_quotes=False):
+        """
+        Adds/updates card for gssha project file
+
+        Args:
+            name (str): Name of card to be updated/added.
+            value (str): Value to attach to the card.
+            add_quotes (Optional[bool]): If True, will add quotes around string. Default is False.
+        """
+        gssha_card = self.getCard(name)
+
+        if add_quotes:
+            value = '"{0}"'.format(value)
+
+        if gssha_card is None:
+            # add new card
+            self.projectCards.append(ProjectCard(name=name, value=value))
+        else:
+            gssha_card.value = value
+
+    def deleteCard(self, card_name, db_session=None):
+        """
+        Removes card from gssha project file
+        """
+        gssha_card = self.getCard(card_name)
+        if gssha_card is not None:
+            self.projectCards.remove(gssha_card)
+
+    def _readTextFile(self, directory, filename):
+        """
+        Read a referenced file into the files dictionary, keyed by filename
+        """
+        textFile = TextFile()
+        textFile.read(directory=directory, filename=filename)
+        self.files[filename] = textFile
+
+        return textFile
+
+    def _cardFilename(self, card):
+        """
+        Extract the filename from the value of a file card
+        """
+        if not card.value or '.' not in card.value:
+            return None
+
+        try:
+            filename = pt.splitLine(card.value)[0]
+        except ValueError:
+            filename = card.value.strip('"').strip("'")
+
+        try:
+            # Numbers are not filenames
+            float(filename)
+            return None
+        except ValueError:
+            return filename
+
+
+class ProjectCard(object):
+    """
+    Object containing data for a single card in the project file.
+    """
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value):
+        """
+        Constructor
+        """
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return '<ProjectCard: Name=%s, Value=%s>' % (self.name, self.value)
+
+    def write(self, originalPrefix, newPrefix=None):
+        """
+        Write project card to string.
+
+        Args:
+            originalPrefix (str): Original name to give to files that follow the project naming convention
+                (e.g: prefix.gag).
+            newPrefix (str, optional): If new prefix is desired, pass in this parameter. Defaults to None.
+
+        Returns:
+            str: Card and value as they would be written to the project file.
+        """
+        return prc.cardLine(self.name, self.value, originalPrefix, newPrefix)
@@ -25,16 +25,21 @@ __all__ = ['ChannelInputFile',
 from future.utils import iteritems
 import logging
 import json
+import numpy as np
 from mapkit.sqlatypes import Geometry
-from sqlalchemy import ForeignKey, Column
+from osgeo import ogr, osr
+from sqlalchemy import ForeignKey, Column, Index, text, event
 from sqlalchemy.types import Integer, String, Float, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 import xml.etree.ElementTree as ET
 
 from . import DeclarativeBase
 from ..base.geom import GeometricObjectBase
 from ..base.file_base import GsshaPyFileObjectBase
 from ..lib import parsetools as pt, cif_chunk as cic
+from ..lib.kml_stream import KmlStreamWriter, KML_NAMESPACE
+from ..lib.stream_network import StreamNetworkGraph
+from ..lib.hydraulics import HydraulicTables, trapezoidProperties, breakpointProperties, breakpointBankfullDepths
 from ..lib.parsetools import valueReadPreprocessor as vrp, valueWritePreprocessor as vwp
 
 log = logging.getLogger(__name__)
@@ -126,7 +131,126 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
 
         return streamLinks
 
+    def getStreamNetworkGraph(self, session):
+        """
+        Retrieve the connectivity of the stream network as arrays indexed by link number.
+
+        The graph is built from a single query and supports topological ordering, accumulation of values down the
+        network (e.g.: upstream area and accumulated length) and extraction of the subnetwork draining to a link
+        without loading any :class:`.StreamLink` objects.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database.
+
+        Returns:
+            :class:`gsshapy.lib.stream_network.StreamNetworkGraph`: The stream network graph.
+        """
+        rows = session.query(StreamLink.linkNumber,
+                             StreamLink.downstreamLinkID,
+                             StreamLink.type,
+                             StreamLink.numElements,
+                             StreamLink.dx).\
+            filter(StreamLink.channelInputFile == self).\
+            all()
+
+        return StreamNetworkGraph(linkNumbers=[row.linkNumber for row in rows],
+                                  downstreamLinks=[row.downstreamLinkID or 0 for row in rows],
+                                  linkTypes=[row.type for row in rows],
+                                  lengths=[(row.numElements or 0) * (row.dx or 0.0) for row in rows])
+
+    def getHydraulicTables(self, session, numDepths=21, minSlope=0.0001):
+        """
+        Compute flow area, wetted perimeter, top width and Manning capacity versus depth for every link with a
+        trapezoidal or breakpoint cross section.
+
+        The properties of all cross sections of the same type are computed at once with NumPy for depths from zero
+        to bankfull. The results are cached on each cross section and the cache is reset when its geometry changes,
+        so repeated calls only compute the cross sections that were modified.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database.
+            numDepths (int, optional): Number of depths in each table. Defaults to 21.
+            minSlope (float, optional): Smallest bed slope used for the capacity. The slope of each link is computed
+                from the elevations of its first and last nodes. Defaults to 0.0001.
+
+        Returns:
+            :class:`gsshapy.lib.hydraulics.HydraulicTables`: The stage-property tables in link number order.
+        """
+        links = session.query(StreamLink).\
+            filter(StreamLink.channelInputFile == self).\
+            order_by(StreamLink.linkNumber).\
+            options(selectinload(StreamLink.nodes),
+                    selectinload(StreamLink.breakpointCS).selectinload(BreakpointCS.breakpoints),
+                    selectinload(StreamLink.trapezoidalCS)).\
+            all()
 
+        crossSections = []
+
+        for link in links:
+            xSec = link.trapezoidalCS or link.breakpointCS
+
+            if xSec is not None:
+                crossSections.append((link, xSec))
+
+        # Compute the cross sections without cached tables in one batch per cross section type
+        trapezoids = [xSec for link, xSec in crossSections
+                      if isinstance(xSec, TrapezoidalCS) and numDepths not in xSec._getHydraulicCache()]
+        naturals = [xSec for link, xSec in crossSections
+                    if isinstance(xSec, BreakpointCS) and numDepths not in xSec._getHydraulicCache()]
+        fractions = np.linspace(0.0, 1.0, numDepths)
+
+        if trapezoids:
+            depths = np.array([xSec.bankfullDepth or 0.0 for xSec in trapezoids])[:, np.newaxis] * fractions
+            properties = trapezoidProperties(depths,
+                                             bottomWidths=[xSec.bottomWidth or 0.0 for xSec in trapezoids],
+                                             sideSlopes=[xSec.sideSlope or 0.0 for xSec in trapezoids])
+            self._cacheHydraulics(trapezoids, numDepths, depths, properties)
+
+        if naturals:
+            maxPoints = max(len(xSec.breakpoints) for xSec in naturals)
+            stations = np.full((len(naturals), max(maxPoints, 1)), np.nan)
+            elevations = np.full((len(naturals), max(maxPoints, 1)), np.nan)
+
+            for i, xSec in enumerate(naturals):
+                numPoints = len(xSec.breakpoints)
+                stations[i, :numPoints] = [breakpoint.x for breakpoint in xSec.breakpoints]
+                elevations[i, :numPoints] = [breakpoint.y for breakpoint in xSec.breakpoints]
+
+            depths = breakpointBankfullDepths(elevations)[:, np.newaxis] * fractions
+            properties = breakpointProperties(depths, stations, elevations)
+            self._cacheHydraulics(naturals, numDepths, depths, properties)
+
+        # Depth, area, wetted perimeter and top width of each cross section
+        columns = np.array([xSec._getHydraulicCache()[numDepths] for link, xSec in crossSections],
+                           dtype=np.float64).reshape(len(crossSections), 4, numDepths)
+
+        slopes = []
+
+        for link, xSec in crossSections:
+            nodes = sorted(link.nodes, key=lambda node: node.nodeNumber)
+            slope = 0.0
+
+            if len(nodes) > 1 and link.dx:
+                slope = (nodes[0].elevation - nodes[-1].elevation) / (link.dx * (len(nodes) - 1))
+
+            slopes.append(max(slope, minSlope))
+
+        return HydraulicTables(linkNumbers=[link.linkNumber for link, xSec in crossSections],
+                               depth=columns[:, 0],
+                               area=columns[:, 1],
+                               wettedPerimeter=columns[:, 2],
+                               topWidth=columns[:, 3],
+                               manningsN=[xSec.mannings_n for link, xSec in crossSections],
+                               slopes=slopes)
+
+    def _cacheHydraulics(self, crossSections, numDepths, depths, properties):
+        """
+        Store the rows of a batch of hydraulic property arrays on the cross sections
+        """
+        area, wettedPerimeter, topWidth = properties
+
+        for i, xSec in enumerate(crossSections):
+            xSec._getHydraulicCache()[numDepths] = (depths[i], area[i], wettedPerimeter[i], topWidth[i])
 
     def getStreamNetworkAsKml(self, session, path=None, documentName='Stream Network', withNodes=False, styles={}):
         """
@@ -134,7 +258,8 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
 
         Args:
             session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database
-            path (str, optional): Path to file where KML will be written. Defaults to None.
+            path (str, optional): Path to file where KML will be written. Placemarks are written to the file as they
+                are created. A KMZ archive is written if the path ends with '.kmz'. Defaults to None.
             documentName (str, optional): Name of the KML document. This will be the name that appears in the legend.
                 Defaults to 'Stream Network'.
             withNodes (bool, optional): Include nodes. Defaults to False.
@@ -147,7 +272,7 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
                    * nodeIconScale: scale of the icon image
 
         Returns:
-            str: KML string
+            str: KML string. None if path is given.
         """
         # Retrieve Stream Links
         links = self.getFluvialLinks()
@@ -185,14 +310,37 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
                 log.warn('nodeIconScaleValue must be a valid number containing the width of the line in pixels.')
 
 
+        elements = self._getStreamNetworkKmlElements(session, links, withNodes, lineColorValue, lineWidthValue,
+                                                     nodeIconHrefValue, nodeIconScaleValue)
+
+        if path:
+            # Write placemarks to the file as they are created
+            with KmlStreamWriter(path, documentName=documentName) as writer:
+                for element in elements:
+                    writer.write(element)
+
+            return None
+
         # Initialize KML Document
-        kml = ET.Element('kml', xmlns='http://www.opengis.net/kml/2.2')
+        kml = ET.Element('kml', xmlns=KML_NAMESPACE)
         document = ET.SubElement(kml, 'Document')
         docName = ET.SubElement(document, 'name')
         docName.text = documentName
 
+        for element in elements:
+            document.append(element)
+
+        kmlString = ET.tostring(kml)
+
+        return kmlString
+
+    def _getStreamNetworkKmlElements(self, session, links, withNodes, lineColorValue, lineWidthValue,
+                                     nodeIconHrefValue, nodeIconScaleValue):
+        """
+        Generate the elements of the stream network KML document one at a time
+        """
         for link in links:
-            placemark = ET.SubElement(document, 'Placemark')
+            placemark = ET.Element('Placemark')
             placemarkName = ET.SubElement(placemark, 'name')
             placemarkName.text = str(link.linkNumber)
 
@@ -214,9 +362,39 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
             else:
                 log.warn("No geometry found for link with id {0}".format(link.id))
 
+            # Create the data tag
+            extendedData = ET.SubElement(placemark, 'ExtendedData')
+
+            # Add value to data
+            linkNumberData = ET.SubElement(extendedData, 'Data', name='link_number')
+            linkNumberValue = ET.SubElement(linkNumberData, 'value')
+            linkNumberValue.text = str(link.linkNumber)
+
+            linkTypeData = ET.SubElement(extendedData, 'Data', name='link_type')
+            linkTypeValue = ET.SubElement(linkTypeData, 'value')
+            linkTypeValue.text = str(link.type)
+
+            numElementsData = ET.SubElement(extendedData, 'Data', name='number_elements')
+            numElementsValue = ET.SubElement(numElementsData, 'value')
+            numElementsValue.text = str(link.numElements)
+
+            dxData = ET.SubElement(extendedData, 'Data', name='dx')
+            dxValue = ET.SubElement(dxData, 'value')
+            dxValue.text = str(link.dx)
+
+            erodeData = ET.SubElement(extendedData, 'Data', name='erode')
+            erodeValue = ET.SubElement(erodeData, 'value')
+            erodeValue.text = str(link.type)
+
+            subsurfaceData = ET.SubElement(extendedData, 'Data', name='subsurface')
+            subsurfaceValue = ET.SubElement(subsurfaceData, 'value')
+            subsurfaceValue.text = str(link.type)
+
+            yield placemark
+
             if withNodes:
                 # Create the node styles
-                nodeStyles = ET.SubElement(document, 'Style', id='node_styles')
+                nodeStyles = ET.Element('Style', id='node_styles')
 
                 # Hide labels
                 nodeLabelStyle = ET.SubElement(nodeStyles, 'LabelStyle')
@@ -235,9 +413,11 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
                 iconScale = ET.SubElement(nodeIconStyle, 'scale')
                 iconScale.text = str(nodeIconScaleValue)
 
+                yield nodeStyles
+
                 for node in link.nodes:
                     # New placemark for each node
-                    nodePlacemark = ET.SubElement(document, 'Placemark')
+                    nodePlacemark = ET.Element('Placemark')
                     nodePlacemarkName = ET.SubElement(nodePlacemark, 'name')
                     nodePlacemarkName.text = str(node.nodeNumber)
 
@@ -263,41 +443,7 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
                     nodeElevationValue = ET.SubElement(nodeElevationData, 'value')
                     nodeElevationValue.text = str(node.elevation)
 
-            # Create the data tag
-            extendedData = ET.SubElement(placemark, 'ExtendedData')
-
-            # Add value to data
-            linkNumberData = ET.SubElement(extendedData, 'Data', name='link_number')
-            linkNumberValue = ET.SubElement(linkNumberData, 'value')
-            linkNumberValue.text = str(link.linkNumber)
-
-            linkTypeData = ET.SubElement(extendedData, 'Data', name='link_type')
-            linkTypeValue = ET.SubElement(linkTypeData, 'value')
-            linkTypeValue.text = str(link.type)
-
-            numElementsData = ET.SubElement(extendedData, 'Data', name='number_elements')
-            numElementsValue = ET.SubElement(numElementsData, 'value')
-            numElementsValue.text = str(link.numElements)
-
-            dxData = ET.SubElement(extendedData, 'Data', name='dx')
-            dxValue = ET.SubElement(dxData, 'value')
-            dxValue.text = str(link.dx)
-
-            erodeData = ET.SubElement(extendedData, 'Data', name='erode')
-            erodeValue = ET.SubElement(erodeData, 'value')
-            erodeValue.text = str(link.type)
-
-            subsurfaceData = ET.SubElement(extendedData, 'Data', name='subsurface')
-            subsurfaceValue = ET.SubElement(subsurfaceData, 'value')
-            subsurfaceValue.text = str(link.type)
-
-        kmlString = ET.tostring(kml)
-
-        if path:
-            with open(path, 'w') as f:
-                f.write(kmlString)
-
-        return kmlString
+                    yield nodePlacemark
 
     def getStreamNetworkAsWkt(self, session, withNodes=True):
         """
@@ -385,6 +531,156 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
 
         return json.dumps(feature_collection)
 
+    def iterStreamNetworkFeatures(self, session, withNodes=True):
+        """
+        Generate the GeoJSON features of the stream network from the coordinates of the stream nodes.
+
+        The links and nodes are retrieved with a single query and the geometries are assembled from the x, y and
+        elevation of the nodes, so no spatial database functions are required (e.g.: the default SQLite database).
+        Features are generated one at a time in link number order, each link followed by its nodes. Links without
+        nodes (e.g.: structures and reservoirs) have no geometry and are skipped.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to a database.
+            withNodes (bool, optional): Include nodes. Defaults to True.
+
+        Returns:
+            generator: GeoJSON feature dictionaries with the same properties as :meth:`getStreamNetworkAsGeoJson`.
+        """
+        rows = session.query(StreamLink.id,
+                             StreamLink.linkNumber,
+                             StreamLink.type,
+                             StreamLink.numElements,
+                             StreamLink.dx,
+                             StreamLink.erode,
+                             StreamLink.subsurface,
+                             StreamNode.id,
+                             StreamNode.nodeNumber,
+                             StreamNode.x,
+                             StreamNode.y,
+                             StreamNode.elevation).\
+            join(StreamNode, StreamNode.linkID == StreamLink.id).\
+            filter(StreamLink.channelInputFile == self).\
+            order_by(StreamLink.linkNumber, StreamNode.id).\
+            yield_per(1000)
+
+        link = None
+        nodes = []
+
+        for row in rows:
+            if link is not None and row[0] != link[0]:
+                for feature in self._getStreamLinkFeatures(link, nodes, withNodes):
+                    yield feature
+                nodes = []
+
+            link = row[:7]
+            nodes.append(row[7:])
+
+        if link is not None:
+            for feature in self._getStreamLinkFeatures(link, nodes, withNodes):
+                yield feature
+
+    def writeStreamNetwork(self, session, path, withNodes=True, spatialReferenceID=None):
+        """
+        Write the stream network to a GeoJSON or FlatGeobuf file without spatial database functions.
+
+        Features are written as they are generated by :meth:`iterStreamNetworkFeatures`, so large networks are never
+        held in memory. The format is chosen by the file extension: '.fgb' writes FlatGeobuf (requires GDAL 3.1 or
+        later), anything else writes GeoJSON.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to a database.
+            path (str): Path to the file that will be written.
+            withNodes (bool, optional): Include nodes. Defaults to True.
+            spatialReferenceID (int, optional): EPSG code of the coordinates. Written to FlatGeobuf files only.
+        """
+        features = self.iterStreamNetworkFeatures(session, withNodes=withNodes)
+
+        if path.lower().endswith('.fgb'):
+            self._writeFlatGeobuf(path, features, spatialReferenceID)
+            return
+
+        with open(path, 'w') as f:
+            f.write('{"type": "FeatureCollection", "features": [')
+
+            for i, feature in enumerate(features):
+                if i > 0:
+                    f.write(',\n')
+                f.write(json.dumps(feature))
+
+            f.write(']}\n')
+
+    def _getStreamLinkFeatures(self, link, nodes, withNodes):
+        """
+        GeoJSON features of a link and its nodes from the rows of iterStreamNetworkFeatures
+        """
+        linkID, linkNumber, linkType, numElements, dx, erode, subsurface = link
+        coordinates = [[x, y, elevation] for nodeID, nodeNumber, x, y, elevation in nodes]
+
+        yield {"type": "Feature",
+               "geometry": {"type": "LineString", "coordinates": coordinates},
+               "properties": {"link_number": linkNumber,
+                              "type": linkType,
+                              "num_elements": numElements,
+                              "dx": dx,
+                              "erode": erode,
+                              "subsurface": subsurface},
+               "id": linkID}
+
+        if withNodes:
+            for nodeID, nodeNumber, x, y, elevation in nodes:
+                yield {"type": "Feature",
+                       "geometry": {"type": "Point", "coordinates": [x, y, elevation]},
+                       "properties": {"link_number": linkNumber,
+                                      "node_number": nodeNumber,
+                                      "elevation": elevation},
+                       "id": nodeID}
+
+    def _writeFlatGeobuf(self, path, features, spatialReferenceID=None):
+        """
+        Write GeoJSON features to a FlatGeobuf file with OGR
+        """
+        driver = ogr.GetDriverByName('FlatGeobuf')
+
+        if driver is None:
+            raise RuntimeError('The installed version of GDAL does not support FlatGeobuf.')
+
+        spatialReference = None
+
+        if spatialReferenceID is not None:
+            spatialReference = osr.SpatialReference()
+            spatialReference.ImportFromEPSG(int(spatialReferenceID))
+
+        fields = (('link_number', ogr.OFTInteger),
+                  ('node_number', ogr.OFTInteger),
+                  ('type', ogr.OFTString),
+                  ('num_elements', ogr.OFTInteger),
+                  ('dx', ogr.OFTReal),
+                  ('erode', ogr.OFTInteger),
+                  ('subsurface', ogr.OFTInteger),
+                  ('elevation', ogr.OFTReal))
+
+        dataSource = driver.CreateDataSource(path)
+        layer = dataSource.CreateLayer('stream_network', spatialReference, ogr.wkbUnknown)
+
+        for fieldName, fieldType in fields:
+            layer.CreateField(ogr.FieldDefn(fieldName, fieldType))
+
+        layerDefinition = layer.GetLayerDefn()
+
+        for feature in features:
+            ogrFeature = ogr.Feature(layerDefinition)
+            ogrFeature.SetGeometry(ogr.CreateGeometryFromJson(json.dumps(feature['geometry'])))
+
+            for fieldName, value in feature['properties'].items():
+                if value is not None:
+                    ogrFeature.SetField(fieldName, int(value) if isinstance(value, bool) else value)
+
+            layer.CreateFeature(ogrFeature)
+
+        # Close the data source to flush the features to the file
+        dataSource = None
+
     def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
         """
         Channel Input File Read from File Method
@@ -473,8 +769,18 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
         openFile.write('LINKS%s%s\n' % (' ' * 7, self.links))
         openFile.write('MAXNODES%s%s\n' % (' ' * 4, self.maxNodes))
 
-        # Retrieve StreamLinks
-        links = self.getOrderedLinks(session)
+        # Retrieve StreamLinks with everything the link writers need
+        links = session.query(StreamLink).\
+            filter(StreamLink.channelInputFile == self).\
+            order_by(StreamLink.linkNumber).\
+            options(selectinload(StreamLink.upstreamLinks),
+                    selectinload(StreamLink.nodes),
+                    selectinload(StreamLink.weirs),
+                    selectinload(StreamLink.culverts),
+                    selectinload(StreamLink.reservoir).selectinload(Reservoir.reservoirPoints),
+                    selectinload(StreamLink.breakpointCS).selectinload(BreakpointCS.breakpoints),
+                    selectinload(StreamLink.trapezoidalCS)).\
+            all()
 
         self._writeConnectivity(links=links,
                                 fileObject=openFile)
@@ -718,40 +1024,34 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
         # Flush the current session
         session.flush()
 
-        # Create geometry for each fluvial link
-        for link in self.getFluvialLinks():
+        # Assemble the well known text of every node and link in bulk
+        nodeGeometries = []
+        linkGeometries = []
 
-            # Retrieve the nodes for each link
-            nodes = link.nodes
+        for link in self.getFluvialLinks():
             nodeCoordinates = []
 
-            # Create geometry for each node
-            for node in nodes:
+            for node in link.nodes:
                 # Assemble coordinates in well known text format
                 coordinates = '{0} {1} {2}'.format(node.x, node.y, node.elevation)
                 nodeCoordinates.append(coordinates)
 
                 # Create well known text string for point with z coordinate
-                wktPoint = 'POINT Z ({0})'.format(coordinates)
-
-                # Write SQL statement
-                statement = self._getUpdateGeometrySqlString(geometryID=node.id,
-                                                             tableName=node.tableName,
-                                                             spatialReferenceID=spatialReferenceID,
-                                                             wktString=wktPoint)
-
-                session.execute(statement)
+                nodeGeometries.append({'id': node.id,
+                                       'wkt': 'POINT Z ({0})'.format(coordinates),
+                                       'srid': spatialReferenceID})
 
             # Assemble line string in well known text format
-            wktLineString = 'LINESTRING Z ({0})'.format(', '.join(nodeCoordinates))
+            linkGeometries.append({'id': link.id,
+                                   'wkt': 'LINESTRING Z ({0})'.format(', '.join(nodeCoordinates)),
+                                   'srid': spatialReferenceID})
 
-            # Write SQL statement
-            statement = self._getUpdateGeometrySqlString(geometryID=link.id,
-                                                         tableName=link.tableName,
-                                                         spatialReferenceID=spatialReferenceID,
-                                                         wktString=wktLineString)
+        # Execute one batched UPDATE (executemany) per table
+        if nodeGeometries:
+            session.execute(self._getUpdateGeometryStatement(StreamNode.tableName), nodeGeometries)
 
-            session.execute(statement)
+        if linkGeometries:
+            session.execute(self._getUpdateGeometryStatement(StreamLink.tableName), linkGeometries)
 
     def _writeConnectivity(self, links, fileObject):
         """
@@ -1110,14 +1410,14 @@ class ChannelInputFile(DeclarativeBase, GsshaPyFileObjectBase):
             except:
                 fileObject.write('K_RIVER        %s\n' % kRiver)
 
-    def _getUpdateGeometrySqlString(self, geometryID, tableName, spatialReferenceID, wktString):
-        statement = '''
-                    UPDATE {0} SET geometry=ST_GeomFromText('{1}', {2})
-                    WHERE id={3};
-                    '''.format(tableName,
-                               wktString,
-                               spatialReferenceID,
-                               geometryID)
+    def _getUpdateGeometryStatement(self, tableName):
+        """
+        UPDATE statement that sets the geometry of one row from the id, wkt and srid parameters
+        """
+        statement = text('''
+                         UPDATE {0} SET geometry=ST_GeomFromText(:wkt, :srid)
+                         WHERE id=:id;
+                         '''.format(tableName))
         return statement
 
 
@@ -1137,6 +1437,7 @@ class StreamLink(DeclarativeBase, GeometricObjectBase):
     __tablename__ = 'cif_links'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_cif_links_channel_input_file_link_number', 'channelInputFileID', 'linkNumber'),)
 
     # Public Table Metadata
     tableName = __tablename__
@@ -1247,6 +1548,7 @@ class StreamNode(DeclarativeBase, GeometricObjectBase):
     __tablename__ = 'cif_nodes'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_cif_nodes_link_node_number', 'linkID', 'nodeNumber'),)
 
     # Public Table Metadata
     tableName = __tablename__
@@ -1508,7 +1810,56 @@ class ReservoirPoint(DeclarativeBase):
                 self.j == other.j)
 
 
-class BreakpointCS(DeclarativeBase):
+class CrossSectionHydraulicsBase(object):
+    """
+    Mixin for cross sections that caches their hydraulic property arrays.
+
+    The cache is reset when the cross section is refreshed from the database or when one of the
+    columns in hydraulicColumns or relationships in hydraulicRelationships changes.
+    """
+    hydraulicColumns = ()  #: Columns that define the cross section geometry
+    hydraulicRelationships = ()  #: Relationships that define the cross section geometry
+
+    def _getHydraulicCache(self):
+        """
+        Hydraulic property arrays of the cross section keyed by the number of depths
+        """
+        cache = getattr(self, '_hydraulicCache', None)
+
+        if cache is None:
+            cache = self._hydraulicCache = {}
+
+        return cache
+
+    def _resetHydraulics(self):
+        """
+        Discard the cached hydraulic property arrays
+        """
+        self._hydraulicCache = None
+
+    @classmethod
+    def _listenForHydraulicChanges(cls):
+        """
+        Register the events that reset the hydraulic property arrays of the cross section class
+        """
+        event.listen(cls, 'refresh', _resetCrossSectionHydraulics)
+
+        for name in cls.hydraulicColumns:
+            event.listen(getattr(cls, name), 'set', _resetCrossSectionHydraulics)
+
+        for name in cls.hydraulicRelationships:
+            event.listen(getattr(cls, name), 'append', _resetCrossSectionHydraulics)
+            event.listen(getattr(cls, name), 'remove', _resetCrossSectionHydraulics)
+
+
+def _resetCrossSectionHydraulics(xSec, *args):
+    """
+    Reset the hydraulic property arrays when the cross section changes or is reloaded from the database
+    """
+    xSec._resetHydraulics()
+
+
+class BreakpointCS(DeclarativeBase, CrossSectionHydraulicsBase):
     """
     Object containing breakpoint type cross section data for fluvial stream links.
 
@@ -1536,6 +1887,8 @@ class BreakpointCS(DeclarativeBase):
     streamLink = relationship('StreamLink', back_populates='breakpointCS')  #: RELATIONSHIP
     breakpoints = relationship('Breakpoint', back_populates='crossSection')  #: RELATIONSHIP
 
+    hydraulicRelationships = ('breakpoints',)
+
     def __init__(self, mannings_n, numPairs, numInterp, mRiver, kRiver, erode, subsurface, maxErosion):
         """
         Constructor
@@ -1607,7 +1960,7 @@ class Breakpoint(DeclarativeBase):
                 self.y == other.y)
 
 
-class TrapezoidalCS(DeclarativeBase):
+class TrapezoidalCS(DeclarativeBase, CrossSectionHydraulicsBase):
     """
     Object containing trapezoidal type cross section data for fluvial stream links.
 
@@ -1635,6 +1988,8 @@ class TrapezoidalCS(DeclarativeBase):
     # Relationship Properties
     streamLink = relationship('StreamLink', back_populates='trapezoidalCS')  #: RELATIONSHIP
 
+    hydraulicColumns = ('bottomWidth', 'bankfullDepth', 'sideSlope')
+
     def __init__(self, mannings_n, bottomWidth, bankfullDepth, sideSlope, mRiver, kRiver, erode, subsurface,
                  maxErosion):
         """
@@ -1672,3 +2027,17 @@ class TrapezoidalCS(DeclarativeBase):
                 self.erode == other.erode and
                 self.subsurface == other.subsurface and
                 self.maxErosion == other.maxErosion)
+
+
+BreakpointCS._listenForHydraulicChanges()
+TrapezoidalCS._listenForHydraulicChanges()
+
+
+@event.listens_for(Breakpoint.x, 'set')
+@event.listens_for(Breakpoint.y, 'set')
+def _breakpointMoved(breakpoint, value, oldValue, initiator):
+    """
+    Reset the hydraulic property arrays when a breakpoint moves
+    """
+    if breakpoint.crossSection is not None:
+        breakpoint.crossSection._resetHydraulics()
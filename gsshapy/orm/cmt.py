@@ -23,7 +23,7 @@ import numpy as np
 import pandas as pd
 from osgeo import gdalconst
 from gazar.grid import resample_grid
-from sqlalchemy import ForeignKey, Column
+from sqlalchemy import ForeignKey, Column, Index
 from sqlalchemy.types import Integer, Float, String
 from sqlalchemy.orm import relationship
 
@@ -826,6 +826,7 @@ class MTValue(DeclarativeBase):
     __tablename__ = 'cmt_map_table_values'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_cmt_map_table_values_map_table_index_contaminant', 'mapTableID', 'mapTableIndexID', 'contaminantID'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
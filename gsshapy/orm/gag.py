@@ -13,10 +13,9 @@ __all__ = ['PrecipFile',
            'PrecipValue',
            'PrecipGage']
 
-from future.utils import iteritems
-from sqlalchemy import ForeignKey, Column, Table
+from sqlalchemy import ForeignKey, Column, Table, Index
 from sqlalchemy.types import Integer, DateTime, String, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 
 from . import DeclarativeBase
 from ..base.file_base import GsshaPyFileObjectBase
@@ -25,7 +24,8 @@ from ..lib import pivot, parsetools as pt, gag_chunk as gak
 
 gag_assoc_event_gage = Table('gag_assoc_event_gage', DeclarativeBase.metadata,
                              Column('gageID', Integer, ForeignKey('gag_coord.id')),
-                             Column('eventID', Integer, ForeignKey('gag_events.id')))
+                             Column('eventID', Integer, ForeignKey('gag_events.id')),
+                             Index('ix_gag_assoc_event_gage_event', 'eventID', 'gageID'))
 
 
 class PrecipFile(DeclarativeBase, GsshaPyFileObjectBase):
@@ -68,14 +68,9 @@ class PrecipFile(DeclarativeBase, GsshaPyFileObjectBase):
         # Dictionary of keywords/cards and parse function names
         KEYWORDS = ('EVENT',)
 
-        # Parse file into chunks associated with keywords/cards
+        # Parse file one chunk at a time in file order
         with open(path, 'r') as f:
-            chunks = pt.chunk(KEYWORDS, f)
-
-        # Parse chunks associated with each key
-        for key, chunkList in iteritems(chunks):
-            # Parse each chunk in the chunk list
-            for chunk in chunkList:
+            for key, chunk in pt.iter_chunks(KEYWORDS, f):
                 result = gak.eventChunk(key, chunk)
                 self._createGsshaPyObjects(result)
 
@@ -86,15 +81,21 @@ class PrecipFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         Precipitation File Write to File Method
         """
-        # Retrieve the events associated with this PrecipFile
-        events = self.precipEvents
+        # Retrieve the events associated with this PrecipFile with their values and gages
+        events = session.query(PrecipEvent).\
+            filter(PrecipEvent.precipFile == self).\
+            order_by(PrecipEvent.id).\
+            options(selectinload(PrecipEvent.values),
+                    selectinload(PrecipEvent.gages)).\
+            all()
 
         # Write each event to file
         for event in events:
             openFile.write('EVENT "%s"\nNRGAG %s\nNRPDS %s\n' % (event.description, event.nrGag, event.nrPds))
 
             if event.nrGag > 0:
-                values = event.values
+                # Keep the values in the order they were read
+                values = sorted(event.values, key=lambda value: value.id)
 
                 valList = []
 
@@ -103,7 +104,7 @@ class PrecipFile(DeclarativeBase, GsshaPyFileObjectBase):
                 for value in values:
                     valList.append({'ValueType': value.valueType,
                                     'DateTime': value.dateTime,
-                                    'Gage': value.gage.id,
+                                    'Gage': value.coordID,
                                     'Value': value.value})
 
                 # Pivot using the function found at:
@@ -113,11 +114,8 @@ class PrecipFile(DeclarativeBase, GsshaPyFileObjectBase):
                 ## TODO: Create custom pivot function that can work with sqlalchemy
                 ## objects explicitly without the costly conversion.
 
-                # Create an empty set for obtaining a list of unique gages
-                gages = session.query(PrecipGage). \
-                    filter(PrecipGage.event == event). \
-                    order_by(PrecipGage.id). \
-                    all()
+                # Gages are written in the order they were read
+                gages = sorted(event.gages, key=lambda gage: gage.id)
 
                 for gage in gages:
                     openFile.write('COORD %s %s "%s"\n' % (gage.x, gage.y, gage.description))
@@ -227,6 +225,7 @@ class PrecipValue(DeclarativeBase):
     __tablename__ = 'gag_values'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_gag_values_event_gage', 'eventID', 'coordID'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
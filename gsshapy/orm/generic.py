@@ -10,7 +10,7 @@
 
 __all__ = ['GenericFile']
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.types import Integer, String, LargeBinary
 from sqlalchemy.orm import relationship
 
@@ -29,6 +29,7 @@ class GenericFile(DeclarativeBase, GsshaPyFileObjectBase):
     __tablename__ = 'gen_generic_files'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_gen_generic_files_project_file_extension', 'projectFileID', 'fileExtension'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -15,11 +15,12 @@ __all__ = ['GridPipeCell',
 from future.utils import iteritems
 from sqlalchemy import ForeignKey, Column
 from sqlalchemy.types import Integer, Float, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 
 from . import DeclarativeBase
 from ..base.file_base import GsshaPyFileObjectBase
 from ..lib import parsetools as pt
+from ..lib.grid_lookup import GridCellLookup, projectGridColumns, readGridCellLookup
 
 
 class GridPipeFile(DeclarativeBase, GsshaPyFileObjectBase):
@@ -56,6 +57,58 @@ class GridPipeFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         GsshaPyFileObjectBase.__init__(self)
 
+    def getCellLookup(self, session, numColumns=None):
+        """
+        Retrieve the mapping between grid cells and pipe nodes as a sparse lookup.
+
+        The lookup is built from a single query of the cell and node columns, so no GridPipeCell or GridPipeNode
+        objects are loaded.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database.
+            numColumns (int, optional): Number of columns of the model grid. Defaults to the COLS card or watershed
+                mask of the project file.
+
+        Returns:
+            :class:`gsshapy.lib.grid_lookup.GridCellLookup`: The lookup.
+        """
+        if numColumns is None:
+            numColumns = projectGridColumns(self.projectFile)
+
+        rows = session.query(GridPipeCell.cellI,
+                             GridPipeCell.cellJ,
+                             GridPipeNode.linkNumber,
+                             GridPipeNode.nodeNumber,
+                             GridPipeNode.fractPipeLength).\
+            join(GridPipeNode, GridPipeNode.gridPipeCellID == GridPipeCell.id).\
+            filter(GridPipeCell.gridPipeFile == self).\
+            order_by(GridPipeCell.id, GridPipeNode.id).\
+            all()
+
+        return GridCellLookup(cellI=[row[0] for row in rows],
+                              cellJ=[row[1] for row in rows],
+                              linkNumbers=[row[2] for row in rows],
+                              nodeNumbers=[row[3] for row in rows],
+                              fractions=[row[4] for row in rows],
+                              numColumns=numColumns)
+
+    @staticmethod
+    def readCellLookup(path, numColumns=None, gridPath=None):
+        """
+        Build the sparse lookup of grid cells and pipe nodes directly from a grid pipe file without creating any ORM
+        objects or touching the database.
+
+        Args:
+            path (str): Path to the grid pipe file.
+            numColumns (int, optional): Number of columns of the model grid.
+            gridPath (str, optional): Path to the watershed mask or elevation grid of the project. Used for the number
+                of columns if numColumns is not given.
+
+        Returns:
+            :class:`gsshapy.lib.grid_lookup.GridCellLookup`: The lookup.
+        """
+        return readGridCellLookup(path, numColumns=numColumns, gridPath=gridPath)
+
     def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
         """
         Grid Pipe File Read from File Method
@@ -67,14 +120,9 @@ class GridPipeFile(DeclarativeBase, GsshaPyFileObjectBase):
         KEYWORDS = ('PIPECELLS',
                     'CELLIJ')
 
-        # Parse file into chunks associated with keywords/cards
+        # Parse file one chunk at a time in file order
         with open(path, 'r') as f:
-            chunks = pt.chunk(KEYWORDS, f)
-
-        # Parse chunks associated with each key
-        for key, chunkList in iteritems(chunks):
-            # Parse each chunk in the chunk list
-            for chunk in chunkList:
+            for key, chunk in pt.iter_chunks(KEYWORDS, f):
 
                 # Cases
                 if key == 'PIPECELLS':
@@ -98,7 +146,14 @@ class GridPipeFile(DeclarativeBase, GsshaPyFileObjectBase):
         openFile.write('GRIDPIPEFILE\n')
         openFile.write('PIPECELLS %s\n' % self.pipeCells)
 
-        for cell in self.gridPipeCells:
+        # Retrieve GridPipeCells with their nodes
+        cells = session.query(GridPipeCell).\
+            filter(GridPipeCell.gridPipeFile == self).\
+            order_by(GridPipeCell.id).\
+            options(selectinload(GridPipeCell.gridPipeNodes)).\
+            all()
+
+        for cell in cells:
             openFile.write('CELLIJ    %s  %s\n' % (cell.cellI, cell.cellJ))
             openFile.write('NUMPIPES  %s\n' % cell.numPipes)
 
@@ -17,10 +17,11 @@ __all__ = ['GridStreamFile',
 from future.utils import iteritems
 from sqlalchemy import ForeignKey, Column
 from sqlalchemy.types import Integer, Float, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 
 from . import DeclarativeBase
 from ..base.file_base import GsshaPyFileObjectBase
+from ..lib.grid_lookup import GridCellLookup, projectGridColumns, readGridCellLookup
 
 
 class GridStreamFile(DeclarativeBase, GsshaPyFileObjectBase):
@@ -56,6 +57,58 @@ class GridStreamFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         GsshaPyFileObjectBase.__init__(self)
 
+    def getCellLookup(self, session, numColumns=None):
+        """
+        Retrieve the mapping between grid cells and stream nodes as a sparse lookup.
+
+        The lookup is built from a single query of the cell and node columns, so no GridStreamCell or GridStreamNode
+        objects are loaded.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database.
+            numColumns (int, optional): Number of columns of the model grid. Defaults to the COLS card or watershed
+                mask of the project file.
+
+        Returns:
+            :class:`gsshapy.lib.grid_lookup.GridCellLookup`: The lookup.
+        """
+        if numColumns is None:
+            numColumns = projectGridColumns(self.projectFile)
+
+        rows = session.query(GridStreamCell.cellI,
+                             GridStreamCell.cellJ,
+                             GridStreamNode.linkNumber,
+                             GridStreamNode.nodeNumber,
+                             GridStreamNode.nodePercentGrid).\
+            join(GridStreamNode, GridStreamNode.gridStreamCellID == GridStreamCell.id).\
+            filter(GridStreamCell.gridStreamFile == self).\
+            order_by(GridStreamCell.id, GridStreamNode.id).\
+            all()
+
+        return GridCellLookup(cellI=[row[0] for row in rows],
+                              cellJ=[row[1] for row in rows],
+                              linkNumbers=[row[2] for row in rows],
+                              nodeNumbers=[row[3] for row in rows],
+                              fractions=[row[4] for row in rows],
+                              numColumns=numColumns)
+
+    @staticmethod
+    def readCellLookup(path, numColumns=None, gridPath=None):
+        """
+        Build the sparse lookup of grid cells and stream nodes directly from a grid stream file without creating any ORM
+        objects or touching the database.
+
+        Args:
+            path (str): Path to the grid stream file.
+            numColumns (int, optional): Number of columns of the model grid.
+            gridPath (str, optional): Path to the watershed mask or elevation grid of the project. Used for the number
+                of columns if numColumns is not given.
+
+        Returns:
+            :class:`gsshapy.lib.grid_lookup.GridCellLookup`: The lookup.
+        """
+        return readGridCellLookup(path, numColumns=numColumns, gridPath=gridPath)
+
     def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
         """
         Grid Stream File Read from File Method
@@ -67,14 +120,9 @@ class GridStreamFile(DeclarativeBase, GsshaPyFileObjectBase):
         KEYWORDS = ('STREAMCELLS',
                     'CELLIJ')
 
-        # Parse file into chunks associated with keywords/cards
+        # Parse file one chunk at a time in file order
         with open(path, 'r') as f:
-            chunks = pt.chunk(KEYWORDS, f)
-
-        # Parse chunks associated with each key
-        for key, chunkList in iteritems(chunks):
-            # Parse each chunk in the chunk list
-            for chunk in chunkList:
+            for key, chunk in pt.iter_chunks(KEYWORDS, f):
 
                 # Cases
                 if key == 'STREAMCELLS':
@@ -99,7 +147,14 @@ class GridStreamFile(DeclarativeBase, GsshaPyFileObjectBase):
         openFile.write('GRIDSTREAMFILE\n')
         openFile.write('STREAMCELLS %s\n' % self.streamCells)
 
-        for cell in self.gridStreamCells:
+        # Retrieve GridStreamCells with their nodes
+        cells = session.query(GridStreamCell).\
+            filter(GridStreamCell.gridStreamFile == self).\
+            order_by(GridStreamCell.id).\
+            options(selectinload(GridStreamCell.gridStreamNodes)).\
+            all()
+
+        for cell in cells:
             openFile.write('CELLIJ    %s  %s\n' % (cell.cellI, cell.cellJ))
             openFile.write('NUMNODES  %s\n' % cell.numNodes)
 
@@ -9,28 +9,37 @@
 """
 
 __all__ = ['LinkNodeDatasetFile',
+           'LinkNodeDatasetIndex',
            'LinkNodeTimeStep',
            'LinkDataset',
            'NodeDataset']
 
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from datetime import timedelta, datetime
-from future.utils import iteritems
 import logging
+import os
+import zlib
 
-from sqlalchemy import Column, ForeignKey, func
-from sqlalchemy.types import Integer, String, Float
-from sqlalchemy.orm import relationship
+import numpy as np
+from sqlalchemy import Column, ForeignKey, Index, func
+from sqlalchemy.types import Integer, String, Float, LargeBinary
+from sqlalchemy.orm import relationship, selectinload, object_session
 
 from mapkit.GeometryConverter import GeometryConverter
 from mapkit.ColorRampGenerator import ColorRampEnum, ColorRampGenerator
 
 from . import DeclarativeBase
+from .cif import StreamLink, StreamNode
 from ..base.file_base import GsshaPyFileObjectBase
 from ..lib import parsetools as pt
+from ..lib.kml_stream import KmlStreamWriter, KML_NAMESPACE
 
 log = logging.getLogger(__name__)
 
+# Least recently used indexes built by LinkNodeDatasetFile.readTimeStep and readLinkSeries by path
+_indexCache = OrderedDict()
+
 
 class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
     """
@@ -41,10 +50,29 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
     supporting objects including: :class:`.LinkNodeTimeStep`, :class:`.LinkDataset`, and :class:`.NodeDataset`.
 
     Note: The link node dataset must be linked with the channel input file to generate spatial visualizations.
+
+    Large datasets can be read with ``storage=LinkNodeDatasetFile.ARRAY_STORAGE``. In array storage mode no supporting
+    objects are created. Instead the number of nodes of each link is stored once and the values and statuses of all
+    nodes are stored as compressed float32 and int8 arrays with one row per time step. Use :meth:`linkSeries`,
+    :meth:`nodeSeries` and :meth:`frame` to access the values in either mode. The KML visualizations and
+    :meth:`linkToChannelInputFile` require the default object storage mode.
+
+    Note: float32 keeps about 7 significant digits, so array storage mode writes values of 256 or more with less
+    precision than the 5 decimals of the file (e.g. 1234.56789 is written as 1234.56787). Use object storage mode to
+    write such values back unchanged.
     """
     __tablename__ = 'lnd_link_node_dataset_files'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_lnd_link_node_dataset_files_project_file_extension', 'projectFileID', 'fileExtension'),)
+
+    # Storage modes
+    OBJECT_STORAGE = 'objects'
+    ARRAY_STORAGE = 'array'
+    VALID_STORAGE_MODES = (OBJECT_STORAGE, ARRAY_STORAGE)
+
+    # Number of file indexes kept by readTimeStep and readLinkSeries
+    INDEX_CACHE_SIZE = 8
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -58,6 +86,11 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
     timeStepInterval = Column(Integer)  #: INTEGER
     numTimeSteps = Column(Integer)  #: INTEGER
     startTime = Column(String)  #: STRING
+    storage = Column(String, default=OBJECT_STORAGE)  #: STRING
+    nodeCounts = Column(LargeBinary)  #: BINARY
+    timeStepNumbers = Column(LargeBinary)  #: BINARY
+    valueArray = Column(LargeBinary)  #: BINARY
+    statusArray = Column(LargeBinary)  #: BINARY
 
     # Relationship Properties
     projectFile = relationship('ProjectFile', back_populates='linkNodeDatasets')  #: RELATIONSHIP
@@ -72,6 +105,222 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         GsshaPyFileObjectBase.__init__(self)
 
+    @property
+    def linkNodeOffsets(self):
+        """
+        numpy.ndarray: Offset table of the links. The values of link number ``i`` occupy the columns
+        ``linkNodeOffsets[i - 1]:linkNodeOffsets[i]`` of the value and status arrays. Links without nodes (node count
+        of 0 or -1) occupy a single column.
+        """
+        return self._getArrays()['offsets']
+
+    def linkSeries(self, link, status=False):
+        """
+        Retrieve the values of every node of a link for all time steps.
+
+        Args:
+            link (int): Link number (first link is 1).
+            status (bool, optional): Return the node statuses instead of the values. Defaults to False.
+
+        Returns:
+            numpy.ndarray: Array with shape (time steps, nodes of the link).
+        """
+        arrays = self._getArrays()
+        start, end = self._linkColumns(arrays, link)
+        return arrays['status' if status else 'values'][:, start:end]
+
+    def nodeSeries(self, link, node, status=False):
+        """
+        Retrieve the values of a single node for all time steps.
+
+        Args:
+            link (int): Link number (first link is 1).
+            node (int): Node number within the link (first node is 1).
+            status (bool, optional): Return the node statuses instead of the values. Defaults to False.
+
+        Returns:
+            numpy.ndarray: Array with one value per time step.
+        """
+        arrays = self._getArrays()
+        start, end = self._linkColumns(arrays, link)
+
+        if not 1 <= node <= end - start:
+            raise IndexError('Node {0} does not exist on link {1}.'.format(node, link))
+
+        return arrays['status' if status else 'values'][:, start + node - 1]
+
+    def frame(self, t, status=False):
+        """
+        Retrieve the values of every node for a single time step.
+
+        Args:
+            t (int): Index of the time step (first time step is 0).
+            status (bool, optional): Return the node statuses instead of the values. Defaults to False.
+
+        Returns:
+            numpy.ndarray: Array with one value per node ordered by link, then node. Use :attr:`linkNodeOffsets` to
+            split it by link.
+        """
+        return self._getArrays()['status' if status else 'values'][t]
+
+    @staticmethod
+    def buildIndex(path):
+        """
+        Scan a link node dataset file and record the byte offsets of its time steps and link lines.
+
+        Args:
+            path (str): Path to the link node dataset file.
+
+        Returns:
+            :class:`.LinkNodeDatasetIndex`: The index.
+        """
+        return LinkNodeDatasetIndex(path)
+
+    @classmethod
+    def readTimeStep(cls, path, t, status=False, index=None):
+        """
+        Read the values of every node for a single time step directly from a link node dataset file. Only the lines
+        of the time step are parsed and the database is not used.
+
+        Args:
+            path (str): Path to the link node dataset file.
+            t (int): Index of the time step (first time step is 0).
+            status (bool, optional): Return the node statuses instead of the values. Defaults to False.
+            index (:class:`.LinkNodeDatasetIndex`, optional): Index of the file. Built and cached if not given.
+
+        Returns:
+            numpy.ndarray: Array with one value per node ordered by link, then node (see :meth:`frame`).
+        """
+        index = cls._getIndex(path, index)
+        lines = index.readLines(index.timeStepLinkOffsets(t))
+        counts, values, statuses = _linkLines(lines)
+
+        if status:
+            return np.array(statuses, dtype='i1')
+
+        return np.array(values, dtype='<f4')
+
+    @classmethod
+    def readLinkSeries(cls, path, link, status=False, index=None):
+        """
+        Read the values of every node of a link for all time steps directly from a link node dataset file. Only the
+        lines of the link are parsed and the database is not used.
+
+        Args:
+            path (str): Path to the link node dataset file.
+            link (int): Link number (first link is 1).
+            status (bool, optional): Return the node statuses instead of the values. Defaults to False.
+            index (:class:`.LinkNodeDatasetIndex`, optional): Index of the file. Built and cached if not given.
+
+        Returns:
+            numpy.ndarray: Array with shape (time steps, nodes of the link) (see :meth:`linkSeries`).
+        """
+        index = cls._getIndex(path, index)
+        lines = index.readLines(index.linkOffsets(link))
+        numColumns = max(index.nodeCounts[link - 1], 1)
+        rows = []
+
+        for line in lines:
+            counts, values, statuses = _linkLines([line])
+
+            if len(values) != numColumns:
+                raise ValueError('The number of nodes of link {0} changes between time steps in {1}.'.format(link,
+                                                                                                              path))
+
+            rows.append(statuses if status else values)
+
+        return np.array(rows, dtype='i1' if status else '<f4').reshape((len(rows), numColumns))
+
+    @classmethod
+    def _getIndex(cls, path, index=None):
+        """
+        Return the given index or the cached index of the file. The cached index is rebuilt if the file changed and
+        only the INDEX_CACHE_SIZE most recently used indexes are kept. Pass an index explicitly to keep it longer.
+        """
+        if index is not None:
+            return index
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime, stat.st_size)
+        cached = _indexCache.pop(path, None)
+
+        if cached is None or cached[0] != key:
+            cached = (key, LinkNodeDatasetIndex(path))
+
+        # move to most recently used position
+        _indexCache[path] = cached
+
+        while len(_indexCache) > max(cls.INDEX_CACHE_SIZE, 0):
+            _indexCache.popitem(last=False)
+
+        return cached[1]
+
+    def _linkColumns(self, arrays, link):
+        """
+        Column range of a link in the value and status arrays
+        """
+        offsets = arrays['offsets']
+
+        if not 1 <= link < len(offsets):
+            raise IndexError('Link {0} does not exist in {1}.'.format(link, self.name))
+
+        return offsets[link - 1], offsets[link]
+
+    def _getArrays(self):
+        """
+        Decode the arrays of array storage mode or assemble them from the supporting objects. The result is cached.
+        """
+        arrays = getattr(self, '_arrays', None)
+
+        if arrays is not None:
+            return arrays
+
+        if self.storage == self.ARRAY_STORAGE:
+            counts = np.frombuffer(zlib.decompress(self.nodeCounts), dtype='<i4')
+            timeSteps = np.frombuffer(zlib.decompress(self.timeStepNumbers), dtype='<i4')
+            offsets = _offsetsFromCounts(counts)
+            shape = (len(timeSteps), offsets[-1])
+            values = np.frombuffer(zlib.decompress(self.valueArray), dtype='<f4').reshape(shape)
+            status = np.frombuffer(zlib.decompress(self.statusArray), dtype='i1').reshape(shape)
+
+        else:
+            session = object_session(self)
+            linkNodeTimeSteps = session.query(LinkNodeTimeStep).\
+                filter(LinkNodeTimeStep.linkNodeDataset == self).\
+                order_by(LinkNodeTimeStep.id).\
+                options(selectinload(LinkNodeTimeStep.linkDatasets).
+                        selectinload(LinkDataset.nodeDatasets)).\
+                all()
+
+            counts = np.array([], dtype='<i4')
+
+            if linkNodeTimeSteps:
+                counts = np.array([linkDataset.numNodeDatasets
+                                   for linkDataset in linkNodeTimeSteps[0].linkDatasets], dtype='<i4')
+
+            timeSteps = np.array([timeStep.timeStep for timeStep in linkNodeTimeSteps], dtype='<i4')
+            offsets = _offsetsFromCounts(counts)
+            values = np.zeros((len(timeSteps), offsets[-1]), dtype='<f4')
+            status = np.zeros((len(timeSteps), offsets[-1]), dtype='i1')
+
+            for t, timeStep in enumerate(linkNodeTimeSteps):
+                column = 0
+
+                for linkDataset in timeStep.linkDatasets:
+                    for nodeDataset in linkDataset.nodeDatasets:
+                        values[t, column] = nodeDataset.value
+                        status[t, column] = nodeDataset.status or 0
+                        column += 1
+
+        self._arrays = {'counts': counts,
+                        'timeSteps': timeSteps,
+                        'offsets': offsets,
+                        'values': values,
+                        'status': status}
+
+        return self._arrays
+
     def linkToChannelInputFile(self, session, channelInputFile, force=False):
         """
         Create database relationships between the link node dataset and the channel input file.
@@ -80,8 +329,9 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
         geometries are stored in the channel input file. The two files must be linked with database relationships to
         allow the creation of link node dataset visualizations.
 
-        This process is not performed automatically during reading, because it can be very costly in terms of read time.
-        This operation can only be performed after both files have been read into the database.
+        This process is not performed automatically during reading. This operation can only be performed after both
+        files have been read into the database. Link datasets are matched to stream links and node datasets to stream
+        nodes by their positions, and the matches are applied with bulk UPDATE statements.
 
         Args:
             session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database
@@ -98,33 +348,58 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
         # Set the channel input file relationship
         self.channelInputFile = channelInputFile
 
-        # Retrieve the fluvial stream links
-        orderedLinks = channelInputFile.getOrderedLinks(session)
+        # Retrieve the ids of the fluvial stream links in link number order
+        streamLinkIDs = [streamLinkID for streamLinkID, in session.query(StreamLink.id).
+                         filter(StreamLink.channelInputFile == channelInputFile).
+                         order_by(StreamLink.linkNumber)]
 
-        # Retrieve the LinkNodeTimeStep objects
-        timeSteps = self.timeSteps
+        # Retrieve the ids of the stream nodes of each link
+        streamNodeIDs = dict()
 
-        # Link each link dataset in each time step
-        for timeStep in timeSteps:
-            # Retrieve link datasets
-            linkDatasets = timeStep.linkDatasets
+        for streamNodeID, streamLinkID in session.query(StreamNode.id, StreamNode.linkID).\
+                join(StreamLink).\
+                filter(StreamLink.channelInputFile == channelInputFile).\
+                order_by(StreamNode.linkID, StreamNode.id):
+            streamNodeIDs.setdefault(streamLinkID, []).append(streamNodeID)
 
-            # Link each node dataset
-            for l, linkDataset in enumerate(linkDatasets):
-                # Get the fluvial link and nodes
-                streamLink = orderedLinks[l]
-                streamNodes = streamLink.nodes
+        # Map each link dataset to the stream link at the same position in its time step
+        linkMappings = []
+        linkDatasetLinks = dict()
+        previousTimeStepID = None
 
-                # Link link datasets to fluvial links
-                linkDataset.link = streamLink
+        for linkDatasetID, timeStepID in session.query(LinkDataset.id, LinkDataset.timeStepID).\
+                filter(LinkDataset.linkNodeDatasetFile == self).\
+                order_by(LinkDataset.timeStepID, LinkDataset.id):
+            if timeStepID != previousTimeStepID:
+                l = 0
+                previousTimeStepID = timeStepID
 
-                # Retrieve node datasets
-                nodeDatasets = linkDataset.nodeDatasets
+            if l < len(streamLinkIDs):
+                linkMappings.append({'id': linkDatasetID, 'streamLinkID': streamLinkIDs[l]})
+                linkDatasetLinks[linkDatasetID] = streamLinkIDs[l]
+
+            l += 1
+
+        # Map each node dataset to the stream node at the same position in its link
+        nodeMappings = []
+        previousLinkDatasetID = None
+
+        for nodeDatasetID, linkDatasetID in session.query(NodeDataset.id, NodeDataset.linkDatasetID).\
+                filter(NodeDataset.linkNodeDatasetFile == self).\
+                order_by(NodeDataset.linkDatasetID, NodeDataset.id):
+            if linkDatasetID != previousLinkDatasetID:
+                n = 0
+                previousLinkDatasetID = linkDatasetID
+                nodeIDs = streamNodeIDs.get(linkDatasetLinks.get(linkDatasetID), [])
+
+            if n < len(nodeIDs):
+                nodeMappings.append({'id': nodeDatasetID, 'streamNodeID': nodeIDs[n]})
 
-                # Link the node dataset with the channel input file nodes
-                if len(nodeDatasets) > 0 and len(streamNodes) > 0:
-                    for n, nodeDataset in enumerate(nodeDatasets):
-                        nodeDataset.node = streamNodes[n]
+            n += 1
+
+        # Apply the mappings with bulk UPDATE statements
+        session.bulk_update_mappings(LinkDataset, linkMappings)
+        session.bulk_update_mappings(NodeDataset, nodeMappings)
 
         session.add(self)
         session.commit()
@@ -144,7 +419,8 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
             session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database
             channelInputFile (:class:`gsshapy.orm.ChannelInputFile`): Channel input file object to be associated with
                 this link node dataset file.
-            path (str, optional): Path to file where KML will be written. Defaults to None.
+            path (str, optional): Path to file where KML will be written. Placemarks are written to the file as they
+                are created. A KMZ archive is written if the path ends with '.kmz'. Defaults to None.
             documentName (str, optional): Name of the KML document. This will be the name that appears in the legend.
                 Defaults to the name of the link node dataset file.
             styles (dict, optional): Custom styles to apply to KML geometry. Defaults to empty dictionary.
@@ -155,7 +431,7 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                    * colorRampEnum (:mod:`mapkit.ColorRampGenerator.ColorRampEnum` or dict): Use ColorRampEnum to select a default color ramp or a dictionary with keys 'colors' and 'interpolatedPoints' to specify a custom color ramp. The 'colors' key must be a list of RGB integer tuples (e.g.: (255, 0, 0)) and the 'interpolatedPoints' must be an integer representing the number of points to interpolate between each color given in the colors list.
 
         Returns:
-            str: KML string
+            str: KML string. None if path is given.
         """
         # Constants
         DECMIAL_DEGREE_METER = 0.00001
@@ -235,19 +511,45 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                                      hour=int(startTimeParts[3]) or 0,
                                      minute=int(startTimeParts[4]) or 0)
 
+        elements = self._getKmlAnimationElements(converter, linkNodeTimeSteps, startDateTime, timeStepDelta,
+                                                 radiusMeters, zScale, mappedColorRamp)
+
+        if path:
+            # Write placemarks to the file as they are created
+            with KmlStreamWriter(path, documentName=documentName) as writer:
+                for element in elements:
+                    writer.write(element)
+
+            return None
+
         # Start the Kml Document
-        kml = ET.Element('kml', xmlns='http://www.opengis.net/kml/2.2')
+        kml = ET.Element('kml', xmlns=KML_NAMESPACE)
         document = ET.SubElement(kml, 'Document')
         docName = ET.SubElement(document, 'name')
         docName.text = documentName
 
+        for element in elements:
+            document.append(element)
+
+        kmlString = ET.tostring(kml)
+
+        return kmlString
+
+    def _getKmlAnimationElements(self, converter, linkNodeTimeSteps, startDateTime, timeStepDelta,
+                                 radiusMeters, zScale, mappedColorRamp):
+        """
+        Generate the elements of the KML animation document one at a time
+        """
         # Apply special style to hide legend items
-        style = ET.SubElement(document, 'Style', id='check-hide-children')
+        style = ET.Element('Style', id='check-hide-children')
         listStyle = ET.SubElement(style, 'ListStyle')
         listItemType = ET.SubElement(listStyle, 'listItemType')
         listItemType.text = 'checkHideChildren'
-        styleUrl = ET.SubElement(document, 'styleUrl')
+        yield style
+
+        styleUrl = ET.Element('styleUrl')
         styleUrl.text = '#check-hide-children'
+        yield styleUrl
 
         for linkNodeTimeStep in linkNodeTimeSteps:
             # Create current datetime objects
@@ -295,7 +597,7 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                                                         integerRGB[mappedColorRamp.R])
 
                     # Create placemark
-                    placemark = ET.SubElement(document, 'Placemark')
+                    placemark = ET.Element('Placemark')
 
                     # Create style tag and setup styles
                     style = ET.SubElement(placemark, 'Style')
@@ -341,23 +643,28 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                     nodeElevationValue = ET.SubElement(nodeElevationData, 'value')
                     nodeElevationValue.text = str(nodeDataset.value)
 
-
-        kmlString = ET.tostring(kml)
-
-        if path:
-            with open(path, 'w') as f:
-                f.write(kmlString)
-
-        return kmlString
+                    yield placemark
 
 
 
-    def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
+    def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile,
+              storage=OBJECT_STORAGE):
         """
         Link Node Dataset File Read from File Method
         """
+        if storage not in self.VALID_STORAGE_MODES:
+            raise ValueError('Invalid storage mode "{0}". Use one of {1}.'.format(storage, self.VALID_STORAGE_MODES))
+
         # Set file extension property
         self.fileExtension = extension
+        self.storage = storage
+        self._arrays = None
+
+        # Array storage mode accumulators
+        counts = None
+        timeStepNumbers = []
+        valueRows = []
+        statusRows = []
 
         # Dictionary of keywords/cards and parse function names
         KEYWORDS = ('NUM_LINKS',
@@ -366,15 +673,11 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                     'START_TIME',
                     'TS')
 
-        # Parse file into chunks associated with keywords/cards
+        # Parse file one chunk at a time in file order
         with open(path, 'r') as f:
             self.name = f.readline().strip()
-            chunks = pt.chunk(KEYWORDS, f)
 
-        # Parse chunks associated with each key
-        for card, chunkList in iteritems(chunks):
-            # Parse each chunk in the chunk list
-            for chunk in chunkList:
+            for card, chunk in pt.iter_chunks(KEYWORDS, f):
                 schunk = chunk[0].strip().split()
 
                 # Cases
@@ -400,6 +703,20 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                         schunk[5],
                         schunk[6])
 
+                elif card == 'TS' and storage == self.ARRAY_STORAGE:
+                    # TS handler for array storage mode
+                    timeStepNumbers.append(int(schunk[1]))
+                    rowCounts, values, status = _linkLines(chunk[1:])
+
+                    if counts is None:
+                        counts = rowCounts
+                    elif rowCounts != counts:
+                        raise ValueError('The links of time step {0} in {1} do not match the links of the first time '
+                                         'step.'.format(schunk[1], filename))
+
+                    valueRows.append(np.array(values, dtype='<f4'))
+                    statusRows.append(np.array(status, dtype='i1'))
+
                 elif card == 'TS':
                     # TS handler
                     for line in chunk:
@@ -446,14 +763,33 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
                                 nodeDataset.linkDataset = linkDataset
                                 nodeDataset.linkNodeDatasetFile = self
 
+        if storage == self.ARRAY_STORAGE:
+            counts = np.array(counts or [], dtype='<i4')
+            numColumns = _offsetsFromCounts(counts)[-1]
+
+            values = np.array(valueRows, dtype='<f4').reshape((len(valueRows), numColumns))
+            status = np.array(statusRows, dtype='i1').reshape((len(statusRows), numColumns))
 
+            self.nodeCounts = zlib.compress(counts.tobytes())
+            self.timeStepNumbers = zlib.compress(np.array(timeStepNumbers, dtype='<i4').tobytes())
+            self.valueArray = zlib.compress(values.tobytes())
+            self.statusArray = zlib.compress(status.tobytes())
 
     def _write(self, session, openFile, replaceParamFile):
         """
         Link Node Dataset File Write to File Method
         """
-        # Retrieve TimeStep objects
-        timeSteps = self.timeSteps
+        if self.storage == self.ARRAY_STORAGE:
+            self._writeArrays(openFile)
+            return
+
+        # Retrieve TimeStep objects with their link and node datasets in one query per level
+        timeSteps = session.query(LinkNodeTimeStep).\
+            filter(LinkNodeTimeStep.linkNodeDataset == self).\
+            order_by(LinkNodeTimeStep.id).\
+            options(selectinload(LinkNodeTimeStep.linkDatasets).
+                    selectinload(LinkDataset.nodeDatasets)).\
+            all()
 
         # Write Lines
         openFile.write('%s\n' % self.name)
@@ -494,6 +830,171 @@ class LinkNodeDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
             # Insert empty line between time steps
             openFile.write('\n')
 
+    def _writeArrays(self, openFile):
+        """
+        Link Node Dataset File Write to File Method for array storage mode
+        """
+        arrays = self._getArrays()
+        counts = arrays['counts'].tolist()
+        offsets = arrays['offsets'].tolist()
+
+        # Write Lines
+        openFile.write('%s\n' % self.name)
+        openFile.write('NUM_LINKS     %s\n' % self.numLinks)
+        openFile.write('TIME_STEP     %s\n' % self.timeStepInterval)
+        openFile.write('NUM_TS        %s\n' % self.numTimeSteps)
+        openFile.write('START_TIME    %s\n' % self.startTime)
+
+        for t, timeStep in enumerate(arrays['timeSteps'].tolist()):
+            openFile.write('TS    %s\n' % timeStep)
+
+            values = arrays['values'][t].tolist()
+            status = arrays['status'][t].tolist()
+
+            for l, numNodeDatasets in enumerate(counts):
+                # Write number of node datasets values
+                openFile.write('{0}   '.format(numNodeDatasets))
+
+                if numNodeDatasets > 0:
+                    for column in range(offsets[l], offsets[l + 1]):
+                        # Write status and value
+                        openFile.write('{0}  {1:.5f}   '.format(status[column], values[column]))
+                elif numNodeDatasets < 0:
+                    openFile.write('{0:.5f}'.format(values[offsets[l]]))
+                else:
+                    openFile.write('{0:.3f}'.format(values[offsets[l]]))
+
+                # Write new line character after each link dataset
+                openFile.write('\n')
+
+            # Insert empty line between time steps
+            openFile.write('\n')
+
+
+class LinkNodeDatasetIndex(object):
+    """
+    Byte offsets of the time steps and link lines of a link node dataset file.
+
+    The file is scanned once without parsing the values. The index can then be used to read single time steps or link
+    series with :meth:`LinkNodeDatasetFile.readTimeStep` and :meth:`LinkNodeDatasetFile.readLinkSeries`.
+
+    Args:
+        path (str): Path to the link node dataset file.
+
+    Attributes:
+        timeSteps (numpy.ndarray): Time step numbers.
+        timeStepOffsets (numpy.ndarray): Byte offsets of the TS lines.
+        linkLineOffsets (numpy.ndarray): Byte offsets of the link lines with shape (time steps, links).
+        nodeCounts (numpy.ndarray): Node count of each link.
+        linkNodeOffsets (numpy.ndarray): Column offsets of the links (see :attr:`LinkNodeDatasetFile.linkNodeOffsets`).
+    """
+    def __init__(self, path):
+        self.path = path
+        timeSteps = []
+        timeStepOffsets = []
+        linkOffsets = []
+        counts = []
+
+        with open(path, 'rb') as f:
+            offset = 0
+
+            for line in f:
+                sline = line.split(None, 1)
+
+                if sline and sline[0] == b'TS':
+                    # Time step header
+                    timeSteps.append(int(sline[1]))
+                    timeStepOffsets.append(offset)
+                    linkOffsets.append([])
+
+                elif sline and linkOffsets:
+                    # Link line
+                    linkOffsets[-1].append(offset)
+
+                    if len(linkOffsets) == 1:
+                        counts.append(int(sline[0]))
+
+                offset += len(line)
+
+        numLinks = len(counts)
+
+        for t, offsets in enumerate(linkOffsets):
+            if len(offsets) != numLinks:
+                raise ValueError('Time step {0} of {1} has {2} links, expected {3}.'.format(timeSteps[t], path,
+                                                                                            len(offsets), numLinks))
+
+        self.timeSteps = np.array(timeSteps, dtype=np.int64)
+        self.timeStepOffsets = np.array(timeStepOffsets, dtype=np.int64)
+        self.linkLineOffsets = np.array(linkOffsets, dtype=np.int64).reshape((len(timeSteps), numLinks))
+        self.nodeCounts = np.array(counts, dtype=np.int32)
+        self.linkNodeOffsets = _offsetsFromCounts(self.nodeCounts)
+
+    def __len__(self):
+        return len(self.timeSteps)
+
+    def timeStepLinkOffsets(self, t):
+        """
+        Byte offsets of the link lines of a time step
+        """
+        if not 0 <= t < len(self.timeSteps):
+            raise IndexError('Time step index {0} is out of range for {1}.'.format(t, self.path))
+
+        return self.linkLineOffsets[t]
+
+    def linkOffsets(self, link):
+        """
+        Byte offsets of the lines of a link in every time step
+        """
+        if not 1 <= link <= len(self.nodeCounts):
+            raise IndexError('Link {0} does not exist in {1}.'.format(link, self.path))
+
+        return self.linkLineOffsets[:, link - 1]
+
+    def readLines(self, offsets):
+        """
+        Read the lines that start at the given byte offsets
+        """
+        lines = []
+
+        with open(self.path, 'rb') as f:
+            for offset in offsets.tolist():
+                f.seek(offset)
+                lines.append(f.readline().decode('ascii'))
+
+        return lines
+
+
+def _offsetsFromCounts(counts):
+    """
+    Offset table from the node counts of the links. Links without nodes occupy a single column.
+    """
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(np.maximum(counts, 1), out=offsets[1:])
+    return offsets
+
+
+def _linkLines(lines):
+    """
+    Parse the link lines of a time step into node counts, values and statuses
+    """
+    counts = []
+    values = []
+    status = []
+
+    for line in lines:
+        sline = line.split()
+        numNodeDatasets = int(sline[0])
+        counts.append(numNodeDatasets)
+
+        if numNodeDatasets > 0:
+            status.extend(int(s) for s in sline[1:2 * numNodeDatasets:2])
+            values.extend(float(v) for v in sline[2:2 * numNodeDatasets + 1:2])
+        else:
+            status.append(0)
+            values.append(float(sline[1]))
+
+    return counts, values, status
+
 
 class LinkNodeTimeStep(DeclarativeBase):
     """
@@ -503,6 +1004,7 @@ class LinkNodeTimeStep(DeclarativeBase):
     __tablename__ = 'lnd_time_steps'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_lnd_time_steps_link_node_dataset_file', 'linkNodeDatasetFileID', 'timeStep'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -529,6 +1031,7 @@ class LinkDataset(DeclarativeBase):
     """
     __tablename__ = 'lnd_link_datasets'
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_lnd_link_datasets_time_step', 'timeStepID'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -556,6 +1059,7 @@ class NodeDataset(DeclarativeBase):
     """
     __tablename__ = 'lnd_node_datasets'
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_lnd_node_datasets_link_dataset', 'linkDatasetID'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -11,7 +11,7 @@
 __all__ = ['OutputLocationFile',
            'OutputLocation']
 
-from sqlalchemy import ForeignKey, Column
+from sqlalchemy import ForeignKey, Column, Index
 from sqlalchemy.types import Integer, String
 from sqlalchemy.orm import relationship
 
@@ -38,6 +38,7 @@ class OutputLocationFile(DeclarativeBase, GsshaPyFileObjectBase):
     __tablename__ = 'loc_output_location_files'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_loc_output_location_files_project_file_extension', 'projectFileID', 'fileExtension'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -10,7 +10,7 @@
 
 __all__ = ['RasterMapFile']
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.types import Integer, String, Float
 from sqlalchemy.orm import relationship
 from mapkit.sqlatypes import Raster
@@ -46,6 +46,7 @@ class RasterMapFile(DeclarativeBase, GsshaPyFileObjectBase, RasterObjectBase):
 
     # Public Table Metadata
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_raster_maps_project_file_extension', 'projectFileID', 'fileExtension'),)
     rasterColumnName = 'raster'  #: Raster column name
     defaultNoDataValue = 0  #: Default no data value
 
@@ -14,7 +14,6 @@ __all__ = ['ProjectFile',
 import json
 import logging
 import os
-import re
 import sys
 
 import numpy as np
@@ -22,7 +21,6 @@ from osgeo import ogr, osr
 from pyproj import Proj, transform
 from pytz import timezone
 from shapely.wkb import loads as shapely_loads
-import shlex
 from gazar.grid import GDALGrid
 from timezonefinder import TimezoneFinder
 import xml.etree.ElementTree as ET
@@ -34,7 +32,16 @@ from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 
 from . import DeclarativeBase
 from ..base.file_base import GsshaPyFileObjectBase
+from ..lib import prj_chunk as prc
+from ..lib.validation import (ValidationReport, ERROR, rasterTextToArray, findMissingLinkNodes, findCellsOutsideMask,
+                              findUncoveredIndices)
+from ..util.instrumentation import instrument
 from .file_io import *
+from .cif import StreamLink, StreamNode
+from .cmt import MapTable, MTIndex, MTValue
+from .gpi import GridPipeCell
+from .gst import GridStreamCell, GridStreamNode
+from .spn import SuperLink, SuperNode, SuperJunction
 
 log = logging.getLogger(__name__)
 
@@ -108,6 +115,7 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
     MAP_TYPES_SUPPORTED = (1,)
     ALWAYS_READ_AND_WRITE_MAPS = ('ele', 'msk')
     OUTPUT_DIRECTORIES_SUPPORTED = ('REPLACE_FOLDER',)
+    SPN_CHANNEL_INLET_CODE = 999  # Super junctions connected to a channel link and node instead of a cell
 
     INPUT_FILES = {'#PROJECTION_FILE': ProjectionFile,  # WMS
                    '#CHANNEL_POINT_INPUT_WMS': GenericFile,
@@ -241,46 +249,20 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         Project File Read from File Method
         """
-        # Headers to ignore
-        HEADERS = ('GSSHAPROJECT',)
-
-        # WMS Cards to include (don't discount as comments)
-        WMS_CARDS = ('#INDEXGRID_GUID', '#PROJECTION_FILE', '#LandSoil',
-                     '#CHANNEL_POINT_INPUT_WMS')
-
-        GSSHAPY_CARDS = ('#GSSHAPY_EVENT_YML', )
-
         with open(path, 'r') as f:
-            for line in f:
-                if not line.strip():
-                    # Skip empty lines
-                    continue
-
-                elif '#' in line.split()[0] and line.split()[0] \
-                        not in WMS_CARDS + GSSHAPY_CARDS:
-                    # Skip comments designated by the hash symbol
-                    # (with the exception of WMS_CARDS and GSSHAPY_CARDS)
-                    continue
-
-                try:
-                    card = self._extractCard(line, force_relative)
-
-                except:
-                    card = self._extractDirectoryCard(line, force_relative)
+            cards = prc.projectChunk(f, force_relative)
 
-                # Now that the cardName and cardValue are separated
-                # load them into the gsshapy objects
-                if card['name'] not in HEADERS:
-                    # Create GSSHAPY Project Card object
-                    prjCard = ProjectCard(name=card['name'], value=card['value'])
+        for card in cards:
+            # Create GSSHAPY Project Card object
+            prjCard = ProjectCard(name=card['name'], value=card['value'])
 
-                    # Associate ProjectCard with ProjectFile
-                    prjCard.projectFile = self
+            # Associate ProjectCard with ProjectFile
+            prjCard.projectFile = self
 
-                    # Extract MAP_TYPE card value for convenience working
-                    # with output maps
-                    if card['name'] == 'MAP_TYPE':
-                        self.mapType = int(card['value'])
+            # Extract MAP_TYPE card value for convenience working
+            # with output maps
+            if card['name'] == 'MAP_TYPE':
+                self.mapType = int(card['value'])
 
         # Assign properties
         self.srid = spatialReferenceID
@@ -292,8 +274,7 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
         Project File Write to File Method
         """
         # Enforce cards that must be written in certain order
-        PRIORITY_CARDS = ('WMS', 'MASK_WATERSHED', 'REPLACE_LINE',
-                          'REPLACE_PARAMS', 'REPLACE_VALS', 'REPLACE_FOLDER')
+        PRIORITY_CARDS = prc.PRIORITY_CARDS
 
         filename = os.path.split(openFile.name)[1]
         name = filename.split('.')[0]
@@ -759,6 +740,162 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
             db_session.delete(gssha_card)
             db_session.commit()
 
+    def validate(self, session):
+        """
+        Check the consistency of the input files of the project before a run.
+
+        The following checks are run for the files that are in the database:
+
+        * 'gst_link_nodes': LINKNODE references of the grid stream file exist in the channel input file.
+        * 'gpi_cells': Cells of the grid pipe file are inside the watershed mask.
+        * 'spn_cells': Super node cells and super junction cells of the storm pipe network file are inside the
+          watershed mask.
+        * 'spn_link_nodes': Super junctions connected to the channel (inlet code 999) reference existing links and
+          nodes.
+        * 'cmt_index_coverage': The index IDs of each mapping table cover every value of its index map inside the
+          watershed mask.
+
+        Each check runs a column query per table and compares the values as arrays and hashed sets, so no ORM objects
+        are loaded.
+
+        Args:
+            session (:mod:`sqlalchemy.orm.session.Session`): SQLAlchemy session object bound to PostGIS enabled database.
+
+        Returns:
+            :class:`gsshapy.lib.validation.ValidationReport`: Diagnostics of the checks that failed and the checks that
+            were run or skipped.
+        """
+        report = ValidationReport()
+
+        maskText = session.query(RasterMapFile.rasterText).\
+            filter(RasterMapFile.projectFile == self).\
+            filter(RasterMapFile.fileExtension == 'msk').\
+            scalar()
+        mask = rasterTextToArray(maskText) if maskText else None
+
+        linkNodes = None
+
+        if self.channelInputFile is not None:
+            linkNodes = session.query(StreamLink.linkNumber, StreamNode.nodeNumber).\
+                join(StreamNode, StreamNode.linkID == StreamLink.id).\
+                filter(StreamLink.channelInputFile == self.channelInputFile).\
+                all()
+            linkNodes = ([row[0] for row in linkNodes], [row[1] for row in linkNodes])
+
+        # Grid stream file LINKNODE references
+        if self.gridStreamFile is None or linkNodes is None:
+            report.skip('gst_link_nodes', 'The grid stream file or the channel input file is not loaded.')
+        else:
+            rows = session.query(GridStreamNode.linkNumber, GridStreamNode.nodeNumber).\
+                join(GridStreamCell, GridStreamNode.gridStreamCellID == GridStreamCell.id).\
+                filter(GridStreamCell.gridStreamFile == self.gridStreamFile).\
+                all()
+            missing = findMissingLinkNodes([row[0] for row in rows], [row[1] for row in rows], *linkNodes)
+            report.checked.append('gst_link_nodes')
+
+            if missing:
+                report.add('gst_link_nodes', ERROR, 'gst',
+                           '{0} LINKNODE references do not exist in the channel input file.'.format(len(missing)),
+                           missing)
+
+        # Grid pipe file cells
+        if self.gridPipeFile is None or mask is None:
+            report.skip('gpi_cells', 'The grid pipe file or the watershed mask is not loaded.')
+        else:
+            rows = session.query(GridPipeCell.cellI, GridPipeCell.cellJ).\
+                filter(GridPipeCell.gridPipeFile == self.gridPipeFile).\
+                all()
+            outside = findCellsOutsideMask(mask, [row[0] for row in rows], [row[1] for row in rows])
+            report.checked.append('gpi_cells')
+
+            if outside:
+                report.add('gpi_cells', ERROR, 'gpi',
+                           '{0} grid pipe cells are outside of the watershed mask.'.format(len(outside)),
+                           outside)
+
+        # Storm pipe network cells and channel connections
+        if self.stormPipeNetworkFile is None:
+            report.skip('spn_cells', 'The storm pipe network file is not loaded.')
+            report.skip('spn_link_nodes', 'The storm pipe network file is not loaded.')
+        else:
+            superNodeCells = session.query(SuperNode.cellI, SuperNode.cellJ).\
+                join(SuperLink, SuperNode.superLinkID == SuperLink.id).\
+                filter(SuperLink.stormPipeNetworkFile == self.stormPipeNetworkFile).\
+                all()
+            superJunctions = session.query(SuperJunction.inletCode,
+                                           SuperJunction.linkOrCellI,
+                                           SuperJunction.nodeOrCellJ).\
+                filter(SuperJunction.stormPipeNetworkFile == self.stormPipeNetworkFile).\
+                all()
+            junctionCells = [row[1:] for row in superJunctions if row[0] != self.SPN_CHANNEL_INLET_CODE]
+            junctionLinkNodes = [row[1:] for row in superJunctions if row[0] == self.SPN_CHANNEL_INLET_CODE]
+
+            if mask is None:
+                report.skip('spn_cells', 'The watershed mask is not loaded.')
+            else:
+                cells = list(superNodeCells) + junctionCells
+                outside = findCellsOutsideMask(mask, [cell[0] for cell in cells], [cell[1] for cell in cells])
+                report.checked.append('spn_cells')
+
+                if outside:
+                    report.add('spn_cells', ERROR, 'spn',
+                               '{0} super node or super junction cells are outside of the watershed '
+                               'mask.'.format(len(outside)),
+                               outside)
+
+            if linkNodes is None:
+                report.skip('spn_link_nodes', 'The channel input file is not loaded.')
+            else:
+                missing = findMissingLinkNodes([row[0] for row in junctionLinkNodes],
+                                               [row[1] for row in junctionLinkNodes],
+                                               *linkNodes)
+                report.checked.append('spn_link_nodes')
+
+                if missing:
+                    report.add('spn_link_nodes', ERROR, 'spn',
+                               '{0} super junction links and nodes do not exist in the channel input '
+                               'file.'.format(len(missing)),
+                               missing)
+
+        # Mapping table index coverage
+        if self.mapTableFile is None:
+            report.skip('cmt_index_coverage', 'The mapping table file is not loaded.')
+        else:
+            tables = session.query(MapTable.id, MapTable.name, IndexMap.name, IndexMap.rasterText).\
+                join(IndexMap, MapTable.idxMapID == IndexMap.id).\
+                filter(MapTable.mapTableFile == self.mapTableFile).\
+                all()
+            definedIndices = {}
+
+            for mapTableID, index in session.query(MTValue.mapTableID, MTIndex.index).\
+                    join(MTIndex, MTValue.mapTableIndexID == MTIndex.id).\
+                    join(MapTable, MTValue.mapTableID == MapTable.id).\
+                    filter(MapTable.mapTableFile == self.mapTableFile).\
+                    distinct():
+                definedIndices.setdefault(mapTableID, set()).add(index)
+
+            indexGrids = {}
+            report.checked.append('cmt_index_coverage')
+
+            for mapTableID, tableName, indexMapName, rasterText in tables:
+                if not rasterText:
+                    continue
+
+                if indexMapName not in indexGrids:
+                    indexGrids[indexMapName] = rasterTextToArray(rasterText)
+
+                indexGrid = indexGrids[indexMapName]
+                indexMask = mask if mask is not None and mask.shape == indexGrid.shape else None
+                missing = findUncoveredIndices(indexGrid, sorted(definedIndices.get(mapTableID, ())), indexMask)
+
+                if missing:
+                    report.add('cmt_index_coverage', ERROR, 'cmt',
+                               'The {0} mapping table does not define index IDs {1} of the {2} index '
+                               'map.'.format(tableName, ', '.join(str(value) for value in missing), indexMapName),
+                               [(tableName, indexMapName, value) for value in missing])
+
+        return report
+
     def getModelSummaryAsKml(self, session, path=None, documentName=None, withStreamNetwork=True, withNodes=False, styles={}):
         """
         Retrieve a KML representation of the model. Includes polygonized mask map and vector stream network.
@@ -1596,16 +1733,17 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         path = os.path.join(directory, filename)
 
-        if os.path.isfile(path):
-            instance = fileIO()
-            instance.projectFile = self
-            instance.read(directory, filename, session, spatial=spatial,
-                          spatialReferenceID=spatialReferenceID,
-                          replaceParamFile=replaceParamFile, **kwargs)
-            return instance
-        else:
-            self._readBatchOutputForFile(directory, fileIO, filename, session,
-                                         spatial, spatialReferenceID, replaceParamFile)
+        with instrument('invokeRead', fileIO, filename, session):
+            if os.path.isfile(path):
+                instance = fileIO()
+                instance.projectFile = self
+                instance.read(directory, filename, session, spatial=spatial,
+                              spatialReferenceID=spatialReferenceID,
+                              replaceParamFile=replaceParamFile, **kwargs)
+                return instance
+            else:
+                self._readBatchOutputForFile(directory, fileIO, filename, session,
+                                             spatial, spatialReferenceID, replaceParamFile)
 
 
     def _writeXput(self, session, directory, fileCards,
@@ -1772,6 +1910,13 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         Invoke File Write Method on Other Files
         """
+        with instrument('invokeWrite', fileIO, filename, session):
+            self._invokeWriteForFile(fileIO, session, directory, filename, replaceParamFile)
+
+    def _invokeWriteForFile(self, fileIO, session, directory, filename, replaceParamFile):
+        """
+        Retrieve the file object for a card and write it
+        """
         # Default value for instance
         instance = None
 
@@ -1811,44 +1956,7 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
                            replaceParamFile=replaceParamFile)
 
     def _replaceNewFilename(self, filename, name):
-        # Variables
-        pro = False
-        originalProjectName = self.name
-        originalFilename = filename
-        originalPrefix = originalFilename.split('.')[0]
-        extension = originalFilename.split('.')[1]
-
-        # Special case with projection file
-        if '_prj' in originalPrefix:
-            originalPrefix = originalPrefix.split('_')[0]
-            pro = True
-
-        # Handle new name
-        if name is None:
-            # The project name is not changed and file names
-            # stay the same
-            filename = originalFilename
-
-        elif originalPrefix == originalProjectName and pro:
-            # Handle renaming of projection file
-            filename = '%s_prj.%s' % (name, extension)
-
-        elif originalPrefix == originalProjectName:
-            # This check is necessary because not all filenames are
-            # prefixed with the project name. Thus the file prefix
-            # is only changed for files that are prefixed with the
-            # project name
-            filename = '%s.%s' % (name, extension)
-
-        elif originalProjectName in originalPrefix:
-            filename = '%s%s.%s' % (name, originalPrefix.replace(originalProjectName, ''), extension)
-
-        else:
-            # Filename doesn't change for files that don't share the
-            # project prefix. e.g.: hmet.hmt
-            filename = originalFilename
-
-        return filename
+        return prc.newFilename(filename, self.name, name)
 
     def _noneOrNumValue(self, value):
         """
@@ -1866,99 +1974,10 @@ class ProjectFile(DeclarativeBase, GsshaPyFileObjectBase):
         return False
 
     def _extractCard(self, projectLine, force_relative=True):
-        DIRECTORY_PATHS = ('REPLACE_FOLDER',)
-
-        splitLine = shlex.split(projectLine)
-        cardName = splitLine[0]
-
-        # pathSplit will fail on boolean cards (no value
-        # = no second parameter in list (currLine[1])
-        try:
-            # Split the path by / or \\ and retrieve last
-            # item to store relative paths as Card Value
-            pathSplit = re.split('/|\\\\', splitLine[1])
-
-            try:
-                # If the value is able to be converted to a
-                # float (any number) then store value only.
-                # Store all values if there are multiple.
-                float(pathSplit[-1])
-                cardValue = ' '.join(splitLine[1:])
-            except:
-                # A string will throw an exception with an attempt to
-                # convert to float. In this case wrap the string
-                # in double quotes.
-                if cardName == 'WMS' or not force_relative:
-                    cardValue = ' '.join(splitLine[1:])
-                elif '.' in pathSplit[-1]:
-                    if cardName == '#INDEXGRID_GUID':
-                        try:
-                            # Get WMS ID for Index Map as part of value
-                            cardValue = '"%s" "%s"' % (pathSplit[-1], splitLine[2])
-                        except:
-                            # Like normal if the ID isn't there
-                            cardValue = '"%s"' % pathSplit[-1]
-                    else:
-                        # If the string contains a '.' it is a path: wrap in double quotes
-                        cardValue = '"%s"' % pathSplit[-1]
-                elif pathSplit[-1] == '':
-                    # For directory cards with unix run through
-                    # _extractDirectoryCard() method to extract relative
-                    # path to the directory.
-                    cardValue = self._extractDirectoryCard(projectLine)['value']
-
-                elif cardName in DIRECTORY_PATHS:
-                    cardValue = '"%s"' % pathSplit[-1]
-                else:
-                    # Else it is a card name/option don't wrap in quotes
-                    cardValue = pathSplit[-1]
-
-        # For boolean cards store None
-        except:
-            cardValue = None
-
-        return {'name': cardName, 'value': cardValue}
+        return prc.cardChunk(projectLine, force_relative)
 
     def _extractDirectoryCard(self, projectLine, force_relative=True):
-        PROJECT_PATH = ('PROJECT_PATH')
-
-        # Handle special case with directory cards in windows.
-        # shlex.split fails because windows directory cards end
-        # with an escape character. (e.g.: "this\path\ends\with\escape\")
-        currLine = projectLine.strip().split()
-
-        # Extract Card Name from the first item in the list
-        cardName = currLine[0]
-        preValue = currLine[1].strip('"').strip("'")
-
-        if not force_relative:
-            cardValue = preValue
-        else:
-            if cardName in PROJECT_PATH:
-                # Project as relative is the current directory (empty string)
-                cardValue = '""'
-            else:
-                # Pull only the last directory to make it relative
-                if preValue.endswith('/'):
-                    splath = preValue.split('/')
-                    dirname = splath[-2]
-
-                elif preValue.endswith('\\\\'):
-                    splath = preValue.split('\\\\')
-                    dirname = splath[-2]
-
-                elif preValue.endswith('\\'):
-                    splath = preValue.split('\\')
-                    dirname = splath[-2]
-
-                else:
-                    dirname = os.path.basename(preValue)
-
-                # Eliminate slashes to make it OS agnostic
-                basename = dirname.replace('\\', '')
-                cardValue = '"%s"' % basename.replace('/', '')
-
-        return {'name': cardName, 'value': cardValue}
+        return prc.directoryCardChunk(projectLine, force_relative)
 
 
 class ProjectCard(DeclarativeBase):
@@ -2002,19 +2021,4 @@ class ProjectCard(DeclarativeBase):
         Returns:
             str: Card and value as they would be written to the project file.
         """
-        # Determine number of spaces between card and value for nice alignment
-        numSpaces = 25 - len(self.name)
-
-        # Handle special case of booleans
-        if self.value is None:
-            line = '%s\n' % self.name
-        else:
-            if self.name == 'WMS':
-                line = '%s %s\n' % (self.name, self.value)
-            elif newPrefix is None:
-                line = '%s%s%s\n' % (self.name, ' ' * numSpaces, self.value)
-            elif originalPrefix in self.value:
-                line = '%s%s%s\n' % (self.name, ' ' * numSpaces, self.value.replace(originalPrefix, newPrefix))
-            else:
-                line = '%s%s%s\n' % (self.name, ' ' * numSpaces, self.value)
-        return line
+        return prc.cardLine(self.name, self.value, originalPrefix, newPrefix)
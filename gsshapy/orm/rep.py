@@ -12,7 +12,7 @@ __all__ = ['ReplaceParamFile',
            'TargetParameter',
            'ReplaceValFile']
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, event
 from sqlalchemy.types import Integer, String
 from sqlalchemy.orm import relationship
 
@@ -51,6 +51,66 @@ class ReplaceParamFile(DeclarativeBase, GsshaPyFileObjectBase):
         """
         GsshaPyFileObjectBase.__init__(self)
 
+    def getTargetParameterID(self, targetVariable):
+        """
+        Look up the id of the target parameter with the given variable name.
+
+        Args:
+            targetVariable (str): Name of the replacement variable (e.g.: '[ROUGH]').
+
+        Returns:
+            int or None: Id of the target parameter. Will return None if no parameter has the name.
+        """
+        return self._getTargetLookups()[0].get(targetVariable)
+
+    def getTargetVariable(self, parameterID):
+        """
+        Look up the variable name of the target parameter with the given id.
+
+        Args:
+            parameterID (int): Id of the target parameter.
+
+        Returns:
+            str or None: Name of the replacement variable. Will return None if no parameter has the id.
+        """
+        return self._getTargetLookups()[1].get(parameterID)
+
+    def _getTargetLookups(self):
+        """
+        Name to id and id to name dictionaries of the target parameters. The dictionaries are built once and reset when
+        the target parameters change, so lookups do not scan or reload the targetParameters relationship.
+        """
+        lookups = getattr(self, '_targetLookups', None)
+
+        if lookups is not None:
+            return lookups
+
+        nameToID = {}
+        idToName = {}
+        complete = True
+
+        for targetParam in self.targetParameters:
+            if targetParam.id is None:
+                # Ids are not assigned until the parameters are flushed
+                complete = False
+                continue
+
+            nameToID.setdefault(targetParam.targetVariable, targetParam.id)
+            idToName[targetParam.id] = targetParam.targetVariable
+
+        lookups = (nameToID, idToName)
+
+        if complete:
+            self._targetLookups = lookups
+
+        return lookups
+
+    def _resetTargetLookups(self):
+        """
+        Discard the target parameter dictionaries
+        """
+        self._targetLookups = None
+
     def _read(self, directory, filename, session, path, name, extension, spatial, spatialReferenceID, replaceParamFile):
         """
         Replace Param File Read from File Method
@@ -113,6 +173,24 @@ class TargetParameter(DeclarativeBase):
         return '<TargetParameter: TargetVariable=%s, VarFormat=%s>' % (self.targetVariable, self.varFormat)
 
 
+@event.listens_for(ReplaceParamFile.targetParameters, 'append')
+@event.listens_for(ReplaceParamFile.targetParameters, 'remove')
+def _targetParametersChanged(replaceParamFile, targetParam, initiator):
+    """
+    Keep the target parameter dictionaries in sync with the targetParameters relationship
+    """
+    replaceParamFile._resetTargetLookups()
+
+
+@event.listens_for(TargetParameter.targetVariable, 'set')
+def _targetVariableChanged(targetParam, value, oldValue, initiator):
+    """
+    Keep the target parameter dictionaries in sync with renamed parameters
+    """
+    if targetParam.replaceParamFile is not None:
+        targetParam.replaceParamFile._resetTargetLookups()
+
+
 class ReplaceValFile(DeclarativeBase, GsshaPyFileObjectBase):
     """
     Object interface for the Replacement Values File.
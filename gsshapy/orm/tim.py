@@ -14,7 +14,7 @@ __all__ = ['TimeSeriesFile',
 
 import logging
 import pandas as pd
-from sqlalchemy import ForeignKey, Column
+from sqlalchemy import ForeignKey, Column, Index
 from sqlalchemy.types import Integer, Float, String
 from sqlalchemy.orm import relationship
 
@@ -38,6 +38,7 @@ class TimeSeriesFile(DeclarativeBase, GsshaPyFileObjectBase):
     __tablename__ = 'tim_time_series_files'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_tim_time_series_files_project_file_extension', 'projectFileID', 'fileExtension'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
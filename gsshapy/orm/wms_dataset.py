@@ -16,7 +16,7 @@ import logging
 import os
 from zipfile import ZipFile
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.types import Integer, String, Float
 from sqlalchemy.orm import relationship
 from mapkit.RasterLoader import RasterLoader
@@ -47,6 +47,7 @@ class WMSDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
     __tablename__ = 'wms_dataset_files'
 
     tableName = __tablename__  #: Database tablename
+    __table_args__ = (Index('ix_wms_dataset_files_project_file_extension', 'projectFileID', 'fileExtension'),)
 
     # Primary and Foreign Keys
     id = Column(Integer, autoincrement=True, primary_key=True)  #: PK
@@ -327,60 +328,60 @@ class WMSDatasetFile(DeclarativeBase, GsshaPyFileObjectBase):
             KEYWORDS = {'DATASET': wdc.datasetHeaderChunk,
                         'TS': wdc.datasetScalarTimeStepChunk}
 
-            # Open file and read plain text into text field
+            # Parse file one chunk at a time so only a single time step is held in memory
+            header = None
+            timeStep = 0
+
             with open(path, 'r') as f:
-                chunks = pt.chunk(KEYWORDS, f)
-
-            # Parse header chunk first
-            header = wdc.datasetHeaderChunk('DATASET', chunks['DATASET'][0])
-
-            # Parse each time step chunk and aggregate
-            timeStepRasters = []
-
-            for chunk in chunks['TS']:
-                timeStepRasters.append(wdc.datasetScalarTimeStepChunk(chunk, columns, header['numberCells']))
-
-            # Set WMS dataset file properties
-            self.name = header['name']
-            self.numberCells = header['numberCells']
-            self.numberData = header['numberData']
-            self.objectID = header['objectID']
-
-            if header['type'] == 'BEGSCL':
-                self.objectType = header['objectType']
-                self.type = self.SCALAR_TYPE
-
-            elif header['type'] == 'BEGVEC':
-                self.vectorType = header['objectType']
-                self.type = self.VECTOR_TYPE
-
-            # Create WMS raster dataset files for each raster
-            for timeStep, timeStepRaster in enumerate(timeStepRasters):
-                # Create new WMS raster dataset file object
-                wmsRasterDatasetFile = WMSDatasetRaster()
-
-                # Set the wms dataset for this WMS raster dataset file
-                wmsRasterDatasetFile.wmsDataset = self
-
-                # Set the time step and timestamp and other properties
-                wmsRasterDatasetFile.iStatus = timeStepRaster['iStatus']
-                wmsRasterDatasetFile.timestamp = timeStepRaster['timestamp']
-                wmsRasterDatasetFile.timeStep = timeStep + 1
-
-                # If spatial is enabled create PostGIS rasters
-                if spatial:
-                    # Process the values/cell array
-                    wmsRasterDatasetFile.raster = RasterLoader.makeSingleBandWKBRaster(session,
-                                                                                       columns, rows,
-                                                                                       upperLeftX, upperLeftY,
-                                                                                       cellSizeX, cellSizeY,
-                                                                                       0, 0,
-                                                                                       spatialReferenceID,
-                                                                                       timeStepRaster['cellArray'])
-
-                # Otherwise, set the raster text properties
-                else:
-                    wmsRasterDatasetFile.rasterText = timeStepRaster['rasterText']
+                for key, chunk in pt.iter_chunks(KEYWORDS, f):
+                    if key == 'DATASET':
+                        # Parse header chunk (precedes the time step chunks)
+                        header = wdc.datasetHeaderChunk(key, chunk)
+
+                        # Set WMS dataset file properties
+                        self.name = header['name']
+                        self.numberCells = header['numberCells']
+                        self.numberData = header['numberData']
+                        self.objectID = header['objectID']
+
+                        if header['type'] == 'BEGSCL':
+                            self.objectType = header['objectType']
+                            self.type = self.SCALAR_TYPE
+
+                        elif header['type'] == 'BEGVEC':
+                            self.vectorType = header['objectType']
+                            self.type = self.VECTOR_TYPE
+
+                        continue
+
+                    timeStepRaster = wdc.datasetScalarTimeStepChunk(chunk, columns, header['numberCells'])
+                    timeStep += 1
+
+                    # Create new WMS raster dataset file object
+                    wmsRasterDatasetFile = WMSDatasetRaster()
+
+                    # Set the wms dataset for this WMS raster dataset file
+                    wmsRasterDatasetFile.wmsDataset = self
+
+                    # Set the time step and timestamp and other properties
+                    wmsRasterDatasetFile.iStatus = timeStepRaster['iStatus']
+                    wmsRasterDatasetFile.timestamp = timeStepRaster['timestamp']
+                    wmsRasterDatasetFile.timeStep = timeStep
+
+                    # If spatial is enabled create PostGIS rasters
+                    if spatial:
+                        # Process the values/cell array
+                        wmsRasterDatasetFile.raster = RasterLoader.makeSingleBandWKBRaster(session,
+                                                                                           columns, rows,
+                                                                                           upperLeftX, upperLeftY,
+                                                                                           cellSizeX, cellSizeY,
+                                                                                           0, 0,
+                                                                                           spatialReferenceID,
+                                                                                           timeStepRaster['cellArray'])
+
+                    # Otherwise, set the raster text properties
+                    else:
+                        wmsRasterDatasetFile.rasterText = timeStepRaster['rasterText']
 
             # Add current file object to the session
             session.add(self)
@@ -0,0 +1,156 @@
+"""
+********************************************************************************
+* Name: instrumentation
+* Created On: October 18, 2026
+* License: BSD-3 Clause
+********************************************************************************
+"""
+from contextlib import contextmanager
+import json
+import logging
+import time
+
+from sqlalchemy import event
+
+__all__ = ['FileIOInstrumentation',
+           'QueryCounter',
+           'instrument']
+
+log = logging.getLogger(__name__)
+
+# Instrumentation objects that are currently recording
+_active = []
+
+
+class QueryCounter(object):
+    """
+    Context manager that counts the SQL statements executed on the engine bound to a session.
+    """
+    def __init__(self, session):
+        self.count = 0
+        self._bind = None
+
+        if session is not None:
+            try:
+                self._bind = session.get_bind()
+            except Exception:
+                # Unbound sessions issue no queries
+                self._bind = None
+
+    def _increment(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        if self._bind is not None:
+            event.listen(self._bind, 'before_cursor_execute', self._increment)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._bind is not None:
+            event.remove(self._bind, 'before_cursor_execute', self._increment)
+
+
+class FileIOInstrumentation(object):
+    """
+    Records wall time, bytes, rows created and SQL statements for every file object read or written while active.
+
+    Args:
+        callback (callable, optional): Called with each record (dict) as soon as it is complete. Use this to ship
+            timings to an external metrics system.
+
+    Example::
+
+        from gsshapy.util import FileIOInstrumentation
+
+        with FileIOInstrumentation() as instrumentation:
+            project_manager.readProject(directory=gssha_directory,
+                                        projectFileName='example.prj',
+                                        session=db_session)
+
+        print(instrumentation.toJson(indent=2))
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.records = []
+
+    def __enter__(self):
+        _active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active.remove(self)
+
+    def _add(self, record):
+        self.records.append(record)
+
+        if self.callback is not None:
+            try:
+                self.callback(record)
+            except Exception:
+                log.exception('Instrumentation callback failed.')
+
+    def report(self):
+        """
+        Structured report of the recorded operations.
+
+        Returns:
+            dict: ``records`` is the list of records in completion order and ``totals`` sums wall time, bytes, rows
+            and statements by operation.
+        """
+        totals = {}
+
+        for record in self.records:
+            total = totals.setdefault(record['operation'], {'count': 0,
+                                                            'wallTime': 0.0,
+                                                            'bytes': 0,
+                                                            'rows': 0,
+                                                            'statements': 0})
+            total['count'] += 1
+            total['wallTime'] += record['wallTime']
+            total['bytes'] += record['bytes']
+            total['rows'] += record['rows']
+            total['statements'] += record['statements']
+
+        return {'records': [dict(record) for record in self.records],
+                'totals': totals}
+
+    def toJson(self, **kwargs):
+        """
+        Report as a JSON string. Keyword arguments are passed to ``json.dumps``.
+        """
+        return json.dumps(self.report(), **kwargs)
+
+
+@contextmanager
+def instrument(operation, fileObject, filename=None, session=None):
+    """
+    Record a single operation on a file object with every active :class:`.FileIOInstrumentation`.
+
+    Yields the record dictionary so the caller can fill in ``bytes`` and ``rows``, or None when nothing is recording.
+    """
+    if not _active:
+        yield None
+        return
+
+    fileClass = fileObject if isinstance(fileObject, type) else type(fileObject)
+
+    record = {'operation': operation,
+              'fileClass': fileClass.__name__,
+              'filename': filename,
+              'wallTime': 0.0,
+              'bytes': 0,
+              'rows': 0,
+              'statements': 0}
+
+    counter = QueryCounter(session)
+    start = time.time()
+
+    try:
+        with counter:
+            yield record
+    finally:
+        record['wallTime'] = time.time() - start
+        record['statements'] = counter.count
+
+        for instrumentation in list(_active):
+            instrumentation._add(record)
@@ -28,7 +28,7 @@ setup(name='gsshapy',
       url='https://github.com/CI-WATER/gsshapy',
       license='BSD 3-Clause License',
       keywords='GSSHA, database, object relational model',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
       package_data={'': ['grid/land_cover/*.txt']},
       classifiers=[
                 'Intended Audience :: Developers',
@@ -44,9 +44,14 @@ setup(name='gsshapy',
       extras_require={
         'tests': [
             'coveralls',
+            'mock; python_version < "3"',
             'pytest',
             'pytest-cov',
         ],
+        'benchmarks': [
+            'pytest',
+            'pytest-benchmark',
+        ],
         'docs': [
             'mock',
             'sphinx',
@@ -0,0 +1,76 @@
+"""
+********************************************************************************
+* Name: Arc ASCII Writer Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import numpy as np
+import unittest
+
+from gsshapy.grid.arc_ascii import (ArcAsciiWriter, arc_ascii_header,
+                                    format_arc_ascii_body)
+
+
+class TestArcAscii(unittest.TestCase):
+    def setUp(self):
+        self.geotransform = [-1104095.85329, 6164.16736374, 0.0,
+                             4642335.26877244, 0.0, -6164.16736374]
+        self.temp_directory = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.temp_directory)
+
+    def test_header(self):
+        header = arc_ascii_header(self.geotransform, 6, 4)
+        self.assertEqual(header.split('\n'),
+                         ['ncols 4',
+                          'nrows 6',
+                          'xllcorner -1104095.85329',
+                          'yllcorner 4605350.26459',
+                          'cellsize 6164.16736374',
+                          ''])
+
+        header = arc_ascii_header([0.0, 10.0, 0.0, 100.0, 0.0, -5.0], 2, 3)
+        self.assertIn('dx 10.0\ndy 5.0\n', header)
+        self.assertRaises(ValueError, arc_ascii_header,
+                          [0.0, 10.0, 0.0, 100.0, 0.0, 10.0], 2, 3)
+
+    def test_body(self):
+        body = format_arc_ascii_body(np.array([[81.33781, 0.0],
+                                               [0.08137164, -2.5]], dtype=np.float32))
+        self.assertEqual(body, '81.3378 0\n0.0813716 -2.5\n')
+        self.assertEqual(format_arc_ascii_body(np.array([[1.23456]]), precision=3), '1.23\n')
+
+    def test_writer(self):
+        header = arc_ascii_header(self.geotransform, 2, 3)
+        grids = [(path.join(self.temp_directory, '{0}.asc'.format(idx)),
+                  np.arange(6, dtype=np.float64).reshape(2, 3) * idx)
+                 for idx in range(6)]
+
+        for pool_type in ('thread', 'process'):
+            with ArcAsciiWriter(num_workers=2, pool_type=pool_type) as writer:
+                for grid in grids:
+                    writer.write([grid], header)
+
+            for file_path, array in grids:
+                with open(file_path) as ascii_file:
+                    lines = ascii_file.read().split('\n')
+                self.assertEqual('\n'.join(lines[:5]) + '\n', header)
+                np.testing.assert_array_equal(np.loadtxt(lines[5:7]), array)
+
+        self.assertRaises(ValueError, ArcAsciiWriter, 2, 'greenlet')
+
+    def test_writer_error(self):
+        header = arc_ascii_header(self.geotransform, 1, 1)
+        missing = path.join(self.temp_directory, 'missing', 'grid.asc')
+        with self.assertRaises(IOError):
+            with ArcAsciiWriter(num_workers=2) as writer:
+                writer.write([(missing, np.zeros((1, 1)))], header)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -100,5 +100,35 @@ class TestERA5toGSSHA(TestGridTemplate):
                                   ignore_file="hmet_file_list.txt",
                                   raster=True)
 
+    def test_era5_netcdf_file_write_chunks(self):
+        """
+        Test ERA5 lsm_data_to_subset_netcdf write method computed in blocks
+        """
+        self.l2g.chunks = 2
+        netcdf_file_path = os.path.join(self.writeDirectory,
+                                        'gssha_dynamic_era5.nc')
+        self.l2g.lsm_data_to_subset_netcdf(netcdf_file_path,
+                                           self.data_var_map_array)
+
+        # compare netcdf files
+        self._compare_netcdf_files("gssha_dynamic_era5", "gssha_dynamic_era5")
+
+    def test_era5_ascii_file_write_chunks(self):
+        """
+        Test ERA5 lsm_data_to_arc_ascii write method computed in blocks
+        with longitudes converted to -180 to 180 in each block
+        """
+        self.l2g.chunks = 2
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory)
+
+        # Compare all files
+        compare_directory = os.path.join(self.readDirectory, "era5_hmet_data")
+        self._compare_directories(self.hmet_write_directory,
+                                  compare_directory,
+                                  ignore_file="hmet_file_list.txt",
+                                  raster=True)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+"""
+********************************************************************************
+* Name: Grid Cell Lookup Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import unittest
+
+import numpy as np
+
+from gsshapy.orm import GridStreamFile, GridPipeFile, ProjectFile
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lib.grid_lookup import GridCellLookup, sparse
+
+
+class TestGridCellLookup(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _assert_same_lookup(self, fileObject, cells, nodesAttribute, fractionAttribute, filename):
+        bulkLookup = fileObject.readCellLookup(os.path.join(self.readDirectory, filename), numColumns=100)
+        lookup = fileObject.getCellLookup(self.session, numColumns=100)
+
+        for attribute in ('cellIndices', 'linkNumbers', 'nodeNumbers', 'fractions', 'cellPointers', 'linkPointers'):
+            np.testing.assert_array_equal(getattr(lookup, attribute), getattr(bulkLookup, attribute))
+
+        for cell in cells:
+            nodes = getattr(cell, nodesAttribute)
+            linkNumbers, nodeNumbers, fractions = lookup.nodesInCell(cell.cellI, cell.cellJ)
+
+            self.assertEqual(linkNumbers.tolist(), [node.linkNumber for node in nodes])
+            self.assertEqual(nodeNumbers.tolist(), [node.nodeNumber for node in nodes])
+            np.testing.assert_allclose(fractions, [getattr(node, fractionAttribute) for node in nodes])
+            self.assertEqual(lookup.linksInCell(cell.cellI, cell.cellJ).tolist(),
+                             sorted(set(node.linkNumber for node in nodes)))
+
+        for link in set(lookup.linkNumbers.tolist()):
+            expected = sorted(set((cell.cellI, cell.cellJ) for cell in cells
+                                  for node in getattr(cell, nodesAttribute) if node.linkNumber == link))
+            cellI, cellJ = lookup.cellsOfLink(link)
+            self.assertEqual(list(zip(cellI.tolist(), cellJ.tolist())), expected)
+
+        return lookup
+
+    def test_grid_stream_lookup(self):
+        gridStreamFile = GridStreamFile()
+        gridStreamFile.read(directory=self.readDirectory,
+                            filename='standard.gst',
+                            session=self.session)
+
+        lookup = self._assert_same_lookup(gridStreamFile, gridStreamFile.gridStreamCells, 'gridStreamNodes',
+                                          'nodePercentGrid', 'standard.gst')
+
+        # Cell and node queries from the standard file
+        self.assertEqual(lookup.linksInCell(14, 41).tolist(), [3, 10, 11])
+        self.assertEqual(lookup.linksInCell(1, 1).tolist(), [])
+        self.assertEqual(lookup.linksInCell(500, 1).tolist(), [])
+        cellI, cellJ = lookup.cellsOfLink(10, node=11)
+        self.assertEqual(list(zip(cellI.tolist(), cellJ.tolist())), [(14, 41), (15, 41)])
+        self.assertEqual(lookup.cellsOfLink(500)[0].tolist(), [])
+
+    def test_grid_pipe_lookup(self):
+        gridPipeFile = GridPipeFile()
+        gridPipeFile.read(directory=self.readDirectory,
+                          filename='standard.gpi',
+                          session=self.session)
+
+        self._assert_same_lookup(gridPipeFile, gridPipeFile.gridPipeCells, 'gridPipeNodes', 'fractPipeLength',
+                                 'standard.gpi')
+
+    def test_invalid_columns(self):
+        self.assertRaises(ValueError, GridCellLookup, [1], [5], [1], [1], [1.0], numColumns=4)
+
+    def test_query_outside_grid(self):
+        lookup = GridCellLookup(cellI=[1, 2], cellJ=[3, 1], linkNumbers=[5, 6], nodeNumbers=[1, 1],
+                                fractions=[1.0, 1.0], numColumns=3)
+
+        self.assertEqual(lookup.linksInCell(1, 3).tolist(), [5])
+        self.assertEqual(lookup.linksInCell(2, 1).tolist(), [6])
+
+        # Past the last column, before the first column and before the first row
+        for i, j in ((1, 4), (2, 0), (0, 4), (3, 1)):
+            self.assertEqual(lookup.linksInCell(i, j).tolist(), [])
+            self.assertEqual(lookup.nodesInCell(i, j)[0].tolist(), [])
+
+    def test_project_grid_columns(self):
+        gridStreamFile = GridStreamFile()
+        gridStreamFile.read(directory=self.readDirectory,
+                            filename='standard.gst',
+                            session=self.session)
+
+        # Number of columns from the COLS card of the project file
+        projectFile = ProjectFile(name='standard', map_type=1)
+        projectFile.setCard('COLS', '75')
+        gridStreamFile.projectFile = projectFile
+        self.assertEqual(gridStreamFile.getCellLookup(self.session).numColumns, 75)
+
+        # Number of columns from the header of the watershed mask
+        lookup = GridStreamFile.readCellLookup(os.path.join(self.readDirectory, 'standard.gst'),
+                                               gridPath=os.path.join(self.readDirectory, 'standard.msk'))
+        self.assertEqual(lookup.numColumns, 67)
+
+    @unittest.skipIf(sparse is None, 'scipy is not installed')
+    def test_to_sparse(self):
+        lookup = GridCellLookup(cellI=[1, 1, 2], cellJ=[2, 2, 1], linkNumbers=[1, 1, 3], nodeNumbers=[1, 2, 1],
+                                fractions=[0.25, 0.5, 1.0], numColumns=2)
+        matrix = lookup.toSparse()
+
+        self.assertEqual(matrix.shape, (3, 4))
+        self.assertEqual(matrix[1, 1], 0.75)
+        self.assertEqual(matrix[2, 3], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+********************************************************************************
+* Name: Cross Section Hydraulics Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import unittest
+
+import numpy as np
+
+from gsshapy.orm import ChannelInputFile
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lib.hydraulics import (HydraulicTables, trapezoidProperties, breakpointProperties,
+                                    breakpointBankfullDepths)
+
+
+class TestCrossSectionProperties(unittest.TestCase):
+    def test_trapezoid(self):
+        area, wettedPerimeter, topWidth = trapezoidProperties([[0.0, 1.0, 2.0]], [2.0], [2.0])
+
+        np.testing.assert_allclose(area, [[0.0, 4.0, 12.0]])
+        np.testing.assert_allclose(wettedPerimeter, [[2.0, 2.0 + 2.0 * np.sqrt(5.0), 2.0 + 4.0 * np.sqrt(5.0)]])
+        np.testing.assert_allclose(topWidth, [[2.0, 6.0, 10.0]])
+
+    def test_breakpoint_matches_trapezoid(self):
+        # The trapezoid and a rectangle padded with NaN in the same batch
+        stations = [[-4.0, 0.0, 2.0, 6.0],
+                     [0.0, 0.0, 3.0, 3.0]]
+        elevations = [[2.0, 0.0, 0.0, 2.0],
+                      [1.0, 0.0, 0.0, np.nan]]
+        bankfull = breakpointBankfullDepths(elevations)
+        np.testing.assert_allclose(bankfull, [2.0, 0.0])
+
+        depths = np.array([[0.0, 0.5, 1.0, 2.0],
+                           [0.0, 0.25, 0.5, 1.0]])
+        area, wettedPerimeter, topWidth = breakpointProperties(depths, stations, elevations)
+        expected = trapezoidProperties(depths[:1], [2.0], [2.0])
+
+        np.testing.assert_allclose(area[0], expected[0][0])
+        np.testing.assert_allclose(wettedPerimeter[0], expected[1][0])
+        np.testing.assert_allclose(topWidth[0], expected[2][0])
+
+        # Open on the right: one wall and the bottom
+        np.testing.assert_allclose(area[1], [0.0, 0.75, 1.5, 3.0])
+        np.testing.assert_allclose(wettedPerimeter[1], [3.0, 3.25, 3.5, 4.0])
+        np.testing.assert_allclose(topWidth[1], [3.0, 3.0, 3.0, 3.0])
+
+    def test_capacity(self):
+        tables = HydraulicTables(linkNumbers=[4],
+                                 depth=[[0.0, 1.0]],
+                                 area=[[0.0, 4.0]],
+                                 wettedPerimeter=[[2.0, 8.0]],
+                                 topWidth=[[2.0, 6.0]],
+                                 manningsN=[0.04],
+                                 slopes=[0.01])
+
+        table = tables.table(4)
+        np.testing.assert_allclose(table['hydraulicRadius'], [0.0, 0.5])
+        np.testing.assert_allclose(table['capacity'], [0.0, 4.0 * 0.5 ** (2.0 / 3.0) * 0.1 / 0.04])
+        self.assertRaises(IndexError, tables.table, 1)
+
+
+class TestChannelInputFileHydraulics(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_get_hydraulic_tables(self):
+        """
+        Test the tables of the standard channel input file and that cached tables are reset when geometry changes
+        """
+        channelInputFile = ChannelInputFile()
+        channelInputFile.read(directory=self.readDirectory,
+                              filename='standard.cif',
+                              session=self.session)
+
+        fluvialLinks = sorted(channelInputFile.getFluvialLinks(), key=lambda link: link.linkNumber)
+        tables = channelInputFile.getHydraulicTables(self.session, numDepths=5)
+
+        self.assertEqual(tables.linkNumbers.tolist(), [link.linkNumber for link in fluvialLinks])
+        self.assertEqual(tables.depth.shape, (len(fluvialLinks), 5))
+        self.assertTrue(np.all(tables.slopes >= 0.0001))
+
+        # The breakpoint cross section of link 9 has the same shape as the trapezoids
+        np.testing.assert_allclose(tables.table(9)['area'], tables.table(1)['area'])
+        np.testing.assert_allclose(tables.table(9)['wettedPerimeter'], tables.table(1)['wettedPerimeter'])
+        np.testing.assert_allclose(tables.table(1)['area'], [0.0, 1.5, 4.0, 7.5, 12.0])
+
+        # Changing the geometry resets the cache of that cross section only
+        link1 = [link for link in fluvialLinks if link.linkNumber == 1][0]
+        link9 = [link for link in fluvialLinks if link.linkNumber == 9][0]
+        cached = link9.breakpointCS._getHydraulicCache()[5]
+
+        link1.trapezoidalCS.bottomWidth = 4.0
+        link9.breakpointCS.breakpoints[0].y = 4.0
+
+        self.assertEqual(link1.trapezoidalCS._getHydraulicCache(), {})
+        self.assertEqual(link9.breakpointCS._getHydraulicCache(), {})
+        self.assertTrue(5 in fluvialLinks[1].trapezoidalCS._getHydraulicCache())
+
+        tables = channelInputFile.getHydraulicTables(self.session, numDepths=5)
+        np.testing.assert_allclose(tables.table(1)['area'], [0.0, 2.5, 6.0, 10.5, 16.0])
+        self.assertFalse(np.allclose(tables.table(9)['area'], cached[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+********************************************************************************
+* Name: Instrumentation Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from gsshapy.orm import PrecipFile, ProjectFile
+from gsshapy.lib import db_tools as dbt
+from gsshapy.util import FileIOInstrumentation
+from gsshapy.util.instrumentation import instrument
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        # Find db directory path
+        here = os.path.abspath(os.path.dirname(__file__))
+
+        self.readDirectory = os.path.join(here, 'standard')
+        self.writeDirectory = tempfile.mkdtemp()
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.writeDirectory)
+
+    def test_inactive(self):
+        """
+        Test nothing is recorded without an active instrumentation
+        """
+        with instrument('read', PrecipFile, 'standard.gag') as record:
+            self.assertIsNone(record)
+
+    def test_read_write_records(self):
+        """
+        Test records for a single file read and write
+        """
+        received = []
+
+        with FileIOInstrumentation(callback=received.append) as instrumentation:
+            precipFile = PrecipFile()
+            precipFile.read(directory=self.readDirectory,
+                            filename='standard.gag',
+                            session=self.session)
+            precipFile.write(session=self.session,
+                             directory=self.writeDirectory,
+                             name='standard.gag')
+
+        report = instrumentation.report()
+        operations = [record['operation'] for record in report['records']]
+        self.assertEqual(operations, ['commit', 'read', 'write'])
+        self.assertEqual(len(received), 3)
+
+        commit, read, write = report['records']
+        self.assertEqual(read['fileClass'], 'PrecipFile')
+        self.assertEqual(read['filename'], 'standard.gag')
+        self.assertEqual(read['bytes'], os.path.getsize(os.path.join(self.readDirectory, 'standard.gag')))
+        self.assertGreater(read['rows'], 1)
+        self.assertGreater(read['statements'], 0)
+        self.assertGreaterEqual(read['wallTime'], commit['wallTime'])
+        self.assertEqual(write['bytes'], os.path.getsize(os.path.join(self.writeDirectory, 'standard.gag')))
+
+        self.assertEqual(report['totals']['read']['count'], 1)
+        self.assertEqual(json.loads(instrumentation.toJson())['totals']['write']['bytes'], write['bytes'])
+
+        # Nothing is recorded after the block
+        precipFile.write(session=self.session,
+                         directory=self.writeDirectory,
+                         name='standard.gag')
+        self.assertEqual(len(instrumentation.records), 3)
+
+    def test_read_project(self):
+        """
+        Test invokeRead records for a project read
+        """
+        with FileIOInstrumentation() as instrumentation:
+            projectFile = ProjectFile()
+            projectFile.readInput(directory=self.readDirectory,
+                                  projectFileName='standard.prj',
+                                  session=self.session,
+                                  spatial=False)
+
+        records = [record for record in instrumentation.records if record['operation'] == 'invokeRead']
+        self.assertGreater(len(records), 1)
+
+        fileClasses = [fileIO.__name__ for fileIO in ProjectFile.INPUT_FILES.values() if fileIO is not None]
+        fileClasses.append('RasterMapFile')
+
+        for record in records:
+            self.assertIn(record['fileClass'], fileClasses)
+
+
+if __name__ == '__main__':
+    unittest.main()
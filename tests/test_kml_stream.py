@@ -0,0 +1,63 @@
+"""
+********************************************************************************
+* Name: KML Stream Writer Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from gsshapy.lib.kml_stream import KmlStreamWriter, KML_NAMESPACE
+
+
+class TestKmlStreamWriter(unittest.TestCase):
+    def setUp(self):
+        self.writeDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.writeDirectory)
+
+    def _write_placemarks(self, path):
+        with KmlStreamWriter(path, documentName='Stream & Network') as writer:
+            for number in range(3):
+                placemark = ET.Element('Placemark')
+                name = ET.SubElement(placemark, 'name')
+                name.text = str(number)
+                writer.write(placemark)
+
+    def _assert_document(self, kmlString):
+        kml = ET.fromstring(kmlString)
+        document = kml.find('{{{0}}}Document'.format(KML_NAMESPACE))
+
+        self.assertEqual(document.find('{{{0}}}name'.format(KML_NAMESPACE)).text, 'Stream & Network')
+        self.assertEqual([placemark.find('{{{0}}}name'.format(KML_NAMESPACE)).text
+                          for placemark in document.findall('{{{0}}}Placemark'.format(KML_NAMESPACE))],
+                         ['0', '1', '2'])
+
+    def test_kml(self):
+        path = os.path.join(self.writeDirectory, 'network.kml')
+        self._write_placemarks(path)
+
+        with open(path, 'rb') as f:
+            self._assert_document(f.read())
+
+    def test_kmz(self):
+        path = os.path.join(self.writeDirectory, 'network.kmz')
+        self._write_placemarks(path)
+
+        with ZipFile(path) as kmz:
+            self.assertEqual(kmz.namelist(), ['doc.kml'])
+            self.assertEqual(kmz.getinfo('doc.kml').compress_type, ZIP_DEFLATED)
+            self._assert_document(kmz.read('doc.kml'))
+
+        # Temporary KML is removed
+        self.assertEqual(os.listdir(self.writeDirectory), ['network.kmz'])
+
+
+if __name__ == '__main__':
+    unittest.main()
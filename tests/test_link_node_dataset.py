@@ -0,0 +1,229 @@
+"""
+********************************************************************************
+* Name: Link Node Dataset Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from gsshapy.orm import ChannelInputFile, LinkNodeDatasetFile
+from gsshapy.orm import lnd
+from gsshapy.lib import db_tools as dbt
+
+LINK_NODE_DATASET = """CHAN_DEPTH
+NUM_LINKS     4
+TIME_STEP     60
+NUM_TS        2
+START_TIME    1  1    2017  0  0  0
+TS    1
+3   1  0.10000   1  0.20000   0  0.30000
+2   1  1.10000   1  1.20000
+-1   5.50000
+0   6.500
+
+TS    2
+3   1  0.40000   0  0.50000   1  0.60000
+2   1  1.30000   1  1.40000
+-1   7.50000
+0   8.500
+
+"""
+
+
+class TestLinkNodeDatasetStorage(unittest.TestCase):
+    def setUp(self):
+        self.readDirectory = tempfile.mkdtemp()
+        self.writeDirectory = tempfile.mkdtemp()
+
+        with open(os.path.join(self.readDirectory, 'standard.lnd'), 'w') as f:
+            f.write(LINK_NODE_DATASET)
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.readDirectory)
+        shutil.rmtree(self.writeDirectory)
+
+    def _read_n_write(self, storage):
+        linkNodeDatasetFile = LinkNodeDatasetFile()
+        linkNodeDatasetFile.read(directory=self.readDirectory,
+                                 filename='standard.lnd',
+                                 session=self.session,
+                                 storage=storage)
+
+        linkNodeDatasetFile.write(session=self.session,
+                                  directory=self.writeDirectory,
+                                  name='{0}.lnd'.format(storage))
+
+        with open(os.path.join(self.writeDirectory, '{0}.lnd'.format(storage))) as f:
+            return linkNodeDatasetFile, f.read()
+
+    def test_array_storage(self):
+        """
+        Test array storage mode accessors and that both modes write the same file
+        """
+        objectFile, objectText = self._read_n_write(LinkNodeDatasetFile.OBJECT_STORAGE)
+        arrayFile, arrayText = self._read_n_write(LinkNodeDatasetFile.ARRAY_STORAGE)
+
+        self.assertEqual(objectText, arrayText)
+        self.assertEqual(LINK_NODE_DATASET.split(), arrayText.split())
+        self.assertEqual(len(arrayFile.timeSteps), 0)
+
+        for linkNodeDatasetFile in (objectFile, arrayFile):
+            self.assertEqual(linkNodeDatasetFile.linkNodeOffsets.tolist(), [0, 3, 5, 6, 7])
+            np.testing.assert_allclose(linkNodeDatasetFile.linkSeries(2), [[1.1, 1.2], [1.3, 1.4]], rtol=1e-6)
+            np.testing.assert_allclose(linkNodeDatasetFile.nodeSeries(1, 3), [0.3, 0.6], rtol=1e-6)
+            np.testing.assert_array_equal(linkNodeDatasetFile.nodeSeries(1, 2, status=True), [1, 0])
+            np.testing.assert_allclose(linkNodeDatasetFile.frame(1), [0.4, 0.5, 0.6, 1.3, 1.4, 7.5, 8.5], rtol=1e-6)
+            self.assertRaises(IndexError, linkNodeDatasetFile.nodeSeries, 2, 3)
+            self.assertRaises(IndexError, linkNodeDatasetFile.linkSeries, 5)
+
+    def test_array_storage_precision(self):
+        """
+        Test array storage mode writes values of 256 or more with float32 precision
+        """
+        with open(os.path.join(self.readDirectory, 'standard.lnd'), 'w') as f:
+            f.write(LINK_NODE_DATASET.replace('1.10000', '1234.56789').replace('7.50000', '98765.43210'))
+
+        _, objectText = self._read_n_write(LinkNodeDatasetFile.OBJECT_STORAGE)
+        _, arrayText = self._read_n_write(LinkNodeDatasetFile.ARRAY_STORAGE)
+
+        self.assertIn('1234.56789', objectText)
+        self.assertIn('98765.43210', objectText)
+        self.assertIn('1234.56787', arrayText)
+        self.assertIn('98765.42969', arrayText)
+
+        # Values below 256 keep the 5 decimals
+        self.assertEqual(objectText.replace('1234.56789', '1234.56787').replace('98765.43210', '98765.42969'),
+                         arrayText)
+
+    def test_random_access(self):
+        """
+        Test reading single time steps and link series from the file with the offset index
+        """
+        path = os.path.join(self.readDirectory, 'standard.lnd')
+        arrayFile, _ = self._read_n_write(LinkNodeDatasetFile.ARRAY_STORAGE)
+
+        index = LinkNodeDatasetFile.buildIndex(path)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.timeSteps.tolist(), [1, 2])
+        self.assertEqual(index.linkNodeOffsets.tolist(), arrayFile.linkNodeOffsets.tolist())
+
+        for t in range(2):
+            np.testing.assert_array_equal(LinkNodeDatasetFile.readTimeStep(path, t), arrayFile.frame(t))
+            np.testing.assert_array_equal(LinkNodeDatasetFile.readTimeStep(path, t, status=True, index=index),
+                                          arrayFile.frame(t, status=True))
+
+        for link in range(1, 5):
+            np.testing.assert_array_equal(LinkNodeDatasetFile.readLinkSeries(path, link), arrayFile.linkSeries(link))
+            np.testing.assert_array_equal(LinkNodeDatasetFile.readLinkSeries(path, link, status=True, index=index),
+                                          arrayFile.linkSeries(link, status=True))
+
+        self.assertRaises(IndexError, LinkNodeDatasetFile.readTimeStep, path, 2)
+        self.assertRaises(IndexError, LinkNodeDatasetFile.readLinkSeries, path, 5)
+
+    def test_index_cache_size(self):
+        """
+        Test only the most recently used file indexes are cached
+        """
+        paths = []
+
+        for number in range(3):
+            path = os.path.join(self.readDirectory, '{0}.lnd'.format(number))
+            shutil.copy(os.path.join(self.readDirectory, 'standard.lnd'), path)
+            paths.append(os.path.abspath(path))
+
+        cacheSize = LinkNodeDatasetFile.INDEX_CACHE_SIZE
+        LinkNodeDatasetFile.INDEX_CACHE_SIZE = 2
+        lnd._indexCache.clear()
+
+        try:
+            LinkNodeDatasetFile.readTimeStep(paths[0], 0)
+            LinkNodeDatasetFile.readTimeStep(paths[1], 0)
+            LinkNodeDatasetFile.readLinkSeries(paths[0], 1)
+            LinkNodeDatasetFile.readLinkSeries(paths[2], 1)
+
+            self.assertEqual(list(lnd._indexCache), [paths[0], paths[2]])
+        finally:
+            LinkNodeDatasetFile.INDEX_CACHE_SIZE = cacheSize
+            lnd._indexCache.clear()
+
+
+class TestLinkToChannelInputFile(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+
+        self.readDirectory = os.path.join(here, 'standard')
+        self.writeDirectory = tempfile.mkdtemp()
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.writeDirectory)
+
+    def test_link_to_channel_input_file(self):
+        """
+        Test link and node datasets are associated with the stream links and nodes at the same positions
+        """
+        channelInputFile = ChannelInputFile()
+        channelInputFile.read(directory=self.readDirectory,
+                              filename='standard.cif',
+                              session=self.session)
+        orderedLinks = channelInputFile.getOrderedLinks(self.session)
+
+        # Write a link node dataset for the stream network
+        lines = ['CHAN_DEPTH',
+                 'NUM_LINKS     {0}'.format(len(orderedLinks)),
+                 'TIME_STEP     60',
+                 'NUM_TS        2',
+                 'START_TIME    1  1    2017  0  0  0']
+
+        for timeStep in (1, 2):
+            lines.append('TS    {0}'.format(timeStep))
+
+            for streamLink in orderedLinks:
+                numNodes = len(streamLink.nodes)
+
+                if numNodes > 0:
+                    lines.append('{0}   {1}'.format(numNodes, '   '.join('1  0.00000' for _ in range(numNodes))))
+                else:
+                    lines.append('0   0.000')
+
+        with open(os.path.join(self.writeDirectory, 'standard.lnd'), 'w') as f:
+            f.write('\n'.join(lines))
+
+        linkNodeDatasetFile = LinkNodeDatasetFile()
+        linkNodeDatasetFile.read(directory=self.writeDirectory,
+                                 filename='standard.lnd',
+                                 session=self.session)
+
+        linkNodeDatasetFile.linkToChannelInputFile(self.session, channelInputFile)
+
+        self.assertEqual(linkNodeDatasetFile.channelInputFile, channelInputFile)
+
+        for timeStep in linkNodeDatasetFile.timeSteps:
+            for streamLink, linkDataset in zip(orderedLinks, timeStep.linkDatasets):
+                self.assertEqual(linkDataset.link, streamLink)
+
+                if streamLink.nodes:
+                    self.assertEqual([nodeDataset.node for nodeDataset in linkDataset.nodeDatasets], streamLink.nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+********************************************************************************
+* Name: Lite Object Model Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from gsshapy.lite import ProjectFile, TextFile
+
+
+class TestLiteProjectFile(unittest.TestCase):
+    def setUp(self):
+        # Find db directory path
+        here = os.path.abspath(os.path.dirname(__file__))
+
+        self.readDirectory = os.path.join(here, 'standard')
+        self.writeDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.writeDirectory)
+
+    def _compare_files(self, filenameO, filenameN):
+        """
+        Compare the contents of two files
+        """
+        with open(os.path.join(self.readDirectory, filenameO)) as fileO:
+            linesO = fileO.read().strip().split()
+
+        with open(os.path.join(self.writeDirectory, filenameN)) as fileN:
+            linesN = fileN.read().strip().split()
+
+        self.assertEqual(linesO, linesN)
+
+    def test_project_file_read_write(self):
+        """
+        Test project file round trip without a database
+        """
+        prjFile = ProjectFile()
+        prjFile.read(directory=self.readDirectory,
+                     filename='standard.prj')
+
+        self.assertEqual(prjFile.name, 'standard')
+        self.assertEqual(prjFile.mapType, 1)
+        self.assertFalse(hasattr(prjFile, '__dict__'))
+
+        prjFile.write(session=None,
+                      directory=self.writeDirectory,
+                      name='standard')
+
+        self._compare_files('standard.prj', 'standard.prj')
+
+    def test_project_file_cards(self):
+        """
+        Test card edits without a database
+        """
+        prjFile = ProjectFile()
+        prjFile.read(directory=self.readDirectory,
+                     filename='standard.prj')
+
+        prjFile.setCard('TOT_TIME', '60')
+        prjFile.setCard('NEW_CARD', 'new.txt', add_quotes=True)
+        prjFile.deleteCard('METRIC')
+
+        self.assertEqual(prjFile.getCard('TOT_TIME').value, '60')
+        self.assertEqual(prjFile.getCard('new_card').value, '"new.txt"')
+        self.assertIsNone(prjFile.getCard('METRIC'))
+
+        prjFile.write(session=None,
+                      directory=self.writeDirectory,
+                      name='standard')
+
+        reread = ProjectFile()
+        reread.read(directory=self.writeDirectory,
+                    filename='standard.prj')
+
+        self.assertEqual(reread.getCard('TOT_TIME').value, '60')
+        self.assertEqual(reread.getCard('NEW_CARD').value, '"new.txt"')
+        self.assertIsNone(reread.getCard('METRIC'))
+
+    def test_project_read_write_renamed(self):
+        """
+        Test referenced files are carried through and renamed with the project
+        """
+        prjFile = ProjectFile()
+        prjFile.readProject(directory=self.readDirectory,
+                            projectFileName='standard.prj')
+
+        self.assertIsInstance(prjFile.files['standard.cif'], TextFile)
+
+        prjFile.writeProject(session=None,
+                             directory=self.writeDirectory,
+                             name='renamed')
+
+        self._compare_files('standard.cif', 'renamed.cif')
+        self._compare_files('standard_prj.pro', 'renamed_prj.pro')
+        self._compare_files('hmet_wes.hmt', 'hmet_wes.hmt')
+        self.assertEqual(prjFile.getCard('CHANNEL_INPUT').write('standard', 'renamed').split(),
+                         ['CHANNEL_INPUT', '"renamed.cif"'])
+
+
+if __name__ == '__main__':
+    unittest.main()
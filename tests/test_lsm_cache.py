@@ -0,0 +1,57 @@
+"""
+********************************************************************************
+* Name: LSM Data Cache Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import numpy as np
+import unittest
+
+from gsshapy.grid.lsm_cache import LSMDataCache
+
+
+class TestLSMDataCache(unittest.TestCase):
+    def test_copy_on_get(self):
+        cache = LSMDataCache(max_bytes=1024)
+        data = np.arange(4, dtype=np.float64)
+        cache.put('T2', data)
+        data *= 10
+
+        cached = cache.get('T2')
+        np.testing.assert_array_equal(cached, [0, 1, 2, 3])
+        cached *= 10
+        np.testing.assert_array_equal(cache.get('T2'), [0, 1, 2, 3])
+        self.assertIsNone(cache.get('PSFC'))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_memory_budget(self):
+        # each array is 32 bytes
+        cache = LSMDataCache(max_bytes=64)
+        cache.put('T2', np.zeros(4))
+        cache.put('PSFC', np.zeros(4))
+        cache.get('T2')
+        cache.put('Q2', np.zeros(4))
+
+        # least recently used is evicted
+        self.assertNotIn('PSFC', cache)
+        self.assertIn('T2', cache)
+        self.assertIn('Q2', cache)
+        self.assertEqual(cache.nbytes, 64)
+
+        # larger than the budget
+        cache.put('SWDOWN', np.zeros(16))
+        self.assertNotIn('SWDOWN', cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+    def test_disabled(self):
+        cache = LSMDataCache(max_bytes=0)
+        cache.put('T2', np.zeros(4))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
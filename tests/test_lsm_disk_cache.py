@@ -0,0 +1,106 @@
+"""
+********************************************************************************
+* Name: LSM Subset Disk Cache Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import time
+import numpy as np
+import unittest
+import xarray as xr
+
+from gsshapy.grid.lsm_disk_cache import LSMSubsetDiskCache, file_fingerprint
+
+
+class TestLSMSubsetDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.cache_dir)
+
+    def _data(self, value=0.0):
+        return xr.DataArray(np.full((2, 3, 4), value, dtype=np.float32),
+                            dims=('Time', 'south_north', 'west_east'),
+                            coords={'XLAT': (('south_north', 'west_east'),
+                                             np.zeros((3, 4)))},
+                            attrs={'units': 'K', 'projection': object()},
+                            name='T2')
+
+    def test_round_trip(self):
+        cache = LSMSubsetDiskCache(self.cache_dir)
+        key = (('wrf_d03_00.nc', 100, '1.0'), (0, 3, 0, 4), 'T2', None, None)
+        self.assertIsNone(cache.get(key))
+        cache.put(key, self._data(280.5))
+
+        # the cache is persistent
+        cache = LSMSubsetDiskCache(self.cache_dir)
+        data = cache.get(key)
+        np.testing.assert_array_equal(data.values, self._data(280.5).values)
+        self.assertEqual(data.dtype, np.float32)
+        self.assertEqual(data.name, 'T2')
+        self.assertEqual(data.attrs, {'units': 'K'})
+        self.assertIn('XLAT', data.coords)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_flush(self):
+        cache = LSMSubsetDiskCache(self.cache_dir)
+        cache.put('T2', self._data())
+        last_access = cache._index[cache._key_hash('T2')]['last_access']
+
+        # hits do not write the index
+        index_path = path.join(self.cache_dir, 'index.json')
+        index_mtime = path.getmtime(index_path)
+        time.sleep(0.01)
+        cache.get('T2')
+        self.assertEqual(path.getmtime(index_path), index_mtime)
+        self.assertEqual(LSMSubsetDiskCache(self.cache_dir)._index[cache._key_hash('T2')]['last_access'],
+                         last_access)
+
+        cache.flush()
+        self.assertGreater(LSMSubsetDiskCache(self.cache_dir)._index[cache._key_hash('T2')]['last_access'],
+                           last_access)
+
+    def test_disk_budget(self):
+        cache = LSMSubsetDiskCache(self.cache_dir)
+        cache.put('T2', self._data())
+        entry_bytes = cache.nbytes
+
+        cache = LSMSubsetDiskCache(self.cache_dir, max_bytes=2 * entry_bytes)
+        cache.put('PSFC', self._data())
+        cache.get('T2')
+        cache.put('Q2', self._data())
+
+        # least recently used is evicted
+        self.assertNotIn('PSFC', cache)
+        self.assertIn('T2', cache)
+        self.assertIn('Q2', cache)
+        self.assertEqual(len(cache), 2)
+
+        # larger than the budget
+        cache.max_bytes = entry_bytes // 2
+        cache.put('SWDOWN', self._data())
+        self.assertNotIn('SWDOWN', cache)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+        self.assertEqual(len(LSMSubsetDiskCache(self.cache_dir)), 0)
+
+    def test_file_fingerprint(self):
+        file_path = path.join(self.cache_dir, 'wrf_d03_00.nc')
+        with open(file_path, 'w') as lsm_file:
+            lsm_file.write('data')
+        fingerprint = file_fingerprint(file_path)
+        self.assertEqual(fingerprint[:2], (file_path, 4))
+
+        with open(file_path, 'a') as lsm_file:
+            lsm_file.write('more data')
+        self.assertNotEqual(file_fingerprint(file_path), fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+********************************************************************************
+* Name: Parse Tools Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import shlex
+import unittest
+
+from gsshapy.lib import parsetools as pt
+
+
+class TestIterChunks(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+    def _compare_with_chunk(self, filename, keywords):
+        """
+        iter_chunks() must yield the same chunks as chunk() for every keyword
+        """
+        path = os.path.join(self.readDirectory, filename)
+
+        with open(path, 'r') as f:
+            expected = pt.chunk(keywords, f)
+
+        actual = dict((keyword, []) for keyword in keywords)
+
+        with open(path, 'r') as f:
+            for keyword, chunk in pt.iter_chunks(keywords, f):
+                actual[keyword].append(chunk)
+
+        self.assertEqual(expected, actual)
+
+    def test_gag(self):
+        self._compare_with_chunk('standard.gag', ('EVENT',))
+
+    def test_gst(self):
+        self._compare_with_chunk('standard.gst', ('STREAMCELLS', 'CELLIJ'))
+
+    def test_gpi(self):
+        self._compare_with_chunk('standard.gpi', ('PIPECELLS', 'CELLIJ'))
+
+    def test_file_order(self):
+        lines = ['HEADER\n',
+                 'A 1\n',
+                 '1 2 3\n',
+                 '\n',
+                 'B 2\n',
+                 'A 3\n',
+                 '4 5 6\n']
+
+        chunks = list(pt.iter_chunks(('A', 'B'), lines))
+
+        self.assertEqual([('A', ['A 1\n', '1 2 3\n']),
+                          ('B', ['B 2\n']),
+                          ('A', ['A 3\n', '4 5 6\n'])], chunks)
+
+    def test_is_lazy(self):
+        def lines():
+            yield 'A 1\n'
+            yield 'B 2\n'
+            raise AssertionError('Read past the second chunk')
+
+        generator = pt.iter_chunks(('A', 'B'), lines())
+        self.assertEqual(('A', ['A 1\n']), next(generator))
+
+
+class TestSplitLine(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+    def _assert_same_as_shlex(self, line):
+        try:
+            expected = shlex.split(line)
+        except ValueError:
+            self.assertRaises(ValueError, pt.splitLine, line)
+        else:
+            self.assertEqual(expected, pt.splitLine(line), line)
+
+    def test_standard_corpus(self):
+        """
+        Every line of the standard test files must split the same as shlex.split
+        """
+        for filename in sorted(os.listdir(self.readDirectory)):
+            path = os.path.join(self.readDirectory, filename)
+
+            if not os.path.isfile(path):
+                continue
+
+            with open(path, 'r') as f:
+                for line in f:
+                    self._assert_same_as_shlex(line)
+
+    def test_quoted(self):
+        lines = ('MAPPING_TABLE "standard.cmt"\n',
+                 'INDEX_MAP "Soil Types.idx" "Soil Types"\n',
+                 'EVENT "Event of 2014"\n',
+                 'x""y "" \'a b\'c\n',
+                 '"don\'t" \'say "it"\'\n',
+                 ' \t"padded"  \n')
+
+        for line in lines:
+            self._assert_same_as_shlex(line)
+
+    def test_fallback(self):
+        lines = ('PROJECT_PATH "C:\\path with space\\"\n',
+                 'REPLACE_FOLDER C:\\folder\\\n',
+                 'CARD "unbalanced\n',
+                 "CARD it's\n")
+
+        for line in lines:
+            self._assert_same_as_shlex(line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+********************************************************************************
+* Name: Precipitation Gage Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import numpy as np
+import unittest
+
+from gsshapy.grid import precip_gage
+from gsshapy.grid.precip_gage import format_gage_rows, select_gages
+
+
+class TestPrecipGage(unittest.TestCase):
+    def setUp(self):
+        # 4x4 gages 10 m apart and a watershed covering the cells near gage 5
+        gage_x, gage_y = np.meshgrid(np.arange(4) * 10.0, np.arange(4) * -10.0)
+        self.gage_x = gage_x
+        self.gage_y = gage_y
+        cell_x, cell_y = np.meshgrid(np.arange(8, 13), np.arange(-12, -7))
+        self.cell_x = cell_x.ravel()
+        self.cell_y = cell_y.ravel()
+
+    def test_thiessen(self):
+        np.testing.assert_array_equal(select_gages(self.gage_x, self.gage_y,
+                                                   self.cell_x, self.cell_y),
+                                      [5])
+        # cells halfway between two gages belong to the first one
+        np.testing.assert_array_equal(select_gages(self.gage_x, self.gage_y,
+                                                   [15.0, 30.0], [-10.0, -30.0]),
+                                      [5, 15])
+
+    def test_inverse_distance(self):
+        selected = select_gages(self.gage_x, self.gage_y,
+                                self.cell_x, self.cell_y,
+                                method='inverse_distance',
+                                search_radius=10.0)
+        np.testing.assert_array_equal(selected, [1, 4, 5, 6, 9])
+        self.assertRaises(ValueError, select_gages, self.gage_x, self.gage_y,
+                          self.cell_x, self.cell_y, 'inverse_distance')
+        self.assertRaises(ValueError, select_gages, self.gage_x, self.gage_y,
+                          self.cell_x, self.cell_y, 'kriging')
+
+    def test_blocks(self):
+        block_distances = precip_gage._BLOCK_DISTANCES
+        precip_gage._BLOCK_DISTANCES = 16
+        try:
+            selected = select_gages(self.gage_x, self.gage_y,
+                                    self.cell_x, self.cell_y,
+                                    method='inverse_distance',
+                                    search_radius=10.0)
+        finally:
+            precip_gage._BLOCK_DISTANCES = block_distances
+        np.testing.assert_array_equal(selected, [1, 4, 5, 6, 9])
+
+    def test_format_gage_rows(self):
+        values = np.array([[0.0, 1.23456789],
+                           [2.5, 0.000049]], dtype=np.float32)
+        date_strs = ['2016 08 23 16 00', '2016 08 23 17 00']
+        self.assertEqual(format_gage_rows('ACCUM', date_strs, values, precision=4),
+                         'ACCUM 2016 08 23 16 00 0.0000 1.2346\n'
+                         'ACCUM 2016 08 23 17 00 2.5000 0.0000\n')
+        self.assertEqual(format_gage_rows('RADAR', date_strs[:1], values[:1]),
+                         'RADAR 2016 08 23 16 00 {0}\n'.format(' '.join(values[0].astype(str))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+"""
+********************************************************************************
+* Name: Query Plan Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import event
+
+from gsshapy.orm import (ProjectFile, RasterMapFile, ChannelInputFile, StreamLink, MapTable, MTIndex, MTValue,
+                         PrecipFile, PrecipEvent, PrecipGage, GridStreamFile, ReplaceParamFile, TargetParameter)
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lib import parsetools as pt
+
+
+class TestQueryPlan(unittest.TestCase):
+    """
+    Guard the hot lookup queries against regressions to full table scans.
+    """
+    def setUp(self):
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _queryPlan(self, query):
+        """
+        Run EXPLAIN QUERY PLAN on the SQL emitted by the given query and return the detail strings
+        """
+        compiled = query.statement.compile(dialect=self.engine.dialect)
+        params = [compiled.params[name] for name in compiled.positiontup]
+
+        connection = self.engine.raw_connection()
+        cursor = connection.cursor()
+        cursor.execute('EXPLAIN QUERY PLAN {0}'.format(compiled), params)
+        details = [row[-1] for row in cursor.fetchall()]
+        cursor.close()
+
+        return details
+
+    def _assertUsesIndex(self, query, tableName, indexName):
+        details = self._queryPlan(query)
+        plan = '\n'.join(details)
+
+        self.assertIn(indexName, plan)
+
+        for detail in details:
+            if re.match(r'SCAN (TABLE )?{0}\b'.format(tableName), detail):
+                self.assertIn('INDEX', detail, 'Full table scan on {0}:\n{1}'.format(tableName, plan))
+
+    def test_raster_map_by_extension(self):
+        """
+        Test the RasterMapFile lookup used by _readWMSDatasets and _invokeWrite
+        """
+        projectFile = ProjectFile(name='standard', map_type=1)
+        self.session.add(projectFile)
+        self.session.commit()
+
+        query = self.session.query(RasterMapFile).\
+            filter(RasterMapFile.projectFile == projectFile).\
+            filter(RasterMapFile.fileExtension == 'msk')
+
+        self._assertUsesIndex(query, RasterMapFile.tableName, 'ix_raster_maps_project_file_extension')
+
+    def test_ordered_links(self):
+        """
+        Test the StreamLink lookup used by ChannelInputFile.getOrderedLinks
+        """
+        channelInputFile = ChannelInputFile()
+        self.session.add(channelInputFile)
+        self.session.commit()
+
+        query = self.session.query(StreamLink).\
+            filter(StreamLink.channelInputFile == channelInputFile).\
+            order_by(StreamLink.linkNumber)
+
+        self._assertUsesIndex(query, StreamLink.tableName, 'ix_cif_links_channel_input_file_link_number')
+
+        # The index also provides the ordering
+        self.assertFalse(any('TEMP B-TREE' in detail for detail in self._queryPlan(query)))
+
+    def test_map_table_value_pivot(self):
+        """
+        Test the MTValue lookups used by MapTableFile._valuePivot
+        """
+        mapTable = MapTable(name='ROUGHNESS')
+        mtIndex = MTIndex(index=1)
+        self.session.add_all((mapTable, mtIndex))
+        self.session.commit()
+
+        indexQuery = self.session.query(MTIndex).\
+            join(MTValue.index).\
+            filter(MTValue.mapTable == mapTable).\
+            filter(MTValue.contaminant == None).\
+            order_by(MTIndex.index)
+
+        self._assertUsesIndex(indexQuery, MTValue.tableName, 'ix_cmt_map_table_values_map_table_index_contaminant')
+
+        valueQuery = self.session.query(MTValue).\
+            filter(MTValue.mapTable == mapTable).\
+            filter(MTValue.contaminant == None).\
+            filter(MTValue.index == mtIndex).\
+            order_by(MTValue.id)
+
+        self._assertUsesIndex(valueQuery, MTValue.tableName, 'ix_cmt_map_table_values_map_table_index_contaminant')
+
+    def test_precip_gages_by_event(self):
+        """
+        Test the PrecipGage lookup used by PrecipFile._write
+        """
+        event = PrecipEvent(description='Event', nrGag=1, nrPds=1)
+        self.session.add(event)
+        self.session.commit()
+
+        query = self.session.query(PrecipGage).\
+            filter(PrecipGage.event == event).\
+            order_by(PrecipGage.id)
+
+        self._assertUsesIndex(query, 'gag_assoc_event_gage', 'ix_gag_assoc_event_gage_event')
+
+    def test_create_indexes(self):
+        """
+        Test create_indexes on a database that predates the indexes
+        """
+        connection = self.engine.raw_connection()
+        cursor = connection.cursor()
+        cursor.execute('DROP INDEX ix_raster_maps_project_file_extension')
+        cursor.close()
+
+        created = dbt.create_indexes(self.sqlalchemy_url, self.engine)
+        self.assertEqual(created, ['ix_raster_maps_project_file_extension'])
+
+        # Nothing left to do the second time
+        self.assertEqual(dbt.create_indexes(self.sqlalchemy_url, self.engine), [])
+
+
+
+class TestWriteQueryCount(unittest.TestCase):
+    """
+    Writers load their children eagerly, so the number of queries must not grow with the size of the file.
+    """
+    def setUp(self):
+        # Find db directory path
+        here = os.path.abspath(os.path.dirname(__file__))
+
+        self.readDirectory = os.path.join(here, 'standard')
+        self.writeDirectory = tempfile.mkdtemp()
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+        self.queryCount = 0
+        event.listen(self.engine, 'before_cursor_execute', self._countQuery)
+
+    def tearDown(self):
+        event.remove(self.engine, 'before_cursor_execute', self._countQuery)
+        self.session.close()
+        shutil.rmtree(self.writeDirectory)
+
+    def _countQuery(self, *args, **kwargs):
+        self.queryCount += 1
+
+    def _read_n_count_write(self, fileIO, filename):
+        """
+        Read the file, drop everything from the identity map, write it and return the number of write queries
+        """
+        instance = fileIO()
+        instance.read(directory=self.readDirectory,
+                      filename=filename,
+                      session=self.session)
+        self.session.expire_all()
+
+        self.queryCount = 0
+        instance.write(session=self.session,
+                       directory=self.writeDirectory,
+                       name=filename)
+
+        return self.queryCount
+
+    def test_precip_file_write(self):
+        """
+        Test PrecipFile write loads events, values and gages in bulk
+        """
+        self.assertLessEqual(self._read_n_count_write(PrecipFile, 'standard.gag'), 5)
+
+    def test_grid_stream_file_write(self):
+        """
+        Test GridStreamFile write loads cells and nodes in bulk
+        """
+        self.assertLessEqual(self._read_n_count_write(GridStreamFile, 'standard.gst'), 4)
+
+    def test_channel_input_file_write(self):
+        """
+        Test ChannelInputFile write loads links and their children in bulk
+        """
+        self.assertLessEqual(self._read_n_count_write(ChannelInputFile, 'standard.cif'), 12)
+
+    def test_replace_param_lookup(self):
+        """
+        Test replacement variables are looked up without scanning or reloading the target parameters
+        """
+        replaceParamFile = ReplaceParamFile()
+        replaceParamFile.read(directory=self.readDirectory,
+                              filename='replace_param.txt',
+                              session=self.session)
+        targets = [(target.id, target.targetVariable) for target in replaceParamFile.targetParameters]
+
+        self.queryCount = 0
+        for targetID, targetVariable in targets * 100:
+            self.assertEqual(pt.valueReadPreprocessor(targetVariable, replaceParamFile), str(-1 * targetID))
+            self.assertEqual(pt.valueWritePreprocessor(str(-1 * targetID), replaceParamFile), targetVariable)
+        self.assertEqual(self.queryCount, 0)
+
+        # Lookups follow changes to the relationship
+        target = TargetParameter(targetVariable='[NEW_VARIABLE]', varFormat='%.4f')
+        target.replaceParamFile = replaceParamFile
+        self.session.commit()
+        self.assertEqual(replaceParamFile.getTargetParameterID('[NEW_VARIABLE]'), target.id)
+
+        target.targetVariable = '[RENAMED_VARIABLE]'
+        self.session.commit()
+        self.assertIsNone(replaceParamFile.getTargetParameterID('[NEW_VARIABLE]'))
+        self.assertEqual(replaceParamFile.getTargetVariable(target.id), '[RENAMED_VARIABLE]')
+
+
+if __name__ == '__main__':
+    unittest.main()
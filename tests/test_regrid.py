@@ -0,0 +1,123 @@
+"""
+********************************************************************************
+* Name: LSM Regridder Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import numpy as np
+import unittest
+
+from gsshapy.grid import regrid
+from gsshapy.grid.regrid import LSMRegridder, grid_cell_coords, grid_signature
+
+
+class TestLSMRegridder(unittest.TestCase):
+    def setUp(self):
+        # 3x4 LSM grid with 10 m cells and descending y (north up)
+        x_coords, y_coords = np.meshgrid(np.arange(4) * 10.0 + 5,
+                                         35 - np.arange(3) * 10.0)
+        self.src_y = y_coords
+        self.src_x = x_coords
+        self.data = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+        # 6x8 GSSHA grid with 5 m cells covering the same area
+        self.dst_geotransform = [0.0, 5.0, 0.0, 40.0, 0.0, -5.0]
+        self.dst_y, self.dst_x = grid_cell_coords(self.dst_geotransform, 8, 6)
+        self.dst_y_corners, self.dst_x_corners = grid_cell_coords(self.dst_geotransform, 8, 6,
+                                                                  corners=True)
+        self.temp_directory = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.temp_directory)
+
+    def test_grid_cell_coords(self):
+        self.assertEqual(self.dst_y.shape, (6, 8))
+        self.assertEqual(self.dst_y_corners.shape, (7, 9))
+        np.testing.assert_array_equal(self.dst_x[0, :2], [2.5, 7.5])
+        np.testing.assert_array_equal(self.dst_y[:2, 0], [37.5, 32.5])
+        np.testing.assert_array_equal(self.dst_y_corners[:, 0], 40 - np.arange(7) * 5.0)
+
+    def test_nearest_and_area(self):
+        # each GSSHA cell is inside a single LSM cell
+        expected = self.data.repeat(2, axis=1).repeat(2, axis=2)
+        for method in ('nearest', 'area'):
+            regridder = LSMRegridder.from_coords(self.src_y, self.src_x,
+                                                 self.dst_y, self.dst_x,
+                                                 method=method,
+                                                 dst_y_corners=self.dst_y_corners,
+                                                 dst_x_corners=self.dst_x_corners)
+            np.testing.assert_array_equal(regridder.apply(self.data), expected)
+
+    def test_area_average(self):
+        # a single GSSHA cell covering the whole LSM grid
+        regridder = LSMRegridder.from_coords(self.src_y, self.src_x,
+                                             np.array([[20.0]]), np.array([[20.0]]),
+                                             method='area',
+                                             dst_y_corners=np.array([[40.0, 40.0], [10.0, 10.0]]),
+                                             dst_x_corners=np.array([[0.0, 40.0], [0.0, 40.0]]))
+        self.assertEqual(len(regridder), 12)
+        np.testing.assert_allclose(regridder.apply(self.data)[:, 0, 0],
+                                   self.data.mean(axis=(1, 2)))
+        self.assertRaises(ValueError, LSMRegridder.from_coords,
+                          self.src_y, self.src_x, self.dst_y, self.dst_x, 'area')
+
+    def test_bilinear(self):
+        regridder = LSMRegridder.from_coords(self.src_y, self.src_x,
+                                             self.dst_y, self.dst_x,
+                                             method='bilinear')
+        np.testing.assert_allclose(np.bincount(regridder.rows, regridder.weights), 1)
+        # the data is linear in x and y, so interior values are exact
+        result = regridder.apply(self.data)
+        row, col = 1, 2
+        expected = self.data[:, 0, 0] + (self.dst_x[row, col] - 5) / 10.0 \
+            + 4 * (35 - self.dst_y[row, col]) / 10.0
+        np.testing.assert_allclose(result[:, row, col], expected)
+        # outside cell centers are clamped to the edge of the LSM grid
+        np.testing.assert_allclose(result[:, 0, 0], self.data[:, 0, 0])
+        self.assertRaises(ValueError, regridder.apply, self.data[:, :2])
+        self.assertRaises(ValueError, LSMRegridder.from_coords,
+                          self.src_y, self.src_x, self.dst_y, self.dst_x, 'cubic')
+
+    def test_numpy_fallback(self):
+        regridder = LSMRegridder.from_coords(self.src_y, self.src_x,
+                                             self.dst_y, self.dst_x,
+                                             method='bilinear')
+        values = self.data.reshape(2, -1).T
+        expected = np.zeros((48, 2))
+        np.add.at(expected, regridder.rows,
+                  regridder.weights[:, np.newaxis] * values[regridder.cols])
+        np.testing.assert_allclose(regridder._apply_numpy(values), expected)
+
+        sparse = regrid.sparse
+        regrid.sparse = None
+        try:
+            np.testing.assert_allclose(regridder.apply(self.data).reshape(2, -1).T, expected)
+            self.assertRaises(ImportError, regridder.to_sparse)
+        finally:
+            regrid.sparse = sparse
+
+    def test_save_load(self):
+        signature = grid_signature(self.src_y, self.src_x, self.dst_geotransform, (6, 8))
+        regridder = LSMRegridder.from_coords(self.src_y, self.src_x,
+                                             self.dst_y, self.dst_x,
+                                             method='nearest',
+                                             signature=signature)
+        weights_file = path.join(self.temp_directory, 'weights.npz')
+        regridder.save(weights_file)
+
+        loaded = LSMRegridder.load(weights_file)
+        self.assertEqual(loaded.method, 'nearest')
+        self.assertEqual(loaded.src_shape, (3, 4))
+        self.assertEqual(loaded.dst_shape, (6, 8))
+        np.testing.assert_array_equal(loaded.apply(self.data), regridder.apply(self.data))
+        self.assertTrue(loaded.matches(signature, 'nearest'))
+        self.assertFalse(loaded.matches(signature, 'bilinear'))
+        self.assertFalse(loaded.matches(grid_signature(self.src_y[1:], self.src_x[1:],
+                                                       self.dst_geotransform, (6, 8))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+********************************************************************************
+* Name: Stream Network Graph Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from gsshapy.orm import ChannelInputFile
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lib.stream_network import StreamNetworkGraph
+
+
+class TestStreamNetworkGraph(unittest.TestCase):
+    def setUp(self):
+        #     1   2
+        #      \ /
+        #   5   3   6 (reservoir)
+        #    \  |  /
+        #       4 (structure)
+        #       |
+        #       outlet
+        self.graph = StreamNetworkGraph(linkNumbers=[1, 2, 3, 4, 5, 6],
+                                        downstreamLinks=[3, 3, 4, 0, 4, 4],
+                                        linkTypes=['TRAPEZOID', 'BREAKPOINT_ERODE', 'TRAP', 'STRUCTURE',
+                                                   'TRAPEZOID_SUBSURFACE', 'RESERVOIR'],
+                                        lengths=[10.0, 20.0, 30.0, 0.0, 50.0, 0.0])
+
+    def test_adjacency(self):
+        self.assertEqual(len(self.graph), 6)
+        self.assertEqual(self.graph.outlets().tolist(), [4])
+        self.assertEqual(self.graph.upstream(3).tolist(), [1, 2])
+        self.assertEqual(self.graph.upstream(4).tolist(), [3, 5, 6])
+        self.assertEqual(self.graph.upstream(1).tolist(), [])
+        self.assertRaises(IndexError, self.graph.upstream, 7)
+
+    def test_masks(self):
+        self.assertEqual(np.flatnonzero(self.graph.fluvial).tolist(), [1, 2, 3, 5])
+        self.assertEqual(np.flatnonzero(self.graph.structure).tolist(), [4])
+        self.assertEqual(np.flatnonzero(self.graph.reservoir).tolist(), [6])
+
+    def test_topological_order(self):
+        order = self.graph.topologicalOrder().tolist()
+        position = dict((link, i) for i, link in enumerate(order))
+
+        self.assertEqual(sorted(order), [1, 2, 3, 4, 5, 6])
+
+        for link in order:
+            for upstreamLink in self.graph.upstream(link).tolist():
+                self.assertLess(position[upstreamLink], position[link])
+
+    def test_cycle(self):
+        graph = StreamNetworkGraph(linkNumbers=[1, 2, 3], downstreamLinks=[2, 3, 1])
+        self.assertRaises(ValueError, graph.topologicalOrder)
+
+    def test_accumulation(self):
+        self.assertEqual(self.graph.accumulatedLength().tolist(), [0.0, 10.0, 20.0, 60.0, 110.0, 50.0, 0.0])
+        self.assertEqual(self.graph.upstreamArea([0, 1, 1, 1, 1, 1, 1]).tolist(),
+                         [0.0, 1.0, 1.0, 3.0, 6.0, 1.0, 1.0])
+
+    def test_subnetwork(self):
+        self.assertEqual(self.graph.upstreamLinks(3).tolist(), [1, 2, 3])
+
+        subnetwork = self.graph.subnetwork(3)
+        self.assertEqual(subnetwork.linkNumbers.tolist(), [1, 2, 3])
+        self.assertEqual(subnetwork.outlets().tolist(), [3])
+        self.assertEqual(subnetwork.accumulatedLength()[3], 60.0)
+        self.assertTrue(subnetwork.fluvial[2])
+
+
+class TestChannelInputFileGraph(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+        self.writeDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.writeDirectory)
+
+    def test_get_stream_network_graph(self):
+        """
+        Test the graph matches the connectivity of the standard channel input file
+        """
+        channelInputFile = ChannelInputFile()
+        channelInputFile.read(directory=self.readDirectory,
+                              filename='standard.cif',
+                              session=self.session)
+
+        graph = channelInputFile.getStreamNetworkGraph(self.session)
+
+        self.assertEqual(len(graph), len(channelInputFile.streamLinks))
+
+        for streamLink in channelInputFile.streamLinks:
+            self.assertEqual(graph.downstream[streamLink.linkNumber], streamLink.downstreamLinkID)
+            self.assertEqual(sorted(graph.upstream(streamLink.linkNumber).tolist()),
+                             sorted(upstreamLink.upstreamLinkID for upstreamLink in streamLink.upstreamLinks))
+
+        self.assertEqual(sorted(np.flatnonzero(graph.fluvial).tolist()),
+                         sorted(streamLink.linkNumber for streamLink in channelInputFile.getFluvialLinks()))
+
+    def test_write_stream_network(self):
+        """
+        Test the stream network features are built from the stream node coordinates without spatial functions
+        """
+        channelInputFile = ChannelInputFile()
+        channelInputFile.read(directory=self.readDirectory,
+                              filename='standard.cif',
+                              session=self.session)
+
+        path = os.path.join(self.writeDirectory, 'network.geojson')
+        channelInputFile.writeStreamNetwork(self.session, path)
+
+        with open(path) as f:
+            featureCollection = json.load(f)
+
+        features = featureCollection['features']
+        linkFeatures = [feature for feature in features if feature['geometry']['type'] == 'LineString']
+        nodeFeatures = [feature for feature in features if feature['geometry']['type'] == 'Point']
+        streamLinks = [streamLink for streamLink in channelInputFile.getOrderedLinks(self.session) if streamLink.nodes]
+
+        self.assertEqual(featureCollection['type'], 'FeatureCollection')
+        self.assertEqual([feature['properties']['link_number'] for feature in linkFeatures],
+                         [streamLink.linkNumber for streamLink in streamLinks])
+        self.assertEqual(len(nodeFeatures), sum(len(streamLink.nodes) for streamLink in streamLinks))
+
+        for feature, streamLink in zip(linkFeatures, streamLinks):
+            self.assertEqual(feature['id'], streamLink.id)
+            self.assertEqual(feature['properties']['type'], streamLink.type)
+            self.assertEqual(feature['geometry']['coordinates'],
+                             [[node.x, node.y, node.elevation] for node in streamLink.nodes])
+
+        # Links only
+        features = list(channelInputFile.iterStreamNetworkFeatures(self.session, withNodes=False))
+        self.assertEqual(features, linkFeatures)
+
+
+if __name__ == '__main__':
+    unittest.main()
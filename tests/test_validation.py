@@ -0,0 +1,113 @@
+"""
+********************************************************************************
+* Name: Project Validation Tests
+* Created On: October 18, 2026
+* License: BSD 3-Clause
+********************************************************************************
+"""
+import json
+import os
+import unittest
+
+import numpy as np
+
+from gsshapy.orm import ProjectFile
+from gsshapy.lib import db_tools as dbt
+from gsshapy.lib.validation import (rasterTextToArray, findMissingLinkNodes, findCellsOutsideMask,
+                                    findUncoveredIndices)
+
+RASTER = """north: 10.0
+south: 0.0
+east: 10.0
+west: 0.0
+rows: 2
+cols: 3
+0 1 1
+1 1 0
+"""
+
+
+class TestValidationFunctions(unittest.TestCase):
+    def test_raster_text_to_array(self):
+        np.testing.assert_array_equal(rasterTextToArray(RASTER), [[0, 1, 1], [1, 1, 0]])
+
+    def test_missing_link_nodes(self):
+        missing = findMissingLinkNodes(linkNumbers=[1, 1, 2, 3, 3],
+                                       nodeNumbers=[1, 12, 1, 1, 1],
+                                       validLinkNumbers=[1, 1, 2],
+                                       validNodeNumbers=[1, 2, 1])
+        self.assertEqual(missing, [(1, 12), (3, 1)])
+        self.assertEqual(findMissingLinkNodes([], [], [1], [1]), [])
+
+    def test_cells_outside_mask(self):
+        mask = rasterTextToArray(RASTER)
+        outside = findCellsOutsideMask(mask, cellI=[1, 1, 2, 2, 3, 0], cellJ=[1, 2, 3, 1, 1, 1])
+        self.assertEqual(outside, [(0, 1), (1, 1), (2, 3), (3, 1)])
+
+    def test_uncovered_indices(self):
+        indexGrid = np.array([[5, 6, 7], [8, 6, 9]])
+        mask = rasterTextToArray(RASTER)
+
+        self.assertEqual(findUncoveredIndices(indexGrid, [6, 7]), [5, 8, 9])
+        self.assertEqual(findUncoveredIndices(indexGrid, [6, 7], mask), [8])
+        self.assertEqual(findUncoveredIndices(indexGrid, [6, 7, 8], mask), [])
+
+
+class TestProjectFileValidate(unittest.TestCase):
+    def setUp(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        self.readDirectory = os.path.join(here, 'standard')
+
+        # Create Test DB
+        self.sqlalchemy_url, self.engine = dbt.init_sqlite_memory()
+
+        # Create DB Session
+        self.session = dbt.create_session(self.sqlalchemy_url, self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_validate(self):
+        """
+        Test the standard project, which combines files from several models, is reported as inconsistent
+        """
+        projectFile = ProjectFile()
+        projectFile.readInput(directory=self.readDirectory,
+                              projectFileName='standard.prj',
+                              session=self.session)
+
+        report = projectFile.validate(self.session)
+
+        self.assertFalse(report.ok)
+        self.assertEqual(report.skipped, {})
+        self.assertEqual(sorted(report.checked), ['cmt_index_coverage', 'gpi_cells', 'gst_link_nodes',
+                                                  'spn_cells', 'spn_link_nodes'])
+
+        diagnostics = dict((diagnostic.check, diagnostic) for diagnostic in report)
+
+        # The grid stream file references links 10 and 11, the channel input file has 9 links
+        self.assertTrue(all(link in (3, 10, 11) for link, node in diagnostics['gst_link_nodes'].items))
+        self.assertIn((10, 9), diagnostics['gst_link_nodes'].items)
+        self.assertIn((21, 19), diagnostics['gpi_cells'].items)
+        self.assertIn(('ROUGHNESS', 'LandUse', 12), [item for diagnostic in report
+                                                     if diagnostic.check == 'cmt_index_coverage'
+                                                     for item in diagnostic.items])
+
+        # The report can be serialized
+        self.assertFalse(json.loads(json.dumps(report.asDict()))['ok'])
+
+    def test_validate_without_files(self):
+        projectFile = ProjectFile()
+        projectFile.read(directory=self.readDirectory,
+                         filename='standard.prj',
+                         session=self.session)
+
+        report = projectFile.validate(self.session)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(report.checked, [])
+        self.assertEqual(len(report.skipped), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
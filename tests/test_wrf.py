@@ -6,13 +6,23 @@
 * License: BSD 3-Clause
 ********************************************************************************
 """
+import numpy as np
+from numpy.testing import assert_almost_equal
 import os
 from osgeo import gdalconst
 import unittest
 from shutil import copytree
+import xarray as xr
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
 from .template import TestGridTemplate
 from gsshapy.grid import GRIDtoGSSHA
+from gsshapy.grid.lsm_disk_cache import LSMSubsetDiskCache
+from gsshapy.grid.regrid import LSMRegridder, grid_cell_coords
 
 
 class TestLSMtoGSSHA(TestGridTemplate):
@@ -94,6 +104,41 @@ class TestLSMtoGSSHA(TestGridTemplate):
         compare_gag_file = os.path.join(self.readDirectory, 'gage_test_wrf.gag')
         self._compare_files(out_gage_file, compare_gag_file, precision=5)
 
+    def test_wrf_gage_file_write_watershed(self):
+        """
+        Test WRF lsm_precip_to_gssha_precip_gage write method with only
+        the pixels influencing the watershed
+        """
+        out_gage_file = os.path.join(self.writeDirectory, 'gage_test_wrf_thiessen.gag')
+        self.l2g.lsm_precip_to_gssha_precip_gage(out_gage_file,
+                                                 lsm_data_var=['RAINC', 'RAINNC'],
+                                                 precip_type='ACCUM',
+                                                 gage_selection='thiessen',
+                                                 precision=6)
+
+        def read_gage_file(gage_file_path):
+            with open(gage_file_path) as gage_file:
+                lines = [line.split() for line in gage_file]
+            coords = [line for line in lines if line[0] == 'COORD']
+            pixels = [int(line[-1].strip('"#')) for line in coords]
+            values = np.array([line[6:] for line in lines if line[0] == 'ACCUM'], dtype=float)
+            return lines, pixels, coords, values
+
+        lines, pixels, coords, values = read_gage_file(out_gage_file)
+        all_lines, all_pixels, all_coords, all_values = \
+            read_gage_file(os.path.join(self.readDirectory, 'gage_test_wrf.gag'))
+
+        # the header matches and only a subset of the pixels is kept
+        self.assertEqual(lines[:2], all_lines[:2])
+        self.assertEqual(lines[2], ['NRGAG', str(len(pixels))])
+        assert 0 < len(pixels) < len(all_pixels)
+
+        # the kept pixels match the pixels of the full gage file
+        assert_almost_equal(np.array([coord[1:3] for coord in coords], dtype=float),
+                            np.array([all_coords[pixel][1:3] for pixel in pixels], dtype=float),
+                            decimal=4)
+        assert_almost_equal(values, all_values[:, pixels], decimal=5)
+
     def test_wrf_netcdf_file_write(self):
         """
         Test WRF lsm_data_to_subset_netcdf write method
@@ -120,6 +165,144 @@ class TestLSMtoGSSHA(TestGridTemplate):
         self._compare_netcdf_files("gssha_dynamic_wrf_resample",
                                    "gssha_dynamic_wrf_resample")
 
+    def _get_regrid_l2g(self, regrid_weights_file):
+        return GRIDtoGSSHA(gssha_project_folder=self.gssha_project_folder,
+                           gssha_project_file_name='grid_standard.prj',
+                           lsm_input_folder_path=os.path.join(self.writeDirectory, 'wrf_raw_data'),
+                           lsm_search_card="gssha_d03_*.nc",
+                           lsm_lat_var='XLAT',
+                           lsm_lon_var='XLONG',
+                           lsm_time_var='Times',
+                           lsm_lat_dim='south_north',
+                           lsm_lon_dim='west_east',
+                           lsm_time_dim='Time',
+                           regrid_method='bilinear',
+                           regrid_weights_file=regrid_weights_file,
+                           )
+
+    def _compare_regridded_netcdf_files(self, original, new):
+        """
+        Compare regridded netcdf output with the reprojected output. Each
+        GSSHA cell must be in the range of the reprojected pixels around it.
+        """
+        with xr.open_dataset(os.path.join(self.readDirectory, original + '.nc')) as dO, \
+                xr.open_dataset(os.path.join(self.writeDirectory, new + '.nc')) as dN:
+            np.testing.assert_array_equal(dO['time'].values, dN['time'].values)
+            self.assertEqual(dO.attrs['proj4'], dN.attrs['proj4'])
+
+            geotransform_o = np.asarray(dO.attrs['geotransform'], dtype=float)
+            geotransform_n = np.asarray(dN.attrs['geotransform'], dtype=float)
+            cell_y, cell_x = grid_cell_coords(geotransform_n, dN.dims['x'], dN.dims['y'])
+            rows = np.floor((cell_y - geotransform_o[3]) / geotransform_o[5]).astype(int)
+            cols = np.floor((cell_x - geotransform_o[0]) / geotransform_o[1]).astype(int)
+
+            for var in ('precipitation', 'pressure', 'relative_humidity', 'wind_speed',
+                        'direct_radiation', 'diffusive_radiation', 'temperature', 'cloud_cover'):
+                values_o = dO[var].values
+                values_n = dN[var].values
+                self.assertEqual(values_n.shape[1:], cell_y.shape)
+                for row, col, value in zip(rows.ravel(), cols.ravel(),
+                                           values_n.reshape(values_n.shape[0], -1).T):
+                    window = values_o[:, max(row - 1, 0):row + 2, max(col - 1, 0):col + 2]
+                    window = window.reshape(window.shape[0], -1)
+                    tolerance = 1e-5 * np.nanmax(np.abs(window), axis=1) + 1e-6
+                    assert np.all(value >= np.nanmin(window, axis=1) - tolerance), var
+                    assert np.all(value <= np.nanmax(window, axis=1) + tolerance), var
+
+    def test_wrf_netcdf_file_write_regrid(self):
+        """
+        Test WRF lsm_data_to_subset_netcdf write method regridded
+        with saved bilinear weights
+        """
+        regrid_weights_file = os.path.join(self.writeDirectory, 'wrf_bilinear_weights.npz')
+        netcdf_file_path = os.path.join(self.writeDirectory,
+                                        'gssha_dynamic_wrf_bilinear.nc')
+        self.l2g.xd.close()
+        self.l2g = self._get_regrid_l2g(regrid_weights_file)
+        self.l2g.lsm_data_to_subset_netcdf(netcdf_file_path,
+                                           self.data_var_map_array)
+        assert os.path.exists(regrid_weights_file)
+        self._compare_regridded_netcdf_files("gssha_dynamic_wrf", "gssha_dynamic_wrf_bilinear")
+
+        # second run loads the saved weights
+        with xr.open_dataset(netcdf_file_path) as first_run:
+            first_run = first_run.load()
+        self.l2g.xd.close()
+        self.l2g = self._get_regrid_l2g(regrid_weights_file)
+        with mock.patch.object(LSMRegridder, 'from_coords') as from_coords:
+            self.l2g.lsm_data_to_subset_netcdf(netcdf_file_path,
+                                               self.data_var_map_array)
+        from_coords.assert_not_called()
+        with xr.open_dataset(netcdf_file_path) as second_run:
+            for var in first_run.data_vars:
+                assert_almost_equal(second_run[var].values, first_run[var].values)
+
+    def test_wrf_netcdf_file_write_chunks(self):
+        """
+        Test WRF lsm_data_to_subset_netcdf write method computed in blocks
+        """
+        self.l2g.chunks = 2
+        self.l2g._load_converted_gssha_data_from_lsm('temperature', 'T2', 'netcdf')
+        assert self.l2g.data['temperature'].chunks[0][0] == 2
+
+        netcdf_file_path = os.path.join(self.writeDirectory,
+                                        'gssha_dynamic_wrf.nc')
+        # the output is still lazy when it is written
+        with mock.patch.object(xr.Dataset, 'to_netcdf', autospec=True,
+                               side_effect=xr.Dataset.to_netcdf) as to_netcdf:
+            self.l2g.lsm_data_to_subset_netcdf(netcdf_file_path,
+                                               self.data_var_map_array)
+        to_netcdf.assert_called_once()
+        output_dataset = to_netcdf.call_args[0][0]
+        assert all(output_dataset[var].chunks for var in output_dataset.data_vars)
+
+        # compare netcdf files
+        self._compare_netcdf_files("gssha_dynamic_wrf", "gssha_dynamic_wrf")
+        # lazy data is not cached
+        assert len(self.l2g._lsm_cache) == 0
+
+    def test_wrf_lsm_cache(self):
+        """
+        Test WRF variables shared by several GSSHA variables are read once
+        """
+        self.l2g._load_converted_gssha_data_from_lsm('relative_humidity', ['Q2', 'PSFC', 'T2'], 'ascii')
+        self.l2g._load_converted_gssha_data_from_lsm('pressure', 'PSFC', 'ascii')
+        pressure = self.l2g.data['pressure'].values.copy()
+        self.l2g._load_converted_gssha_data_from_lsm('temperature', 'T2', 'ascii')
+        self.l2g._load_converted_gssha_data_from_lsm('pressure', 'PSFC', 'ascii')
+
+        assert self.l2g._lsm_cache.misses == 3
+        assert self.l2g._lsm_cache.hits == 3
+        # cached data is not modified by the conversions
+        assert_almost_equal(self.l2g.data['pressure'].values, pressure)
+
+    def test_wrf_ascii_file_write_subset_cache(self):
+        """
+        Test WRF lsm_data_to_arc_ascii write method with the subset
+        read from the disk cache
+        """
+        self.l2g._subset_cache = LSMSubsetDiskCache(os.path.join(self.writeDirectory,
+                                                                 "subset_cache"))
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory)
+        misses = self.l2g._subset_cache.misses
+        assert misses > 0
+        assert len(self.l2g._subset_cache) == misses
+
+        # second conversion only reads from the disk cache
+        self.l2g._lsm_cache.clear()
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory)
+        assert self.l2g._subset_cache.misses == misses
+        assert self.l2g._subset_cache.hits == misses
+
+        # Compare all files
+        compare_directory = os.path.join(self.readDirectory, "wrf_hmet_data")
+        self._compare_directories(self.hmet_write_directory,
+                                  compare_directory,
+                                  ignore_file="hmet_file_list.txt",
+                                  raster=True)
+
     def test_wrf_ascii_file_write(self):
         """
         Test WRF lsm_data_to_arc_ascii write method
@@ -134,6 +317,56 @@ class TestLSMtoGSSHA(TestGridTemplate):
                                   ignore_file="hmet_file_list.txt",
                                   raster=True)
 
+    def test_wrf_ascii_file_write_max_memory(self):
+        """
+        Test WRF lsm_data_to_arc_ascii write method computed in blocks
+        that fit in max_memory
+        """
+        self.l2g.max_memory = 64*1024
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory)
+
+        # Compare all files
+        compare_directory = os.path.join(self.readDirectory, "wrf_hmet_data")
+        self._compare_directories(self.hmet_write_directory,
+                                  compare_directory,
+                                  ignore_file="hmet_file_list.txt",
+                                  raster=True)
+
+    def test_wrf_ascii_file_write_fast(self):
+        """
+        Test WRF lsm_data_to_arc_ascii write method with the fast writer
+        """
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory,
+                                       fast_writer=True,
+                                       num_workers=2)
+
+        # Compare all files
+        compare_directory = os.path.join(self.readDirectory, "wrf_hmet_data")
+        self._compare_directories(self.hmet_write_directory,
+                                  compare_directory,
+                                  ignore_file="hmet_file_list.txt",
+                                  raster=True)
+
+    def test_wrf_ascii_file_write_single_pass(self):
+        """
+        Test WRF lsm_data_to_arc_ascii write method writing all
+        variables of each time step together
+        """
+        self.l2g.lsm_data_to_arc_ascii(self.data_var_map_array,
+                                       self.hmet_write_directory,
+                                       num_workers=2,
+                                       pool_type='process',
+                                       single_pass=True)
+
+        # Compare all files
+        compare_directory = os.path.join(self.readDirectory, "wrf_hmet_data")
+        self._compare_directories(self.hmet_write_directory,
+                                  compare_directory,
+                                  ignore_file="hmet_file_list.txt",
+                                  raster=True)
+
     def test_wrf_ascii_file_write_pre(self):
         """
         Test WRF lsm_data_to_arc_ascii write method pre-computed
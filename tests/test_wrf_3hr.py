@@ -7,6 +7,8 @@
 ********************************************************************************
 """
 from glob import glob
+import numpy as np
+from numpy.testing import assert_almost_equal
 import os
 import unittest
 from shutil import copy, copytree
@@ -143,5 +145,29 @@ class TestWRF3toGSSHA(TestGridTemplate):
                                   raster=True,
                                   precision=1)
 
+    def test_wrf_convert_data_to_hourly(self):
+        """
+        Test WRF 3hr data is linearly interpolated to hourly data
+        """
+        self.l2g._load_converted_gssha_data_from_lsm('temperature', 'T2', 'netcdf')
+        original = self.l2g.data['temperature'].copy()
+        self.l2g._convert_data_to_hourly('temperature')
+        hourly = self.l2g.data['temperature']
+
+        time_step = np.timedelta64(1, 'h')
+        self.assertEqual(hourly.dims, original.dims)
+        self.assertEqual(hourly.attrs, original.attrs)
+        self.assertEqual(hourly.time.values[0], original.time.values[0])
+        self.assertEqual(hourly.time.values[-1], original.time.values[-1])
+        self.assertTrue(np.all(np.diff(hourly.time.values) == time_step))
+
+        # original time steps are unchanged and the hours between are linear
+        hours = (original.time.values - original.time.values[0])/time_step
+        hourly_hours = (hourly.time.values - hourly.time.values[0])/time_step
+        expected = np.apply_along_axis(lambda values: np.interp(hourly_hours, hours, values),
+                                       0, original.values)
+        assert_almost_equal(hourly.sel(time=original.time).values, original.values)
+        assert_almost_equal(hourly.values, expected, decimal=4)
+
 if __name__ == '__main__':
     unittest.main()